@@ -4,11 +4,68 @@ UR4MORE Wellness - Quote Library Builder
 Complete script to build and manage the quote library
 """
 
+import fnmatch
+import hashlib
+import json
 import os
+import re
 import sys
+import time
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 
+# The in-process build imports the tools directly instead of starting an interpreter per step
+sys.path.insert(0, str(Path(__file__).resolve().parent / "tools"))
+
+BATCHES = [
+    # Universal themes (suitable for all users) - Increased counts
+    ("truth_001", "truth", 400),
+    ("responsibility_001", "responsibility", 400),
+    ("courage_001", "courage", 400),
+    ("humility_001", "humility", 400),
+    ("service_001", "service", 400),
+    ("wisdom_001", "wisdom", 400),
+    ("meaning_001", "meaning", 400),
+    ("perseverance_001", "perseverance", 400),
+    ("integrity_001", "integrity", 400),
+    ("compassion_001", "compassion", 400),
+    ("forgiveness_001", "forgiveness", 400),
+    ("patience_001", "patience", 400),
+    ("gratitude_001", "gratitude", 400),
+    ("peace_001", "peace", 400),
+    ("love_001", "love", 400),
+    
+    # Faith-specific themes - Expanded
+    ("hope_001", "hope", 500),
+    ("repentance_001", "repentance", 500),
+    ("prayer_001", "prayer", 500),
+    ("grace_001", "grace", 500),
+    ("salvation_001", "salvation", 500),
+    ("worship_001", "worship", 500),
+    ("faith_001", "faith", 500),
+    ("redemption_001", "redemption", 500),
+    ("sanctification_001", "sanctification", 500),
+    ("fellowship_001", "fellowship", 500),
+    ("testimony_001", "testimony", 500),
+    ("blessing_001", "blessing", 500),
+    
+    # Secular-specific themes - Expanded
+    ("mindfulness_001", "mindfulness", 500),
+    ("resilience_001", "resilience", 500),
+    ("growth_001", "growth", 500),
+    ("leadership_001", "leadership", 500),
+    ("motivation_001", "motivation", 500),
+    ("success_001", "success", 500),
+    ("creativity_001", "creativity", 500),
+    ("innovation_001", "innovation", 500),
+    ("productivity_001", "productivity", 500),
+    ("focus_001", "focus", 500),
+    ("discipline_001", "discipline", 500),
+    ("excellence_001", "excellence", 500),
+]
+
 def run_command(cmd, description):
     """Run a command and handle errors"""
     print(f"\n[BUILD] {description}...")
@@ -24,64 +81,18 @@ def run_command(cmd, description):
             print(f"Error: {e.stderr}")
         return False
 
-def build_quote_library():
-    """Build the complete quote library"""
+def build_quote_library_serial():
+    """Build the complete quote library, one subprocess per step and batch.
+    Batches use the same generator mode and seeds as the in-process build."""
     print("Building UR4MORE Quote Library")
     print("=" * 50)
     
     # Step 1: Generate quote batches
     print("\nStep 1: Generating Quote Batches")
     
-    batches = [
-        # Universal themes (suitable for all users) - Increased counts
-        ("truth_001", "truth", 400),
-        ("responsibility_001", "responsibility", 400),
-        ("courage_001", "courage", 400),
-        ("humility_001", "humility", 400),
-        ("service_001", "service", 400),
-        ("wisdom_001", "wisdom", 400),
-        ("meaning_001", "meaning", 400),
-        ("perseverance_001", "perseverance", 400),
-        ("integrity_001", "integrity", 400),
-        ("compassion_001", "compassion", 400),
-        ("forgiveness_001", "forgiveness", 400),
-        ("patience_001", "patience", 400),
-        ("gratitude_001", "gratitude", 400),
-        ("peace_001", "peace", 400),
-        ("love_001", "love", 400),
-        
-        # Faith-specific themes - Expanded
-        ("hope_001", "hope", 500),
-        ("repentance_001", "repentance", 500),
-        ("prayer_001", "prayer", 500),
-        ("grace_001", "grace", 500),
-        ("salvation_001", "salvation", 500),
-        ("worship_001", "worship", 500),
-        ("faith_001", "faith", 500),
-        ("redemption_001", "redemption", 500),
-        ("sanctification_001", "sanctification", 500),
-        ("fellowship_001", "fellowship", 500),
-        ("testimony_001", "testimony", 500),
-        ("blessing_001", "blessing", 500),
-        
-        # Secular-specific themes - Expanded
-        ("mindfulness_001", "mindfulness", 500),
-        ("resilience_001", "resilience", 500),
-        ("growth_001", "growth", 500),
-        ("leadership_001", "leadership", 500),
-        ("motivation_001", "motivation", 500),
-        ("success_001", "success", 500),
-        ("creativity_001", "creativity", 500),
-        ("innovation_001", "innovation", 500),
-        ("productivity_001", "productivity", 500),
-        ("focus_001", "focus", 500),
-        ("discipline_001", "discipline", 500),
-        ("excellence_001", "excellence", 500),
-    ]
-    
     batch_files = []
-    for batch_name, theme, count in batches:
-        cmd = f"py tools/quotes_batch_generator.py {batch_name} {theme} {count}"
+    for batch_name, theme, count in BATCHES:
+        cmd = f"py tools/quotes_batch_generator.py {batch_name} {theme} {count} --unique --per-template 1 --seed {theme}:{batch_name}"
         if run_command(cmd, f"Generating {theme} batch ({count} quotes)"):
             batch_files.append(f"assets/quotes/batches/2025-01_{theme}_{batch_name}.json")
     
@@ -102,9 +113,19 @@ def build_quote_library():
     if not run_command(merge_cmd, "Merging batches into master file"):
         return False
     
+    # Step 3b: Near-duplicates left after the exact-text dedupe, including overlap with the seed files
+    print("\nStep 3b: Near-Duplicate Report")
+    run_command("py tools/quotes_neardup.py report --json reports/quotes_neardup.json assets/quotes/quotes_faith_seed.json "
+                "assets/quotes/quotes_secular_seed.json assets/quotes/quotes.json", "Reporting near-duplicate quotes")
+    
     # Step 4: Create shards
     print("\nStep 4: Creating Shards")
-    if not run_command("py tools/quotes_shard.py assets/quotes/quotes.json assets/quotes/shards 1000", "Creating quote shards"):
+    if not run_command("py tools/quotes_shard.py assets/quotes/quotes.json assets/quotes/shards 64k", "Creating quote shards"):
+        return False
+    
+    # Step 4b: Precompute delta sync files for clients on older corpus versions
+    print("\nStep 4b: Building Delta Sync")
+    if not run_command("py tools/quotes_delta.py assets/quotes/quotes.json assets/quotes/sync", "Building quote deltas"):
         return False
     
     # Step 5: Final validation
@@ -122,10 +143,258 @@ def build_quote_library():
     print("Master file: assets/quotes/quotes.json")
     print("Shards created in: assets/quotes/shards/")
     print("Manifest updated: assets/quotes/manifest.json")
+    print("Delta sync index: assets/quotes/sync/index.json")
     print("\nReady to commit and push!")
     
     return True
 
+@contextmanager
+def stage(timings, name):
+    """Record the wall time of a build stage"""
+    print(f"\n[BUILD] {name}...")
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = time.perf_counter() - t0
+
+BUILD_STATE = ".quote_build_state.json"
+MASTER = "assets/quotes/quotes.json"
+SEED_FILES = ["assets/quotes/quotes_faith_seed.json", "assets/quotes/quotes_secular_seed.json"]
+
+def batch_path(batch):
+    batch_name, theme, _ = batch
+    return f"assets/quotes/batches/2025-01_{theme}_{batch_name}.json"
+
+def file_digest(path):
+    """sha256 of a file's bytes, None when it does not exist"""
+    h = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    except FileNotFoundError:
+        return None
+    return h.hexdigest()
+
+def _expand(paths):
+    """Paths with globs expanded to the files they match (sorted), so directory outputs such as
+    shards/* are tracked per file"""
+    out = []
+    for p in paths:
+        out.extend(sorted(str(x) for x in Path().glob(p) if x.is_file()) if any(c in p for c in "*?[") else [p])
+    return out
+
+class BuildGraph:
+    """Content-hash cache for build stages.
+
+    A stage is keyed by the sha256 of its input files plus its parameters, and records the
+    sha256 of every output file it wrote. It is skipped when the key matches the last
+    successful run and its outputs are still on disk unmodified. With dry_run nothing runs:
+    each stage that would rebuild is listed with the reason, and its outputs mark
+    downstream stages as pending."""
+
+    def __init__(self, state_path=BUILD_STATE, dry_run=False, force=False):
+        self.state_path = state_path
+        self.dry_run = dry_run
+        self.force = force
+        self.pending = []  # output patterns of stages that would rebuild (dry run)
+        self.plan = []
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.state = {}
+
+    def _key(self, inputs, params):
+        h = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode())
+        for path in _expand(inputs):
+            h.update(f"{path}\0{file_digest(path)}\0".encode())
+        return h.hexdigest()
+
+    def outdated(self, name, inputs, params=None):
+        """Why the stage must run, or "" when its cached result is still good"""
+        if self.force:
+            return "forced"
+        if self.dry_run:
+            for p in inputs:
+                if any(p == q or fnmatch.fnmatch(p, q) or fnmatch.fnmatch(q, p) for q in self.pending):
+                    return f"upstream output {p} would change"
+        rec = self.state.get(name)
+        if rec is None:
+            return "never built"
+        if rec["key"] != self._key(inputs, params):
+            return "inputs changed"
+        for path, digest in rec["outputs"].items():
+            if file_digest(path) != digest:
+                return f"output {path} missing or modified"
+        return ""
+
+    def record(self, name, inputs, params, outputs):
+        self.state[name] = {"key": self._key(inputs, params),
+                            "outputs": {p: file_digest(p) for p in _expand(outputs)}}
+        tmp = f"{self.state_path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.state_path)
+
+    def run(self, name, inputs, outputs, fn, params=None):
+        """Run fn() unless cached; fn returning False counts as a failure and is not recorded.
+        Returns True when the stage is up to date or succeeded."""
+        reason = self.outdated(name, inputs, params)
+        if not reason:
+            print(f"[SKIP] {name}: up to date")
+            return True
+        if self.dry_run:
+            self.plan.append((name, reason))
+            self.pending.extend(outputs)
+            return True
+        print(f"\n[BUILD] {name} ({reason})...")
+        if fn() is False:
+            return False
+        self.record(name, inputs, params, outputs)
+        return True
+
+def _generate_and_validate(batch, generate=True, validate=True):
+    """Pool task: write one batch file and/or validate it, so validation overlaps generation of the others.
+
+    Batches enumerate their templates once each (the merge keeps one quote per text anyway),
+    seeded by batch so rebuilds are reproducible; count is an upper bound."""
+    from quotes_batch_generator import DEFAULT_AUTHORS, generate_batch
+    from quotes_validate import validate_quotes_file
+    batch_name, theme, count = batch
+    t0 = time.perf_counter()
+    filename = batch_path(batch)
+    if generate:
+        filename = generate_batch(batch_name, theme, DEFAULT_AUTHORS, count,
+                                  unique=True, seed=f"{theme}:{batch_name}", per_template=1)
+    t1 = time.perf_counter()
+    ok = validate_quotes_file(filename) if validate else True
+    return filename, ok, t1 - t0, time.perf_counter() - t1
+
+def build_quote_library(workers=None, dry_run=False, force=False):
+    """Build the complete quote library in-process: batches are generated and validated on a
+    process pool (one task per batch, each written straight to its file), then merged,
+    sharded and indexed by calling the tools directly. Batches are generated in the same
+    mode (unique, one quote per template, seeded by batch) as the serial build, so both
+    write the same files.
+
+    Every stage goes through a BuildGraph, so only stages whose inputs changed since the
+    last build run; dry_run prints what would rebuild and why."""
+    from quotes_merge import merge_quotes
+    from quotes_neardup import report as neardup_report
+    from quotes_shard import shard_quotes
+    from quotes_delta import build_deltas
+    from quotes_validate import validate_quotes_file
+
+    workers = workers or os.cpu_count() or 1
+    graph = BuildGraph(dry_run=dry_run, force=force)
+    print(f"Building UR4MORE Quote Library ({len(BATCHES)} batches on {workers} processes)"
+          + (" - dry run" if dry_run else ""))
+    print("=" * 50)
+    timings = {}
+    started = time.perf_counter()
+
+    gen_src, val_src = "tools/quotes_batch_generator.py", "tools/quotes_validate.py"
+    gen_params = lambda batch: {"batch": batch, "unique": True, "per_template": 1}
+    todo = {}
+    for batch in BATCHES:
+        generate = bool(graph.outdated(f"batch {batch[0]}", [gen_src], gen_params(batch)))
+        validate = generate or bool(graph.outdated(f"validate {batch[0]}", [batch_path(batch), val_src]))
+        if dry_run:
+            graph.run(f"batch {batch[0]}", [gen_src], [batch_path(batch)], None, gen_params(batch))
+            graph.run(f"validate {batch[0]}", [batch_path(batch), val_src], [], None)
+        elif generate or validate:
+            todo[batch] = (generate, validate)
+        else:
+            print(f"[SKIP] batch {batch[0]}: up to date")
+
+    results = {}
+    task_time = {"generate": 0.0, "validate": 0.0}
+    if todo:
+        with stage(timings, f"Generating and validating {len(todo)} batches"):
+            with ProcessPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+                futures = {pool.submit(_generate_and_validate, batch, *todo[batch]): batch for batch in todo}
+                for future in as_completed(futures):
+                    batch = futures[future]
+                    try:
+                        filename, ok, gen_s, val_s = future.result()
+                    except Exception as e:
+                        print(f"[ERROR] Generating {batch[1]} batch failed: {e}")
+                        continue
+                    results[batch] = (filename, ok)
+                    task_time["generate"] += gen_s
+                    task_time["validate"] += val_s
+                    if todo[batch][0]:
+                        graph.record(f"batch {batch[0]}", [gen_src], gen_params(batch), [filename])
+                    if ok:
+                        graph.record(f"validate {batch[0]}", [filename, val_src], None, [])
+    if not all(ok for _, ok in results.values()):
+        print("[ERROR] Validation failed - stopping build")
+        return False
+    # BATCHES order, not completion order, so the merge keeps the serial build's precedence
+    batch_files = [batch_path(b) for b in BATCHES if dry_run or b in results or b not in todo]
+    if not batch_files:
+        print("[ERROR] No batches were generated successfully")
+        return False
+
+    def neardup_step():
+        Path("reports").mkdir(exist_ok=True)
+        neardup_report(SEED_FILES + [MASTER], json_out="reports/quotes_neardup.json")
+
+    def shards_step():
+        shard_quotes(MASTER, "assets/quotes/shards")
+        build_deltas(MASTER, "assets/quotes/sync")
+
+    def timed(name, fn):
+        def run():
+            t0 = time.perf_counter()
+            try:
+                return fn()
+            finally:
+                timings[name] = time.perf_counter() - t0
+        return run
+
+    steps = [
+        ("merge", batch_files + ["tools/quotes_merge.py"], [MASTER],
+         lambda: merge_quotes(batch_files, MASTER)),
+        ("near-duplicate report", SEED_FILES + [MASTER, "tools/quotes_neardup.py"], ["reports/quotes_neardup.json"],
+         neardup_step),
+        # one stage: the delta build writes corpus_version into the manifest the sharder just wrote
+        ("shards and delta sync", [MASTER, "tools/quotes_shard.py", "tools/quotes_delta.py"],
+         ["assets/quotes/shards/*", "assets/quotes/manifest.json", "assets/quotes/sync/**/*"],
+         shards_step),
+        ("validate master", [MASTER, val_src], [],
+         lambda: validate_quotes_file(MASTER)),
+        ("pubspec.yaml", ["assets/quotes/shards/quotes_*.json"], [],
+         update_pubspec),
+    ]
+    for name, inputs, outputs, fn in steps:
+        if not graph.run(name, inputs, outputs, timed(name, fn)):
+            print(f"[ERROR] {name} failed - stopping build")
+            return False
+
+    if dry_run:
+        print("\nDry run: stages that would rebuild")
+        for name, reason in graph.plan:
+            print(f"  {name:<36} {reason}")
+        if not graph.plan:
+            print("  nothing - the library is up to date")
+        return True
+
+    total = time.perf_counter() - started
+    print("\nQuote Library Build Complete!")
+    print("=" * 50)
+    print(f"Rebuilt {len(results)} of {len(BATCHES)} batches")
+    print("Stage timings (wall):")
+    for name, secs in timings.items():
+        print(f"  {name:<36} {secs:8.2f}s")
+    if results:
+        print(f"  {'  of which generation (CPU, summed)':<36} {task_time['generate']:8.2f}s")
+        print(f"  {'  of which validation (CPU, summed)':<36} {task_time['validate']:8.2f}s")
+    print(f"  {'Total':<36} {total:8.2f}s")
+    return True
+
 def update_pubspec():
     """Update pubspec.yaml with new shard files"""
     pubspec_path = "pubspec.yaml"
@@ -143,16 +412,18 @@ def update_pubspec():
     if shard_dir.exists():
         shard_files = [f"    - {f}" for f in sorted(shard_dir.glob("quotes_*.json"))]
         
-        # Replace the quotes section
-        start_marker = "    - assets/quotes/manifest.json"
-        end_marker = "    - assets/quotes/shards/quotes_000.json"
+        # Replace the manifest line and every shard line after it (shard names change with the facets)
+        section = re.search(r"    - assets/quotes/manifest\.json(\n    - assets/quotes/shards/[^\n]*)*", content)
         
-        if start_marker in content and end_marker in content:
-            start_idx = content.find(start_marker)
-            end_idx = content.find(end_marker) + len(end_marker)
+        if section:
+            start_idx, end_idx = section.span()
             
-            new_quotes_section = f"    - assets/quotes/manifest.json\n" + "\n".join(shard_files)
-            content = content[:start_idx] + new_quotes_section + content[end_idx:]
+            new_quotes_section = "    - assets/quotes/manifest.json\n" + "\n".join(shard_files)
+            updated = content[:start_idx] + new_quotes_section + content[end_idx:]
+            if updated == content:
+                print("[SKIP] pubspec.yaml already lists the current shards")
+                return
+            content = updated
             
             with open(pubspec_path, 'w') as f:
                 f.write(content)
@@ -165,8 +436,10 @@ def quick_build():
     """Quick build with existing tools"""
     print("Quick Build - Using existing infrastructure")
     
-    # Just validate and shard existing files
-    if run_command("py tools/quotes_validate.py assets/quotes/shards/quotes_000.json", "Validating existing shard"):
+    # Just validate the shards the manifest lists
+    with open("assets/quotes/manifest.json", 'r', encoding='utf-8') as f:
+        shard_files = json.load(f)["files"]
+    if run_command("py tools/quotes_validate.py " + " ".join(shard_files), "Validating existing shards"):
         print("[SUCCESS] Existing quote system is valid")
         return True
     return False
@@ -174,7 +447,10 @@ def quick_build():
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "quick":
         success = quick_build()
+    elif len(sys.argv) > 1 and sys.argv[1] == "serial":
+        success = build_quote_library_serial()
     else:
-        success = build_quote_library()
+        workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else None
+        success = build_quote_library(workers, dry_run="--dry-run" in sys.argv, force="--force" in sys.argv)
     
     sys.exit(0 if success else 1)
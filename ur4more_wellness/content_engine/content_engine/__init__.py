@@ -0,0 +1,15 @@
+"""
+Content engine shared by the FastAPI (gateway/) and Flask (gateway_flask/) gateways:
+local corpus, filters, ranking, faith gating, cache tiers and provider fan-out.
+The gateways keep only their web adapters, so hot-path changes land in both at once.
+"""
+from content_engine.corpus import CORPUS_STAMP, KJV_DB, LOCAL_QUOTES
+from content_engine.filters import contains_profanity, filter_quote, filter_scripture, quote_allowed, scripture_allowed
+from content_engine.gating import faith_allowed
+from content_engine.rank import rank, rank_quotes
+
+__all__ = [
+    "CORPUS_STAMP", "KJV_DB", "LOCAL_QUOTES",
+    "contains_profanity", "filter_quote", "filter_scripture", "quote_allowed", "scripture_allowed",
+    "faith_allowed", "rank", "rank_quotes",
+]
@@ -0,0 +1,47 @@
+import time
+from typing import Callable
+
+class CircuitBreaker:
+    """Closed -> open after `failures` consecutive errors; after `reset_after` seconds one
+    trial call is let through (half-open) and its outcome closes or re-opens the circuit."""
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failures: int = 5, reset_after: float = 10.0, clock: Callable[[], float] = time.monotonic):
+        self.failures = failures
+        self.reset_after = reset_after
+        self.clock = clock
+        self.state = self.CLOSED
+        self.errors = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+
+    def allow(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and self.clock() - self.opened_at >= self.reset_after:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return True
+        return False
+
+    def success(self) -> bool:
+        """Record a successful call; True when this closed a previously open circuit"""
+        recovered = self.state != self.CLOSED
+        self.state = self.CLOSED
+        self.errors = 0
+        self.trial_in_flight = False
+        return recovered
+
+    def abandon(self):
+        """An allowed call ended with no outcome (cancelled, or an error that says nothing
+        about the dependency): the next call may be the half-open trial"""
+        self.trial_in_flight = False
+
+    def failure(self):
+        self.errors += 1
+        self.trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.errors >= self.failures:
+            self.state = self.OPEN
+            self.opened_at = self.clock()
@@ -0,0 +1,41 @@
+"""
+Response content-coding shared by both gateways: Accept-Encoding negotiation (br when
+brotli is installed, else gzip) and deterministic compression, so identical bodies give
+identical bytes and a compressed variant can be cached by content hash.
+"""
+import gzip
+from typing import Optional
+try:
+    import brotli
+except Exception:
+    brotli = None
+
+# Preferred order when the client accepts several codings equally
+PREFERRED = ["br", "gzip"] if brotli else ["gzip"]
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the best content-coding we support from an Accept-Encoding header"""
+    if not accept_encoding:
+        return None
+    q = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try: weight = float(params[2:])
+            except ValueError: weight = 0.0
+        q[name] = weight
+    best, best_q = None, 0.0
+    for enc in PREFERRED:
+        w = q.get(enc, q.get("*", 0.0))
+        if w > best_q:
+            best, best_q = enc, w
+    return best
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=8)
+    # mtime=0 keeps the output byte-identical for identical input
+    return gzip.compress(data, compresslevel=6, mtime=0)
@@ -0,0 +1,332 @@
+"""
+Local content shipped with both gateways: public-domain quotes and KJV passages by theme.
+
+Plain dicts in the gateways' response shapes; the FastAPI gateway wraps them in its
+pydantic models once at import, the Flask gateway serves them as they are.
+"""
+import hashlib, json
+from typing import Any, Dict, List
+
+LOCAL_QUOTES: List[Dict[str, Any]] = [
+    {"id": "pd_1", "text": "He that is slow to wrath is of great understanding.", "author": "Proverbs 14:29 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "temperance", "wisdom"]},
+    {"id": "pd_2", "text": "Trust in the Lord with all thine heart; and lean not unto thine own understanding.", "author": "Proverbs 3:5 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "trust", "wisdom"]},
+    {"id": "pd_3", "text": "I can do all things through Christ which strengtheneth me.", "author": "Philippians 4:13 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "strength", "motivation"]},
+    {"id": "pd_4", "text": "The fear of the Lord is the beginning of wisdom.", "author": "Proverbs 9:10 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "wisdom", "growth"]},
+    {"id": "pd_5", "text": "Be still, and know that I am God.", "author": "Psalm 46:10 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "peace", "meditation"]},
+    {"id": "pd_6", "text": "For I know the thoughts that I think toward you, saith the Lord, thoughts of peace, and not of evil.", "author": "Jeremiah 29:11 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "hope", "peace"]},
+    {"id": "pd_7", "text": "And we know that all things work together for good to them that love God.", "author": "Romans 8:28 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "hope", "strength"]},
+    {"id": "pd_21", "text": "For God so loved the world, that he gave his only begotten Son.", "author": "John 3:16 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "love", "salvation"]},
+    {"id": "pd_22", "text": "The Lord is my shepherd; I shall not want.", "author": "Psalm 23:1 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "peace", "provision"]},
+    {"id": "pd_23", "text": "Come unto me, all ye that labour and are heavy laden, and I will give you rest.", "author": "Matthew 11:28 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "rest", "comfort"]},
+    {"id": "pd_24", "text": "But they that wait upon the Lord shall renew their strength.", "author": "Isaiah 40:31 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "strength", "patience"]},
+    {"id": "pd_25", "text": "Love your enemies, bless them that curse you.", "author": "Matthew 5:44 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "love", "forgiveness"]},
+    {"id": "pd_26", "text": "Seek ye first the kingdom of God, and his righteousness.", "author": "Matthew 6:33 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "priority", "kingdom"]},
+    {"id": "pd_27", "text": "Greater love hath no man than this, that a man lay down his life for his friends.", "author": "John 15:13 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "love", "sacrifice"]},
+    {"id": "pd_28", "text": "In the beginning was the Word, and the Word was with God.", "author": "John 1:1 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "creation", "word"]},
+    {"id": "pd_29", "text": "For by grace are ye saved through faith; and that not of yourselves.", "author": "Ephesians 2:8 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "grace", "salvation"]},
+    {"id": "pd_30", "text": "I am the way, the truth, and the life.", "author": "John 14:6 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "truth", "life"]},
+    {"id": "pd_31", "text": "Let not your heart be troubled: ye believe in God, believe also in me.", "author": "John 14:1 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "peace", "comfort"]},
+    {"id": "pd_32", "text": "For where two or three are gathered together in my name, there am I in the midst of them.", "author": "Matthew 18:20 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "fellowship", "presence"]},
+    {"id": "pd_33", "text": "But the fruit of the Spirit is love, joy, peace, longsuffering, gentleness, goodness, faith.", "author": "Galatians 5:22 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "fruit", "spirit"]},
+    {"id": "pd_34", "text": "For we walk by faith, not by sight.", "author": "2 Corinthians 5:7 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "walk", "sight"]},
+    {"id": "pd_35", "text": "The Lord is my light and my salvation; whom shall I fear?", "author": "Psalm 27:1 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "light", "salvation"]},
+    {"id": "pd_36", "text": "Cast all your care upon him; for he careth for you.", "author": "1 Peter 5:7 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "care", "burden"]},
+    {"id": "pd_37", "text": "Jesus Christ the same yesterday, and to day, and for ever.", "author": "Hebrews 13:8 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "consistency", "eternal"]},
+    {"id": "pd_38", "text": "For I am persuaded, that neither death, nor life, nor angels, nor principalities, nor powers, nor things present, nor things to come, nor height, nor depth, nor any other creature, shall be able to separate us from the love of God.", "author": "Romans 8:38-39 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "love", "security"]},
+    {"id": "pd_39", "text": "But as for me and my house, we will serve the Lord.", "author": "Joshua 24:15 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "service", "commitment"]},
+    {"id": "pd_40", "text": "The Lord is good, a strong hold in the day of trouble.", "author": "Nahum 1:7 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "goodness", "strength"]},
+    {"id": "pd_8", "text": "What we achieve inwardly will change outer reality.", "author": "Plutarch (PD)", "license": "public_domain", "source": "local", "tags": ["secular", "temperance", "growth"]},
+    {"id": "pd_9", "text": "Patience is bitter, but its fruit is sweet.", "author": "Aristotle (PD)", "license": "public_domain", "source": "local", "tags": ["secular", "temperance", "wisdom"]},
+    {"id": "pd_10", "text": "The only way to do great work is to love what you do.", "author": "Steve Jobs", "license": "public_domain", "source": "local", "tags": ["secular", "motivation", "growth"]},
+    {"id": "pd_11", "text": "Success is not final, failure is not fatal: it is the courage to continue that counts.", "author": "Winston Churchill", "license": "public_domain", "source": "local", "tags": ["secular", "strength", "motivation"]},
+    {"id": "pd_12", "text": "The future belongs to those who believe in the beauty of their dreams.", "author": "Eleanor Roosevelt", "license": "public_domain", "source": "local", "tags": ["secular", "hope", "motivation"]},
+    {"id": "pd_13", "text": "In the middle of difficulty lies opportunity.", "author": "Albert Einstein", "license": "public_domain", "source": "local", "tags": ["secular", "wisdom", "growth"]},
+    {"id": "pd_14", "text": "Peace cannot be kept by force; it can only be achieved by understanding.", "author": "Albert Einstein", "license": "public_domain", "source": "local", "tags": ["secular", "peace", "wisdom"]},
+    {"id": "pd_15", "text": "The mind is everything. What you think you become.", "author": "Buddha", "license": "public_domain", "source": "local", "tags": ["secular", "mindfulness", "growth"]},
+    {"id": "pd_16", "text": "Happiness is not something ready made. It comes from your own actions.", "author": "Dalai Lama", "license": "public_domain", "source": "local", "tags": ["secular", "happiness", "wisdom"]},
+    {"id": "pd_17", "text": "The only impossible journey is the one you never begin.", "author": "Tony Robbins", "license": "public_domain", "source": "local", "tags": ["secular", "motivation", "strength"]},
+    {"id": "pd_18", "text": "Believe you can and you're halfway there.", "author": "Theodore Roosevelt", "license": "public_domain", "source": "local", "tags": ["secular", "motivation", "strength"]},
+    {"id": "pd_19", "text": "Life is what happens to you while you're busy making other plans.", "author": "John Lennon", "license": "public_domain", "source": "local", "tags": ["secular", "wisdom", "mindfulness"]},
+    {"id": "pd_20", "text": "The way to get started is to quit talking and begin doing.", "author": "Walt Disney", "license": "public_domain", "source": "local", "tags": ["secular", "motivation", "growth"]},
+    {"id": "faith_4", "text": "For I know the thoughts that I think toward you, saith the Lord, thoughts of peace, and not of evil, to give you an expected end.", "author": "Jeremiah 29:11 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "hope"]},
+    {"id": "faith_5", "text": "Be still, and know that I am God: I will be exalted among the heathen, I will be exalted in the earth.", "author": "Psalm 46:10 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "peace"]},
+    {"id": "faith_6", "text": "And we know that all things work together for good to them that love God, to them who are the called according to his purpose.", "author": "Romans 8:28 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "purpose"]},
+    {"id": "faith_7", "text": "But they that wait upon the Lord shall renew their strength; they shall mount up with wings as eagles; they shall run, and not be weary; and they shall walk, and not faint.", "author": "Isaiah 40:31 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "endurance"]},
+    {"id": "faith_8", "text": "For God so loved the world, that he gave his only begotten Son, that whosoever believeth in him should not perish, but have everlasting life.", "author": "John 3:16 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "love"]},
+    {"id": "faith_13", "text": "But seek ye first the kingdom of God, and his righteousness; and all these things shall be added unto you.", "author": "Matthew 6:33 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "priority"]},
+    {"id": "faith_14", "text": "For where your treasure is, there will your heart be also.", "author": "Matthew 6:21 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "values"]},
+    {"id": "faith_15", "text": "And he said unto me, My grace is sufficient for thee: for my strength is made perfect in weakness.", "author": "2 Corinthians 12:9 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "grace"]},
+    {"id": "faith_16", "text": "Therefore if any man be in Christ, he is a new creature: old things are passed away; behold, all things are become new.", "author": "2 Corinthians 5:17 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "transformation"]},
+    {"id": "faith_17", "text": "For by grace are ye saved through faith; and that not of yourselves: it is the gift of God.", "author": "Ephesians 2:8 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "salvation"]},
+    {"id": "faith_18", "text": "And we have known and believed the love that God hath to us. God is love; and he that dwelleth in love dwelleth in God, and God in him.", "author": "1 John 4:16 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "love"]},
+    {"id": "faith_19", "text": "But the fruit of the Spirit is love, joy, peace, longsuffering, gentleness, goodness, faith, meekness, temperance.", "author": "Galatians 5:22-23 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "fruit"]},
+    {"id": "faith_21", "text": "And let us not be weary in well doing: for in due season we shall reap, if we faint not.", "author": "Galatians 6:9 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "perseverance"]},
+    {"id": "faith_22", "text": "But they that will be rich fall into temptation and a snare, and into many foolish and hurtful lusts, which drown men in destruction and perdition.", "author": "1 Timothy 6:9 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "contentment"]},
+    {"id": "faith_23", "text": "For the love of money is the root of all evil: which while some coveted after, they have erred from the faith, and pierced themselves through with many sorrows.", "author": "1 Timothy 6:10 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "money"]},
+    {"id": "faith_24", "text": "But godliness with contentment is great gain.", "author": "1 Timothy 6:6 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "contentment"]},
+    {"id": "faith_25", "text": "And whatsoever ye do, do it heartily, as to the Lord, and not unto men.", "author": "Colossians 3:23 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "excellence"]},
+    {"id": "faith_26", "text": "Rejoice evermore. Pray without ceasing. In every thing give thanks: for this is the will of God in Christ Jesus concerning you.", "author": "1 Thessalonians 5:16-18 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "gratitude"]},
+    {"id": "faith_27", "text": "And be not conformed to this world: but be ye transformed by the renewing of your mind, that ye may prove what is that good, and acceptable, and perfect, will of God.", "author": "Romans 12:2 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "transformation"]},
+    {"id": "faith_29", "text": "Now faith is the substance of things hoped for, the evidence of things not seen.", "author": "Hebrews 11:1 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "definition"]},
+    {"id": "faith_30", "text": "Jesus saith unto him, I am the way, the truth, and the life: no man cometh unto the Father, but by me.", "author": "John 14:6 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "way"]},
+    {"id": "faith_31", "text": "And Jesus said unto them, I am the bread of life: he that cometh to me shall never hunger; and he that believeth on me shall never thirst.", "author": "John 6:35 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "satisfaction"]},
+    {"id": "faith_32", "text": "Then spake Jesus again unto them, saying, I am the light of the world: he that followeth me shall not walk in darkness, but shall have the light of life.", "author": "John 8:12 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "light"]},
+    {"id": "faith_33", "text": "I am the resurrection, and the life: he that believeth in me, though he were dead, yet shall he live.", "author": "John 11:25 (KJV)", "license": "public_domain", "source": "local", "tags": ["faith", "life"]},
+    {"id": "secular_3", "text": "He that is slow to wrath is of great understanding.", "author": "Proverbs (KJV)", "license": "public_domain", "source": "local", "tags": ["secular", "temperance"]},
+    {"id": "wisdom_1", "text": "The fear of the Lord is the beginning of wisdom, and knowledge of the Holy One is understanding.", "author": "Proverbs 9:10 (KJV)", "license": "public_domain", "source": "local", "tags": ["wisdom", "faith"]},
+    {"id": "wisdom_3", "text": "For the Lord giveth wisdom: out of his mouth cometh knowledge and understanding.", "author": "Proverbs 2:6 (KJV)", "license": "public_domain", "source": "local", "tags": ["wisdom", "knowledge"]},
+    {"id": "wisdom_4", "text": "The wise in heart are called discerning, and gracious words promote instruction.", "author": "Proverbs 16:21 (KJV)", "license": "public_domain", "source": "local", "tags": ["wisdom", "discernment"]},
+    {"id": "wisdom_5", "text": "How much better to get wisdom than gold, to get insight rather than silver!", "author": "Proverbs 16:16 (KJV)", "license": "public_domain", "source": "local", "tags": ["wisdom", "value"]},
+    {"id": "wisdom_6", "text": "The beginning of wisdom is this: Get wisdom. Though it cost all you have, get understanding.", "author": "Proverbs 4:7 (KJV)", "license": "public_domain", "source": "local", "tags": ["wisdom", "understanding"]},
+    {"id": "wisdom_7", "text": "A wise man will hear, and will increase learning; and a man of understanding shall attain unto wise counsels.", "author": "Proverbs 1:5 (KJV)", "license": "public_domain", "source": "local", "tags": ["wisdom", "learning"]},
+    {"id": "wisdom_8", "text": "The wise store up knowledge, but the mouth of a fool invites ruin.", "author": "Proverbs 10:14 (KJV)", "license": "public_domain", "source": "local", "tags": ["wisdom", "knowledge"]},
+    {"id": "wisdom_9", "text": "Whoever walks with the wise becomes wise, but the companion of fools will suffer harm.", "author": "Proverbs 13:20 (KJV)", "license": "public_domain", "source": "local", "tags": ["wisdom", "fellowship"]},
+    {"id": "wisdom_10", "text": "The wise woman builds her house, but with her own hands the foolish one tears hers down.", "author": "Proverbs 14:1 (KJV)", "license": "public_domain", "source": "local", "tags": ["wisdom", "building"]},
+]
+
+KJV_DB: Dict[str, List[Dict[str, Any]]] = {
+    "gluttony": [
+        {
+            "ref": "1 Corinthians 9:24–27 (KJV)",
+            "verses": [
+                {"v": 24, "t": "Know ye not that they which run in a race run all, but one receiveth the prize? So run, that ye may obtain."},
+                {"v": 25, "t": "And every man that striveth for the mastery is temperate in all things. Now they do it to obtain a corruptible crown; but we an incorruptible."},
+                {"v": 26, "t": "I therefore so run, not as uncertainly; so fight I, not as one that beateth the air:"},
+                {"v": 27, "t": "But I keep under my body, and bring it into subjection: lest that by any means, when I have preached to others, I myself should be a castaway."},
+            ],
+            "actNow": "Plate plan → pray → eat with temperance; log one small victory.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "pride": [
+        {
+            "ref": "Proverbs 16:18 (KJV)",
+            "verses": [
+                {"v": 18, "t": "Pride goeth before destruction, and an haughty spirit before a fall."},
+            ],
+            "actNow": "Humble yourself before God and others today.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "envy": [
+        {
+            "ref": "Proverbs 14:30 (KJV)",
+            "verses": [
+                {"v": 30, "t": "A sound heart is the life of the flesh: but envy the rottenness of the bones."},
+            ],
+            "actNow": "Count your blessings and rejoice with others.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "lust": [
+        {
+            "ref": "Matthew 5:28 (KJV)",
+            "verses": [
+                {"v": 28, "t": "But I say unto you, That whosoever looketh on a woman to lust after her hath committed adultery with her already in his heart."},
+            ],
+            "actNow": "Guard your heart and mind with God's truth.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "greed": [
+        {
+            "ref": "1 Timothy 6:10 (KJV)",
+            "verses": [
+                {"v": 10, "t": "For the love of money is the root of all evil: which while some coveted after, they have erred from the faith, and pierced themselves through with many sorrows."},
+            ],
+            "actNow": "Practice generosity and contentment today.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "anger": [
+        {
+            "ref": "Ephesians 4:26-27 (KJV)",
+            "verses": [
+                {"v": 26, "t": "Be ye angry, and sin not: let not the sun go down upon your wrath:"},
+                {"v": 27, "t": "Neither give place to the devil."},
+            ],
+            "actNow": "Resolve conflicts quickly and forgive others.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "sloth": [
+        {
+            "ref": "Proverbs 6:6-8 (KJV)",
+            "verses": [
+                {"v": 6, "t": "Go to the ant, thou sluggard; consider her ways, and be wise:"},
+                {"v": 7, "t": "Which having no guide, overseer, or ruler,"},
+                {"v": 8, "t": "Provideth her meat in the summer, and gathereth her food in the harvest."},
+            ],
+            "actNow": "Take one productive action toward your goals.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "feeling_lost": [
+        {
+            "ref": "Jeremiah 29:11 (KJV)",
+            "verses": [
+                {"v": 11, "t": "For I know the thoughts that I think toward you, saith the Lord, thoughts of peace, and not of evil, to give you an expected end."},
+            ],
+            "actNow": "Trust God's plan and take one step forward in faith.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "strength": [
+        {
+            "ref": "Philippians 4:13 (KJV)",
+            "verses": [
+                {"v": 13, "t": "I can do all things through Christ which strengtheneth me."},
+            ],
+            "actNow": "Draw strength from Christ for today's challenges.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "peace": [
+        {
+            "ref": "John 14:27 (KJV)",
+            "verses": [
+                {"v": 27, "t": "Peace I leave with you, my peace I give unto you: not as the world giveth, give I unto you. Let not your heart be troubled, neither let it be afraid."},
+            ],
+            "actNow": "Rest in God's peace and cast your cares on Him.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "hope": [
+        {
+            "ref": "Romans 15:13 (KJV)",
+            "verses": [
+                {"v": 13, "t": "Now the God of hope fill you with all joy and peace in believing, that ye may abound in hope, through the power of the Holy Ghost."},
+            ],
+            "actNow": "Let God fill you with hope and joy today.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "love": [
+        {
+            "ref": "1 Corinthians 13:4-7 (KJV)",
+            "verses": [
+                {"v": 4, "t": "Charity suffereth long, and is kind; charity envieth not; charity vaunteth not itself, is not puffed up,"},
+                {"v": 5, "t": "Doth not behave itself unseemly, seeketh not her own, is not easily provoked, thinketh no evil;"},
+                {"v": 6, "t": "Rejoiceth not in iniquity, but rejoiceth in the truth;"},
+                {"v": 7, "t": "Beareth all things, believeth all things, hopeth all things, endureth all things."},
+            ],
+            "actNow": "Show God's love to someone today.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "wisdom": [
+        {
+            "ref": "Proverbs 9:10 (KJV)",
+            "verses": [
+                {"v": 10, "t": "The fear of the Lord is the beginning of wisdom: and the knowledge of the holy is understanding."},
+            ],
+            "actNow": "Seek God's wisdom in your decisions today.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "faith": [
+        {
+            "ref": "Hebrews 11:1 (KJV)",
+            "verses": [
+                {"v": 1, "t": "Now faith is the substance of things hoped for, the evidence of things not seen."},
+            ],
+            "actNow": "Step out in faith and trust God's promises.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "gratitude": [
+        {
+            "ref": "1 Thessalonians 5:18 (KJV)",
+            "verses": [
+                {"v": 18, "t": "In every thing give thanks: for this is the will of God in Christ Jesus concerning you."},
+            ],
+            "actNow": "Count your blessings and thank God for them.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "forgiveness": [
+        {
+            "ref": "Ephesians 4:32 (KJV)",
+            "verses": [
+                {"v": 32, "t": "And be ye kind one to another, tenderhearted, forgiving one another, even as God for Christ's sake hath forgiven you."},
+            ],
+            "actNow": "Forgive someone who has hurt you today.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "perseverance": [
+        {
+            "ref": "Galatians 6:9 (KJV)",
+            "verses": [
+                {"v": 9, "t": "And let us not be weary in well doing: for in due season we shall reap, if we faint not."},
+            ],
+            "actNow": "Keep doing good even when it's hard.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "humility": [
+        {
+            "ref": "Philippians 2:3-4 (KJV)",
+            "verses": [
+                {"v": 3, "t": "Let nothing be done through strife or vainglory; but in lowliness of mind let each esteem other better than themselves."},
+                {"v": 4, "t": "Look not every man on his own things, but every man also on the things of others."},
+            ],
+            "actNow": "Put others' needs before your own today.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "purpose": [
+        {
+            "ref": "Jeremiah 1:5 (KJV)",
+            "verses": [
+                {"v": 5, "t": "Before I formed thee in the belly I knew thee; and before thou camest forth out of the womb I sanctified thee, and I ordained thee a prophet unto the nations."},
+            ],
+            "actNow": "Seek God's purpose for your life today.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+    "rest": [
+        {
+            "ref": "Matthew 11:28-30 (KJV)",
+            "verses": [
+                {"v": 28, "t": "Come unto me, all ye that labour and are heavy laden, and I will give you rest."},
+                {"v": 29, "t": "Take my yoke upon you, and learn of me; for I am meek and lowly in heart: and ye shall find rest unto your souls."},
+                {"v": 30, "t": "For my yoke is easy, and my burden is light."},
+            ],
+            "actNow": "Find rest in Jesus and His gentle ways.",
+            "license": "public_domain",
+            "source": "kjv.local",
+        },
+    ],
+}
+
+# Release stamp of the corpus above, the manifest updatedAt unless CORPUS_UPDATED_AT overrides it.
+# Committed with the content so every host, checkout and image reports the same value (a file
+# mtime would change the manifest body, and so its ETag, per node and deploy). Edit the corpus,
+# then bump CORPUS_STAMP and set CORPUS_DIGEST to corpus_digest(): tests/test_corpus.py checks the pair.
+CORPUS_STAMP = "2026-10-19T15:19:45+00:00"
+CORPUS_DIGEST = "16a27411168226b4"
+
+def corpus_digest() -> str:
+    """Content hash of LOCAL_QUOTES and KJV_DB"""
+    body = json.dumps({"quotes": LOCAL_QUOTES, "scripture": KJV_DB}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()[:16]
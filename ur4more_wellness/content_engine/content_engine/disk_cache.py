@@ -0,0 +1,130 @@
+import os, sqlite3, threading, time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple, Union
+
+Value = Union[str, bytes]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key      TEXT PRIMARY KEY,
+    value    BLOB NOT NULL,
+    text     INTEGER NOT NULL,
+    expires  REAL NOT NULL,
+    size     INTEGER NOT NULL,
+    hits     INTEGER NOT NULL DEFAULT 0,
+    accessed REAL NOT NULL
+)"""
+
+class DiskCache:
+    """L3 cache tier: an SQLite (WAL) file that outlives the process, so a restart or deploy
+    starts warm instead of sending every request to the providers.
+
+    Entries carry an absolute expiry; the file is kept under max_mb by compaction (expired
+    rows first, then the least-hit, least-recently-used ones). Hits (touch) are counted in memory
+    and flushed on compaction, on snapshot and once max_pending_hits keys are pending;
+    hottest() feeds the startup reload. set() compacts every compact_every writes, so callers
+    that must not block (the FastAPI gateway) run set and touch on a writer thread. Several
+    worker processes can share one file (WAL readers do not block the writer)."""
+
+    def __init__(self, path: str, max_mb: int = 256, compact_every: int = 500, max_pending_hits: int = 10000):
+        self.path = path
+        self.max_bytes = max_mb * 1024 * 1024
+        self.compact_every = compact_every
+        self.max_pending_hits = max_pending_hits
+        self.lock = threading.Lock()
+        self.pending_hits: Counter = Counter()
+        self.writes = 0
+        self._db: Optional[sqlite3.Connection] = None
+        self._pid = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.db.execute(_SCHEMA)
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        # One connection per process: SQLite handles must not cross fork() (pre-fork servers import before forking)
+        if self._db is None or self._pid != os.getpid():
+            self._db = sqlite3.connect(self.path, timeout=1.0, isolation_level=None, check_same_thread=False)
+            self._db.execute("PRAGMA auto_vacuum=INCREMENTAL")  # only takes effect on a new file
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")  # a crash can lose the last writes, never corrupt the file
+            self._pid = os.getpid()
+        return self._db
+
+    def get(self, k: str) -> Optional[Tuple[Value, float]]:
+        """(value, expires_at) for a live entry"""
+        with self.lock:
+            row = self.db.execute("SELECT value, text, expires FROM entries WHERE key = ?", (k,)).fetchone()
+            if row is None:
+                return None
+            value, text, exp = row
+            if exp < time.time():
+                return None  # removed by the next compaction
+        return (value.decode("utf-8") if text else bytes(value), exp)
+
+    def touch(self, k: str):
+        """Count a hit on k from any tier; the counts decide what hottest() reloads"""
+        self.pending_hits[k] += 1
+        if len(self.pending_hits) >= self.max_pending_hits:
+            self._flush_hits()
+
+    def set(self, k: str, v: Value, expires_at: float):
+        data = v.encode("utf-8") if isinstance(v, str) else v
+        with self.lock:
+            self.db.execute("INSERT OR REPLACE INTO entries (key, value, text, expires, size, hits, accessed) "
+                            "VALUES (?, ?, ?, ?, ?, COALESCE((SELECT hits FROM entries WHERE key = ?), 0), ?)",
+                            (k, data, isinstance(v, str), expires_at, len(k) + len(data), k, time.time()))
+            self.writes += 1
+            due = self.writes % self.compact_every == 0
+        if due:
+            self.compact()
+
+    def delete(self, k: str):
+        with self.lock:
+            self.db.execute("DELETE FROM entries WHERE key = ?", (k,))
+
+    def hottest(self, n: int) -> List[Tuple[str, Value, float]]:
+        """Up to n live entries, most hit first"""
+        self._flush_hits()
+        with self.lock:
+            rows = self.db.execute("SELECT key, value, text, expires FROM entries WHERE expires > ? "
+                                   "ORDER BY hits DESC, accessed DESC LIMIT ?", (time.time(), n)).fetchall()
+        return [(k, v.decode("utf-8") if text else bytes(v), exp) for k, v, text, exp in rows]
+
+    def _flush_hits(self):
+        with self.lock:
+            hits, self.pending_hits = self.pending_hits, Counter()
+            if hits:
+                now = time.time()
+                self.db.executemany("UPDATE entries SET hits = hits + ?, accessed = ? WHERE key = ?",
+                                    [(n, now, k) for k, n in hits.items()])
+
+    def compact(self) -> Dict[str, int]:
+        """Drop expired entries, then evict cold ones until the file is under 90% of max_mb"""
+        self._flush_hits()
+        with self.lock:
+            expired = self.db.execute("DELETE FROM entries WHERE expires < ?", (time.time(),)).rowcount
+            total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            evicted = []
+            if total > self.max_bytes:
+                excess = total - int(self.max_bytes * 0.9)
+                for k, size in self.db.execute("SELECT key, size FROM entries ORDER BY hits, accessed").fetchall():
+                    if excess <= 0:
+                        break
+                    evicted.append((k,))
+                    excess -= size
+                self.db.executemany("DELETE FROM entries WHERE key = ?", evicted)
+            self.db.execute("PRAGMA incremental_vacuum")
+        return {"expired": expired, "evicted": len(evicted)}
+
+    def snapshot(self) -> Dict[str, int]:
+        """Shutdown: persist hit counts, compact and fold the WAL into the main file"""
+        stats = self.compact()
+        with self.lock:
+            self.db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            stats["entries"] = self.db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return stats
+
+    def close(self):
+        if self._db is not None and self._pid == os.getpid():
+            self._db.close()
+        self._db = None
@@ -0,0 +1,61 @@
+"""
+Provider fan-out under one deadline: every provider is called at once and the caller
+waits for the slowest of them at most until the deadline, never for their sum.
+
+Thread futures serve the Flask gateway (requests + ThreadPoolExecutor), coroutines the
+FastAPI gateway (httpx). Providers are passed as (name, future/coroutine) in priority order.
+"""
+import asyncio, time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Awaitable, List, Tuple
+
+def first_success(futures: List[Tuple[str, Future]], deadline: float) -> Any:
+    """Result of the first provider in priority order that succeeded before the deadline (time.monotonic()).
+    Returns as soon as every higher-priority provider has failed; providers still running
+    at the deadline are abandoned (their own timeout bounds the thread)."""
+    pending = {f for _, f in futures}
+    while True:
+        for _, f in futures:
+            if not f.done():
+                break
+            if f.exception() is None and f.result():
+                return f.result()
+        else:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        if not done:
+            return None
+
+def gather_within(futures: List[Tuple[str, Future]], deadline: float) -> List[Tuple[str, Any]]:
+    """(name, result) of every provider that succeeded before the deadline, in priority order"""
+    wait([f for _, f in futures], timeout=max(0.0, deadline - time.monotonic()))
+    results = []
+    for name, f in futures:
+        if not f.done():
+            print(f"Skipping {name}: no answer before the deadline")
+        elif f.exception() is not None:
+            print(f"Error fetching from {name}: {f.exception()}")
+        else:
+            results.append((name, f.result()))
+    return results
+
+async def gather_within_async(calls: List[Tuple[str, Awaitable[Any]]], timeout: float) -> List[Tuple[str, Any]]:
+    """Async gather_within: run the coroutines concurrently, cancel the ones still running after timeout seconds"""
+    if not calls:
+        return []
+    tasks = [(name, asyncio.ensure_future(c)) for name, c in calls]
+    _, pending = await asyncio.wait([t for _, t in tasks], timeout=timeout)
+    for t in pending:
+        t.cancel()
+    results = []
+    for name, t in tasks:
+        if t in pending:
+            print(f"Skipping {name}: no answer within {timeout}s")
+        elif t.exception() is not None:
+            print(f"Error fetching from {name}: {t.exception()}")
+        else:
+            results.append((name, t.result()))
+    return results
@@ -0,0 +1,33 @@
+from typing import Any, Dict, Iterable, Optional
+
+BANNED = {"fuck", "shit", "bitch"}  # replace with real list later
+LICENSES = frozenset({"public_domain", "by", "by-nc", "unknown"})
+MAX_QUOTE_CHARS = 180
+MAX_ACT_NOW_CHARS = 140
+
+def contains_profanity(text: str) -> bool:
+    low = text.lower()
+    return any(b in low for b in BANNED)
+
+def quote_allowed(text: str, tags: Iterable[str], license: Optional[str], allow_faith: bool) -> bool:
+    if (not allow_faith) and ("faith" in tags): return False
+    if contains_profanity(text): return False
+    if len(text) > MAX_QUOTE_CHARS: return False
+    return license in LICENSES
+
+def scripture_allowed(verse_texts: Iterable[str], act_now: str) -> bool:
+    if any(contains_profanity(t) for t in verse_texts): return False
+    return len(act_now) <= MAX_ACT_NOW_CHARS
+
+def filter_quote(item: Dict[str, Any], allow_faith: bool) -> Optional[Dict[str, Any]]:
+    """Dict quotes (external providers, accumulated store); trims the text it checks"""
+    text = item.get("text", "").strip()
+    if not quote_allowed(text, item.get("tags", []), item.get("license"), allow_faith):
+        return None
+    item["text"] = text
+    return item
+
+def filter_scripture(passage: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if not scripture_allowed((v.get("t", "") for v in passage.get("verses", [])), passage.get("actNow", "")):
+        return None
+    return passage
@@ -0,0 +1,8 @@
+def faith_allowed(mode: str, light_consent: bool, hide_in_mind: bool, light_by_default: bool = False) -> bool:
+    """Faith content is off in Mind overlays and in "off" mode; "light" needs consent
+    (or ALLOW_FAITH_IN_LIGHT_BY_DEFAULT); disciple and kingdom always allow it."""
+    if hide_in_mind: return False
+    m = (mode or "off").lower()
+    if m == "off": return False
+    if m == "light": return bool(light_consent) or light_by_default
+    return True
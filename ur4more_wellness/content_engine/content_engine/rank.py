@@ -0,0 +1,19 @@
+from typing import Any, Callable, Dict, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+def rank(items: List[T], topic: str, text_of: Callable[[T], str], tags_of: Callable[[T], Iterable[str]]) -> List[T]:
+    """Topic in the text scores 2, in a tag 1; stable, so equal scores keep corpus order"""
+    topic = (topic or "").lower().strip()
+    if not topic: return items
+    scored = []
+    for q in items:
+        score = 0
+        if topic in text_of(q).lower(): score += 2
+        if any(topic in t for t in tags_of(q)): score += 1
+        scored.append((score, q))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [q for _, q in scored]
+
+def rank_quotes(items: List[Dict[str, Any]], topic: str) -> List[Dict[str, Any]]:
+    return rank(items, topic, lambda q: q.get("text", ""), lambda q: q.get("tags", []))
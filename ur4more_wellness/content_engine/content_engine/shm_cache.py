@@ -0,0 +1,176 @@
+import fcntl, hashlib, mmap, os, struct, threading, time
+from typing import Dict, Optional, Tuple, Union
+
+Value = Union[str, bytes]
+
+# File header: magic, layout version, slot count, slot size
+_HEADER = struct.Struct("<8sIII")
+_MAGIC = b"UR4L1\x00\x00\x00"
+_LAYOUT = 1
+_DATA_OFFSET = 4096  # header page; bytes _LOCK_OFFSET.. of it are the fcntl targets of the stripe locks
+_LOCK_OFFSET = 64
+
+# Slot: seqlock counter, key hash, expiry (0 = none), key length, value length, value kind
+_SLOT = struct.Struct("<QQdIIB")
+_SEQ = struct.Struct("<Q")
+_STR, _BYTES = 1, 2
+
+WAYS = 8       # slots a key may live in (one set); the oldest-expiring of them is evicted
+STRIPES = 64   # sets map onto this many writer locks
+
+class SharedMemoryCache:
+    """Fixed-capacity hash table in a memory-mapped file shared by every gateway worker on the host.
+
+    Drop-in for the per-process dict behind CacheService.mem (get/pop/[]=/clear on
+    (value, expires_at) tuples), so one worker's fill is a hit for all the others.
+
+    Keys hash into sets of WAYS fixed-size slots. Writers take one of STRIPES locks
+    (a threading.Lock plus an fcntl byte-range lock, so threads and processes both
+    serialise); readers take no lock and use each slot's sequence counter instead
+    (odd while a write is in progress, re-checked after copying) and retry when it moved.
+    A full set evicts the entry closest to expiry. Entries larger than a slot are not
+    stored (a miss, counted as oversize in stats()); the default slot holds the largest
+    /content/today response (about 3.5 KB) with room to spare."""
+
+    def __init__(self, path: str, size_mb: int, slot_bytes: int = 8192):
+        self.path = path
+        self.slot_bytes = slot_bytes
+        self.nsets = max(1, (size_mb * 1024 * 1024) // (slot_bytes * WAYS))
+        self.nslots = self.nsets * WAYS
+        self.oversize = 0  # values refused because they do not fit a slot (this process)
+        self.locks = [threading.Lock() for _ in range(STRIPES)]
+        size = _DATA_OFFSET + self.nslots * slot_bytes
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.lockf(self.fd, fcntl.LOCK_EX)
+        try:
+            header = os.pread(self.fd, _HEADER.size, 0)
+            if len(header) < _HEADER.size or _HEADER.unpack(header) != (_MAGIC, _LAYOUT, self.nslots, slot_bytes):
+                # New file, or one laid out for another capacity: start empty
+                os.ftruncate(self.fd, 0)
+                os.ftruncate(self.fd, size)
+                os.pwrite(self.fd, _HEADER.pack(_MAGIC, _LAYOUT, self.nslots, slot_bytes), 0)
+        finally:
+            fcntl.lockf(self.fd, fcntl.LOCK_UN)
+        self.mm = mmap.mmap(self.fd, size)
+
+    @staticmethod
+    def _hash(key: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little") or 1
+
+    def _read(self, slot: int, h: int, key: bytes) -> Optional[Tuple[Value, Optional[float]]]:
+        off = _DATA_OFFSET + slot * self.slot_bytes
+        for _ in range(3):
+            # Header in place: a get() probes up to WAYS slots, so misses must not copy slot bodies
+            seq, kh, exp, klen, vlen, kind = _SLOT.unpack_from(self.mm, off)
+            if seq & 1:
+                continue  # write in progress
+            if kh != h:
+                return None
+            if _SLOT.size + klen + vlen > self.slot_bytes:
+                continue  # torn header read
+            start = off + _SLOT.size
+            raw = self.mm[start:start + klen + vlen]
+            if _SEQ.unpack_from(self.mm, off)[0] != seq:
+                continue  # overwritten while copying
+            if raw[:klen] != key:
+                return None
+            v = raw[klen:]
+            return (v.decode("utf-8") if kind == _STR else v, exp or None)
+        return None
+
+    def get(self, k: str, default=None):
+        key = k.encode("utf-8")
+        h = self._hash(key)
+        base = (h % self.nsets) * WAYS
+        for slot in range(base, base + WAYS):
+            rec = self._read(slot, h, key)
+            if rec is not None:
+                return rec
+        return default
+
+    def _locked(self, h: int):
+        return _StripeLock(self, (h % self.nsets) % STRIPES)
+
+    def _write(self, slot: int, h: int, key: bytes, data: bytes, kind: int, exp: float):
+        off = _DATA_OFFSET + slot * self.slot_bytes
+        seq = _SEQ.unpack_from(self.mm, off)[0]
+        _SEQ.pack_into(self.mm, off, seq + 1)
+        _SLOT.pack_into(self.mm, off, seq + 1, h, exp, len(key), len(data), kind)
+        start = off + _SLOT.size
+        self.mm[start:start + len(key) + len(data)] = key + data
+        _SEQ.pack_into(self.mm, off, seq + 2)
+
+    def __setitem__(self, k: str, rec: Tuple[Value, Optional[float]]):
+        value, exp = rec
+        kind, data = (_BYTES, value) if isinstance(value, bytes) else (_STR, value.encode("utf-8"))
+        key = k.encode("utf-8")
+        if _SLOT.size + len(key) + len(data) > self.slot_bytes:
+            self.pop(k, None)  # never serve an older value that did fit
+            self.oversize += 1
+            return
+        h = self._hash(key)
+        base = (h % self.nsets) * WAYS
+        now = time.time()
+        with self._locked(h):
+            victim, victim_rank = base, None
+            for slot in range(base, base + WAYS):
+                off = _DATA_OFFSET + slot * self.slot_bytes
+                _, kh, sexp, klen, _, _ = _SLOT.unpack_from(self.mm, off)
+                if kh == h and self.mm[off + _SLOT.size:off + _SLOT.size + klen] == key:
+                    victim = slot
+                    break
+                # Empty and expired slots are free; otherwise evict the entry expiring first
+                rank = -1.0 if kh == 0 or (sexp and sexp < now) else (sexp or float("inf"))
+                if victim_rank is None or rank < victim_rank:
+                    victim, victim_rank = slot, rank
+            self._write(victim, h, key, data, kind, exp or 0.0)
+
+    def pop(self, k: str, default=None):
+        key = k.encode("utf-8")
+        h = self._hash(key)
+        base = (h % self.nsets) * WAYS
+        with self._locked(h):
+            for slot in range(base, base + WAYS):
+                rec = self._read(slot, h, key)
+                if rec is not None:
+                    self._write(slot, 0, b"", b"", 0, 0.0)
+                    return rec
+        return default
+
+    def __contains__(self, k: str) -> bool:
+        return self.get(k) is not None
+
+    def clear(self):
+        for stripe in range(STRIPES):
+            with _StripeLock(self, stripe):
+                for s in range(stripe, self.nsets, STRIPES):
+                    for slot in range(s * WAYS, (s + 1) * WAYS):
+                        self._write(slot, 0, b"", b"", 0, 0.0)
+
+    def stats(self) -> Dict[str, int]:
+        now = time.time()
+        used = 0
+        for slot in range(self.nslots):
+            _, kh, exp, _, _, _ = _SLOT.unpack_from(self.mm, _DATA_OFFSET + slot * self.slot_bytes)
+            if kh and not (exp and exp < now):
+                used += 1
+        return {"slots": self.nslots, "used": used, "slotBytes": self.slot_bytes, "oversize": self.oversize}
+
+    def close(self):
+        self.mm.close()
+        os.close(self.fd)
+
+class _StripeLock:
+    """Writer lock for one stripe: in-process threads first, then other processes via fcntl"""
+
+    def __init__(self, table: SharedMemoryCache, stripe: int):
+        self.table = table
+        self.stripe = stripe
+
+    def __enter__(self):
+        self.table.locks[self.stripe].acquire()
+        fcntl.lockf(self.table.fd, fcntl.LOCK_EX, 1, _LOCK_OFFSET + self.stripe)
+
+    def __exit__(self, *exc):
+        fcntl.lockf(self.table.fd, fcntl.LOCK_UN, 1, _LOCK_OFFSET + self.stripe)
+        self.table.locks[self.stripe].release()
@@ -0,0 +1,23 @@
+from datetime import datetime
+from content_engine import KJV_DB, LOCAL_QUOTES, filter_scripture
+from content_engine.corpus import CORPUS_DIGEST, CORPUS_STAMP, corpus_digest
+from content_engine.filters import LICENSES
+
+def test_local_quotes_are_complete_and_unique():
+  assert len({q["id"] for q in LOCAL_QUOTES}) == len(LOCAL_QUOTES)
+  for q in LOCAL_QUOTES:
+    assert set(q) == {"id", "text", "author", "license", "source", "tags"}
+    assert q["text"].strip() and q["license"] in LICENSES and q["source"] == "local"
+
+def test_every_theme_has_a_servable_passage():
+  for theme, passages in KJV_DB.items():
+    assert theme == theme.strip().lower() and passages
+    for p in passages:
+      assert p["ref"].endswith("(KJV)") and p["license"] == "public_domain"
+      assert [v["v"] for v in p["verses"]] == sorted(v["v"] for v in p["verses"])
+      assert filter_scripture(p) is p
+
+def test_stamp_is_bumped_with_the_corpus():
+  # Fails after any corpus edit: bump CORPUS_STAMP and set CORPUS_DIGEST to the new digest
+  assert corpus_digest() == CORPUS_DIGEST, f"corpus changed: bump CORPUS_STAMP, set CORPUS_DIGEST = {corpus_digest()!r}"
+  assert datetime.fromisoformat(CORPUS_STAMP).utcoffset().total_seconds() == 0
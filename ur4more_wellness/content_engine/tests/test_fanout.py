@@ -0,0 +1,57 @@
+import asyncio, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from content_engine.fanout import first_success, gather_within, gather_within_async
+
+def _after(seconds, result=None, error=None):
+  def call():
+    time.sleep(seconds)
+    if error: raise error
+    return result
+  return call
+
+def _run(calls):
+  pool = ThreadPoolExecutor(max_workers=len(calls))
+  futures = [(name, pool.submit(fn)) for name, fn in calls]
+  pool.shutdown(wait=False)
+  return futures
+
+def test_first_success_prefers_priority_then_falls_through():
+  futures = _run([("a", _after(0.1, error=RuntimeError("down"))), ("b", _after(0.2, "b")), ("c", _after(0.0, "c"))])
+  start = time.monotonic()
+  assert first_success(futures, time.monotonic() + 2) == "b"  # c answered first but ranks lower
+  assert time.monotonic() - start < 1
+
+def test_first_success_never_waits_past_the_deadline():
+  futures = _run([("slow", _after(1.0, "slow")), ("fast", _after(0.0, "fast"))])
+  start = time.monotonic()
+  assert first_success(futures, time.monotonic() + 0.2) is None  # "fast" ranks lower, so it only counts once "slow" failed
+  assert 0.15 < time.monotonic() - start < 0.6
+
+def test_gather_within_keeps_what_arrived_in_time():
+  futures = _run([("ok", _after(0.0, 1)), ("bad", _after(0.0, error=ValueError("x"))), ("late", _after(1.0, 3))])
+  start = time.monotonic()
+  assert gather_within(futures, time.monotonic() + 0.2) == [("ok", 1)]
+  assert time.monotonic() - start < 0.6
+
+def test_gather_within_async_cancels_late_calls():
+  cancelled = threading.Event()
+
+  async def answer(value, delay):
+    try:
+      await asyncio.sleep(delay)
+    except asyncio.CancelledError:
+      cancelled.set()
+      raise
+    return value
+
+  async def fail():
+    raise RuntimeError("down")
+
+  async def main():
+    start = time.monotonic()
+    results = await gather_within_async([("a", answer(1, 0.0)), ("b", fail()), ("c", answer(3, 1.0))], timeout=0.2)
+    return results, time.monotonic() - start
+
+  results, elapsed = asyncio.run(main())
+  assert results == [("a", 1)] and elapsed < 0.6 and cancelled.is_set()
+  assert asyncio.run(gather_within_async([], timeout=0.1)) == []
@@ -0,0 +1,36 @@
+from content_engine import contains_profanity, faith_allowed, filter_quote, filter_scripture, quote_allowed
+from content_engine.filters import MAX_ACT_NOW_CHARS, MAX_QUOTE_CHARS
+
+def test_quote_policy():
+  assert quote_allowed("Keep going.", ["motivation"], "by", allow_faith=False)
+  assert not quote_allowed("Pray.", ["faith"], "public_domain", allow_faith=False)
+  assert quote_allowed("Pray.", ["faith"], "public_domain", allow_faith=True)
+  assert not quote_allowed("x" * (MAX_QUOTE_CHARS + 1), [], "public_domain", allow_faith=True)
+  assert not quote_allowed("Keep going.", [], "cc-by-sa", allow_faith=True)
+  assert not quote_allowed("Keep going.", [], None, allow_faith=True)
+  assert contains_profanity("What the SHIT") and not quote_allowed("what the shit", [], "by", allow_faith=True)
+
+def test_filter_quote_trims_what_it_checks():
+  item = {"text": "  " + "x" * MAX_QUOTE_CHARS + "  ", "tags": [], "license": "by"}
+  assert filter_quote(item, allow_faith=False)["text"] == "x" * MAX_QUOTE_CHARS
+  assert filter_quote({"text": "Keep going."}, allow_faith=True) is None  # no license
+
+def test_filter_scripture():
+  passage = {"verses": [{"v": 1, "t": "In the beginning"}], "actNow": "Pause."}
+  assert filter_scripture(passage) is passage
+  assert filter_scripture({**passage, "actNow": "x" * (MAX_ACT_NOW_CHARS + 1)}) is None
+  assert filter_scripture({**passage, "verses": [{"v": 1, "t": "shit"}]}) is None
+
+def test_faith_gating():
+  for mode in ("off", "", None, "OFF"):
+    assert faith_allowed(mode, True, False, light_by_default=True) is False
+  assert faith_allowed("light", False, False) is False
+  assert faith_allowed("Light", True, False) is True
+  assert faith_allowed("disciple", False, False) is True and faith_allowed("kingdom", False, False) is True
+  assert faith_allowed("kingdom", True, True) is False  # Mind overlays hide faith in every mode
+
+def test_light_by_default_only_waives_consent():
+  # ALLOW_FAITH_IN_LIGHT_BY_DEFAULT: "light" without consent allows faith, nothing else changes
+  assert faith_allowed("light", False, False, light_by_default=True) is True
+  assert faith_allowed("light", False, True, light_by_default=True) is False
+  assert faith_allowed("off", False, False, light_by_default=True) is False
@@ -1,4 +1,4 @@
-import os
+import os, tempfile
 from typing import Optional, List
 
 class Settings:
@@ -6,10 +6,52 @@ class Settings:
         self.PORT: int = int(os.getenv("PORT", "8080"))
         self.ENV: str = os.getenv("ENV", "dev")
         self.REDIS_URL: Optional[str] = os.getenv("REDIS_URL")
+        self.REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+        # Per-call Redis budget, breaker trip/reset, and how many keys to copy back after an outage
+        self.REDIS_TIMEOUT_MS: int = int(os.getenv("REDIS_TIMEOUT_MS", "100"))
+        self.REDIS_BREAKER_FAILURES: int = int(os.getenv("REDIS_BREAKER_FAILURES", "5"))
+        self.REDIS_BREAKER_RESET_SEC: float = float(os.getenv("REDIS_BREAKER_RESET_SEC", "10"))
+        self.REDIS_RESYNC_MAX_KEYS: int = int(os.getenv("REDIS_RESYNC_MAX_KEYS", "1000"))
         self.CACHE_TTL_SEC: int = int(os.getenv("CACHE_TTL_SEC", "120"))
+        # In-process cache shared by all workers on the host through a memory-mapped table (0 = per-process dict)
+        self.L1_SHM_MB: int = int(os.getenv("L1_SHM_MB", "0"))
+        self.L1_SHM_PATH: str = os.getenv("L1_SHM_PATH", os.path.join("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "ur4more-l1"))
+        self.L1_SHM_SLOT_BYTES: int = int(os.getenv("L1_SHM_SLOT_BYTES", "8192"))
+        # On-disk tier that survives restarts (SQLite file; unset = off), its size cap and how many hot keys to reload at startup
+        self.DISK_CACHE_PATH: Optional[str] = os.getenv("DISK_CACHE_PATH") or None
+        self.DISK_CACHE_MAX_MB: int = int(os.getenv("DISK_CACHE_MAX_MB", "256"))
+        self.DISK_CACHE_WARM_KEYS: int = int(os.getenv("DISK_CACHE_WARM_KEYS", "1000"))
+        # /ready: also fail while the Redis breaker is open; prewarm the N most frequent requests of a capture file
+        self.READY_REQUIRE_REDIS: bool = os.getenv("READY_REQUIRE_REDIS", "0") == "1"
+        self.READY_PREWARM_FILE: Optional[str] = os.getenv("READY_PREWARM_FILE") or None
+        self.READY_PREWARM_KEYS: int = int(os.getenv("READY_PREWARM_KEYS", "100"))
+        self.MANIFEST_MAX_AGE_SEC: int = int(os.getenv("MANIFEST_MAX_AGE_SEC", "300"))
+        # Release stamp reported by the manifest (set at deploy time; never wall-clock per request)
+        self.CORPUS_UPDATED_AT: Optional[str] = os.getenv("CORPUS_UPDATED_AT")
+        # Responses smaller than this are sent uncompressed
+        self.COMPRESS_MIN_BYTES: int = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+        self.COMPRESSED_TTL_SEC: int = int(os.getenv("COMPRESSED_TTL_SEC", "3600"))
         self.RATE_LIMIT_PER_MIN: int = int(os.getenv("RATE_LIMIT_PER_MIN", "60"))
         self.ENABLE_EXTERNAL: bool = os.getenv("ENABLE_EXTERNAL", "1") == "1"
+        # Providers are called concurrently; a request waits at most this long for them
+        self.EXTERNAL_DEADLINE_SEC: float = float(os.getenv("EXTERNAL_DEADLINE_SEC", "3"))
         self.ALLOW_FAITH_IN_LIGHT_BY_DEFAULT: bool = os.getenv("ALLOW_FAITH_IN_LIGHT_BY_DEFAULT","0") == "1"
+        # Point every allowlisted provider at a local simulator (python -m bench.simulator), e.g. http://127.0.0.1:9900
+        self.PROVIDER_SIMULATOR_URL: Optional[str] = os.getenv("PROVIDER_SIMULATOR_URL") or None
+
+        # Quote library built by the tools/ pipeline (manifest, shards, delta sync files)
+        self.QUOTES_ASSETS_DIR: str = os.getenv("QUOTES_ASSETS_DIR", os.path.join(os.path.dirname(__file__), "..", "..", "assets", "quotes"))
+        self.QUOTES_SYNC_DIR: str = os.getenv("QUOTES_SYNC_DIR", os.path.join(self.QUOTES_ASSETS_DIR, "sync"))
+        # e.g. X-Accel-Redirect behind nginx: the proxy streams shard files with sendfile
+        self.SENDFILE_HEADER: Optional[str] = os.getenv("SENDFILE_HEADER") or None
+        self.SENDFILE_PREFIX: str = os.getenv("SENDFILE_PREFIX", "/_quotes/")
+        self.SYNC_TTL_SEC: int = int(os.getenv("SYNC_TTL_SEC", "86400"))
+
+        # Request capture for bench/replay.py: share of users sampled (0 = off), JSONL output, hashing salt
+        self.CAPTURE_SAMPLE_RATE: float = float(os.getenv("CAPTURE_SAMPLE_RATE", "0"))
+        self.CAPTURE_PATH: str = os.getenv("CAPTURE_PATH", "capture.jsonl")
+        # Empty: generated once and kept in CAPTURE_PATH.salt (capture.salt)
+        self.CAPTURE_SALT: str = os.getenv("CAPTURE_SALT", "")
 
         # Auth
         self.JWT_KID: str = os.getenv("JWT_KID", "v1")
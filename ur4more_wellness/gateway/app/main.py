@@ -1,9 +1,23 @@
-from fastapi import FastAPI, Request
+import json, time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.config import settings
-from app.routers import quotes, scripture, devotionals, manifest as manifest_router
+from app.services import capture, readiness
+from app.services.cache import cache
+from app.routers import quotes, scripture, devotionals, today, sync, shards, manifest as manifest_router
 
-app = FastAPI(title="UR4MORE Content Gateway v2", version="2.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    readiness.start(app)  # corpus, index, cache warm-up, dependency checks; /ready reports progress
+    yield
+    readiness.startup.task.cancel()
+    await cache.close()
+
+app = FastAPI(title="UR4MORE Content Gateway v2", version="2.0.0", lifespan=lifespan)
 
 # CORS
 allow_origins = settings.CORS_ORIGINS if settings.CORS_ORIGINS != ["*"] else ["*"]
@@ -15,9 +29,70 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.middleware("http")
-async def _timing(request: Request, call_next):
-    return await call_next(request)
+class TimingMiddleware:
+    """X-Cache and sampled request capture for /content/*. Plain ASGI rather than
+    @app.middleware("http"): a sampled POST body is read here and replayed to the app,
+    which BaseHTTPMiddleware on the pinned Starlette (0.27) cannot do without the
+    endpoint waiting forever for a body that was already consumed."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not scope["path"].startswith("/content/"):
+            return await self.app(scope, receive, send)
+
+        lookups: list = []
+        capture.cache_lookups.set(lookups)
+        headers = Headers(scope=scope)
+        user = capture.subject(headers.get("authorization"))
+        record = None
+        if capture.sampled(user):
+            record = {"t": round(time.time(), 3), "u": user, "m": scope["method"], "p": scope["path"]}
+            if scope.get("query_string"):
+                record["q"] = scope["query_string"].decode("latin-1")
+            if scope["method"] == "POST":
+                body, receive = await _buffer_body(receive)
+                try:
+                    record["b"] = capture.anonymise(json.loads(body or b"{}"))
+                except ValueError:
+                    record["b"] = {}
+            if headers.get("if-none-match"):
+                record["inm"] = 1
+
+        t0 = time.perf_counter()
+
+        async def send_with_status(message: Message):
+            if message["type"] == "http.response.start":
+                status = capture.cache_status(lookups)
+                if status:
+                    MutableHeaders(scope=message).append("X-Cache", status)
+                if record is not None:
+                    record.update({"s": message["status"], "ms": round((time.perf_counter() - t0) * 1000, 1)})
+                    if status:
+                        record["c"] = status
+                    capture.write(record)
+            await send(message)
+
+        await self.app(scope, receive, send_with_status)
+
+async def _buffer_body(receive: Receive):
+    """Read the whole request body; returns it with a receive that replays the same messages to the app"""
+    messages, chunks = [], []
+    while True:
+        message = await receive()
+        messages.append(message)
+        if message["type"] != "http.request":
+            break  # client went away; the app sees the disconnect
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+
+    async def replay() -> Message:
+        return messages.pop(0) if messages else await receive()
+    return b"".join(chunks), replay
+
+app.add_middleware(TimingMiddleware)
 
 # Rate limiting temporarily disabled due to compatibility issues
 
@@ -25,8 +100,22 @@ async def _timing(request: Request, call_next):
 def health():
     return {"ok": True, "env": settings.ENV, "redis": bool(settings.REDIS_URL)}
 
+@app.get("/live")
+def live():
+    """Liveness: the process is up and serving its event loop"""
+    return {"ok": True}
+
+@app.get("/ready")
+def ready():
+    """Readiness: 503 until startup stages (corpus, index, cache warm-up, prewarm) are done"""
+    report = readiness.startup.report()
+    return JSONResponse(report, status_code=200 if report["ready"] else 503)
+
 # Routers
 app.include_router(manifest_router.router)
 app.include_router(quotes.router)
 app.include_router(scripture.router)
 app.include_router(devotionals.router)
+app.include_router(today.router)
+app.include_router(sync.router)
+app.include_router(shards.router)
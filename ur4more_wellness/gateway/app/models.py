@@ -35,4 +35,15 @@ class ScripturePassage(BaseModel):
     verses: List[Verse]
     actNow: str
     license: Literal["public_domain"] = "public_domain"
-    source: Literal["kjv.local","external","rag"] = "kjv.local"
+    source: Literal["kjv.local","external","rag","fallback"] = "kjv.local"
+
+Section = Literal["quotes","scripture","prayers","devotionals"]
+
+class TodayRequest(BaseModel):
+    faithMode: FaithMode
+    lightConsentGiven: bool = False
+    hideFaithOverlaysInMind: bool = False
+    topic: str = ""
+    theme: str = ""
+    limit: int = 5
+    sections: List[Section] = ["quotes","scripture","prayers","devotionals"]
@@ -1,29 +1,20 @@
-import httpx
 import asyncio
 import random
 from typing import List, Dict, Optional
 from app.config import settings
 from app.services.allowlist import ALLOWLISTED_PROVIDERS
+from app.services.http import http_client
+from content_engine.fanout import gather_within_async
 
 async def fetch_devotionals_external(allow_faith: bool, theme: str, limit: int) -> List[Dict]:
     """Fetch devotionals and prayers from external providers for 365-day rotation"""
     if not settings.ENABLE_EXTERNAL or not allow_faith:
         return []
     
-    devotionals = []
-    
-    # Iterate allowlisted devotional providers
-    for name, cfg in ALLOWLISTED_PROVIDERS.items():
-        if not cfg.get("enabled") or not _is_devotional_provider(name):
-            continue
-            
-        try:
-            provider_devotionals = await _fetch_from_devotional_provider(name, cfg, theme, limit)
-            devotionals.extend(provider_devotionals)
-        except Exception as e:
-            print(f"Error fetching devotionals from {name}: {e}")
-            continue
-    
+    # All enabled devotional providers at once, under one deadline
+    calls = [(name, _fetch_from_devotional_provider(name, cfg, theme, limit))
+             for name, cfg in ALLOWLISTED_PROVIDERS.items() if cfg.get("enabled") and _is_devotional_provider(name)]
+    devotionals = [d for _, provider_devotionals in await gather_within_async(calls, settings.EXTERNAL_DEADLINE_SEC) for d in provider_devotionals]
     return devotionals[:limit]
 
 def _is_devotional_provider(name: str) -> bool:
@@ -47,7 +38,7 @@ async def _fetch_prayer_api(cfg: dict, theme: str, limit: int) -> List[Dict]:
     
     # Note: This is a placeholder for when prayer APIs become available
     # For now, we'll use our fallback prayers
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_client() as client:
         try:
             response = await client.get(f"{cfg['base_url']}{cfg['endpoints']['daily_prayer']}")
             if response.status_code == 200:
@@ -64,7 +55,7 @@ async def _fetch_devotional_api(cfg: dict, theme: str, limit: int) -> List[Dict]
     
     # Note: This is a placeholder for when devotional APIs become available
     # For now, we'll use our fallback devotionals
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_client() as client:
         try:
             response = await client.get(f"{cfg['base_url']}{cfg['endpoints']['daily']}")
             if response.status_code == 200:
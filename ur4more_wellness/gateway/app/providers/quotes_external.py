@@ -1,28 +1,19 @@
-import httpx
 import asyncio
 from typing import List
 from app.models import QuoteItem
 from app.config import settings
 from app.services.allowlist import ALLOWLISTED_PROVIDERS
+from app.services.http import http_client
+from content_engine.fanout import gather_within_async
 
 async def fetch_quotes_external(allow_faith: bool, topic: str, limit: int) -> List[QuoteItem]:
     if not settings.ENABLE_EXTERNAL: 
         return []
     
-    quotes = []
-    
-    # Iterate allowlisted providers with enabled=True
-    for name, cfg in ALLOWLISTED_PROVIDERS.items():
-        if not cfg.get("enabled"): 
-            continue
-            
-        try:
-            provider_quotes = await _fetch_from_provider(name, cfg, allow_faith, topic, limit)
-            quotes.extend(provider_quotes)
-        except Exception as e:
-            print(f"Error fetching from {name}: {e}")
-            continue
-    
+    # All enabled providers at once, under one deadline
+    calls = [(name, _fetch_from_provider(name, cfg, allow_faith, topic, limit))
+             for name, cfg in ALLOWLISTED_PROVIDERS.items() if cfg.get("enabled")]
+    quotes = [q for _, provider_quotes in await gather_within_async(calls, settings.EXTERNAL_DEADLINE_SEC) for q in provider_quotes]
     return quotes[:limit]
 
 async def _fetch_from_provider(name: str, cfg: dict, allow_faith: bool, topic: str, limit: int) -> List[QuoteItem]:
@@ -41,7 +32,7 @@ async def _fetch_quotable(cfg: dict, allow_faith: bool, topic: str, limit: int)
     """Fetch from Quotable API (public domain quotes)"""
     quotes = []
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_client() as client:
         # Fetch multiple random quotes
         for _ in range(min(limit, 5)):  # Limit API calls
             try:
@@ -67,7 +58,7 @@ async def _fetch_zenquotes(cfg: dict, allow_faith: bool, topic: str, limit: int)
     """Fetch from ZenQuotes API"""
     quotes = []
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_client() as client:
         try:
             # Try today's quote first
             response = await client.get(f"{cfg['base_url']}{cfg['endpoints']['today']}")
@@ -111,7 +102,7 @@ async def _fetch_quotegarden(cfg: dict, allow_faith: bool, topic: str, limit: in
     """Fetch from QuoteGarden API"""
     quotes = []
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_client() as client:
         try:
             response = await client.get(f"{cfg['base_url']}{cfg['endpoints']['random']}")
             if response.status_code == 200:
@@ -1,30 +1,21 @@
-import httpx
 import asyncio
 import random
 from typing import List, Optional
 from app.models import ScripturePassage, Verse
 from app.config import settings
 from app.services.allowlist import ALLOWLISTED_PROVIDERS
+from app.services.http import http_client
+from content_engine.fanout import gather_within_async
 
 async def fetch_scripture_external(allow_faith: bool, theme: str, limit: int) -> List[ScripturePassage]:
     """Fetch scripture from external providers for 365-day rotation"""
     if not settings.ENABLE_EXTERNAL or not allow_faith:
         return []
     
-    passages = []
-    
-    # Iterate allowlisted scripture providers
-    for name, cfg in ALLOWLISTED_PROVIDERS.items():
-        if not cfg.get("enabled") or not _is_scripture_provider(name):
-            continue
-            
-        try:
-            provider_passages = await _fetch_from_scripture_provider(name, cfg, theme, limit)
-            passages.extend(provider_passages)
-        except Exception as e:
-            print(f"Error fetching scripture from {name}: {e}")
-            continue
-    
+    # All enabled scripture providers at once, under one deadline
+    calls = [(name, _fetch_from_scripture_provider(name, cfg, theme, limit))
+             for name, cfg in ALLOWLISTED_PROVIDERS.items() if cfg.get("enabled") and _is_scripture_provider(name)]
+    passages = [p for _, provider_passages in await gather_within_async(calls, settings.EXTERNAL_DEADLINE_SEC) for p in provider_passages]
     return passages[:limit]
 
 def _is_scripture_provider(name: str) -> bool:
@@ -50,7 +41,7 @@ async def _fetch_labs_bible(cfg: dict, theme: str, limit: int) -> List[Scripture
     """Fetch from Bible.org Labs API (free, no API key required)"""
     passages = []
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_client() as client:
         try:
             # Get daily verse
             response = await client.get(f"{cfg['base_url']}{cfg['endpoints']['daily']}")
@@ -112,7 +103,7 @@ async def _fetch_bible_api_wldeh(cfg: dict, theme: str, limit: int) -> List[Scri
         "romans+8:28", "proverbs+3:5", "matthew+11:28", "isaiah+40:31"
     ]
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_client() as client:
         try:
             # Get specific verses instead of random (which returns 404)
             for verse_ref in popular_verses[:limit]:
@@ -141,7 +132,7 @@ async def _fetch_scripture_api(cfg: dict, theme: str, limit: int) -> List[Script
     """Fetch from ScriptureAPI.com (free, no API key required)"""
     passages = []
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_client() as client:
         try:
             # Get random verse
             response = await client.get(f"{cfg['base_url']}{cfg['endpoints']['random']}")
@@ -169,7 +160,7 @@ async def _fetch_bible_gateway_votd(cfg: dict, theme: str, limit: int) -> List[S
     """Fetch from Bible Gateway Verse of the Day"""
     passages = []
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_client() as client:
         try:
             response = await client.get(f"{cfg['base_url']}{cfg['endpoints']['verse_of_day']}")
             if response.status_code == 200:
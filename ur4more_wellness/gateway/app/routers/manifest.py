@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends
+import json
+from fastapi import APIRouter, Depends, Request
 from app.services.auth import require_auth
 from app.services.manifest import build_manifest
+from app.services.http_cache import json_response
 
 router = APIRouter(prefix="/content", tags=["content"])
 
 @router.get("/manifest")
-async def manifest(_claims = Depends(require_auth)):
-    return build_manifest()
+async def manifest(req: Request, _claims = Depends(require_auth)):
+    return await json_response(req, json.dumps(build_manifest()), "manifest")
@@ -9,18 +9,12 @@ from app.providers.quotes_local import fetch_quotes_local
 from app.providers.quotes_external import fetch_quotes_external
 from app.deps import limiter, make_cache_key
 from app.services.auth import require_auth
+from app.services.http_cache import json_response
 
 router = APIRouter(prefix="/content", tags=["content"])
 
-@router.post("/quotes", response_model=List[QuoteItem])
-async def quotes_endpoint(req: Request, body: QuoteRequest, _claims = Depends(require_auth)):
-    allow = faith_allowed(body.faithMode, body.lightConsentGiven, body.hideFaithOverlaysInMind)
-    key = make_cache_key("/quotes", body.model_dump())
-    cached = cache.get(key)
-    if cached:
-        import json
-        return [QuoteItem(**x) for x in json.loads(cached)]
-
+async def build_quotes(body: QuoteRequest, allow: bool) -> List[QuoteItem]:
+    """Fetch, filter, dedupe and rank quotes for a request (no caching)"""
     items: List[QuoteItem] = []
     items += await fetch_quotes_external(allow, body.topic, body.limit)
     items += await fetch_quotes_local(allow, body.topic, body.limit)
@@ -33,6 +27,15 @@ async def quotes_endpoint(req: Request, body: QuoteRequest, _claims = Depends(re
         if sig in seen: continue
         seen.add(sig); filtered.append(qq)
 
-    ranked = rank_quotes(filtered, body.topic)[:max(1, body.limit)]
-    cache.set(key, [r.model_dump() for r in ranked])
-    return ranked
+    return rank_quotes(filtered, body.topic)[:max(1, body.limit)]
+
+@router.post("/quotes", response_model=List[QuoteItem])
+async def quotes_endpoint(req: Request, body: QuoteRequest, _claims = Depends(require_auth)):
+    allow = faith_allowed(body.faithMode, body.lightConsentGiven, body.hideFaithOverlaysInMind)
+    key = make_cache_key("/quotes", body.model_dump())
+    cached = await cache.get(key)
+    if cached:
+        return await json_response(req, cached)
+
+    ranked = await build_quotes(body, allow)
+    return await json_response(req, await cache.set(key, [r.model_dump() for r in ranked]))
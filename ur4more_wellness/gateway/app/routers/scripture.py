@@ -7,21 +7,12 @@ from app.providers.scripture_kjv_local import fetch_scripture_local
 from app.providers.scripture_external import fetch_scripture_external, get_fallback_scripture
 from app.deps import limiter, make_cache_key
 from app.services.auth import require_auth
+from app.services.http_cache import json_response
 
 router = APIRouter(prefix="/content", tags=["content"])
 
-@router.post("/scripture", response_model=ScripturePassage)
-async def scripture_endpoint(req: Request, body: ScriptureRequest, _claims = Depends(require_auth)):
-    allow = faith_allowed(body.faithMode, body.lightConsentGiven, body.hideFaithOverlaysInMind)
-    if not allow:
-        raise HTTPException(status_code=403, detail={"code":"FAITH_BLOCKED","hint":"Enable Faith Mode (Light with consent, Disciple, or Kingdom) and unhide in Mind."})
-
-    key = make_cache_key("/scripture", body.model_dump())
-    cached = cache.get(key)
-    if cached:
-        import json
-        return ScripturePassage(**json.loads(cached))
-
+async def build_scripture(body: ScriptureRequest, allow: bool) -> ScripturePassage:
+    """Resolve one filtered passage for a request (no caching)"""
     # Try external providers first for 365-day rotation
     passages = await fetch_scripture_external(allow, body.theme, body.limit)
     
@@ -40,6 +31,18 @@ async def scripture_endpoint(req: Request, body: ScriptureRequest, _claims = Dep
     p = filter_scripture(passages[0])
     if not p:
         raise HTTPException(status_code=422, detail="Scripture failed filter policy.")
-    
-    cache.set(key, p.model_dump())
     return p
+
+@router.post("/scripture", response_model=ScripturePassage)
+async def scripture_endpoint(req: Request, body: ScriptureRequest, _claims = Depends(require_auth)):
+    allow = faith_allowed(body.faithMode, body.lightConsentGiven, body.hideFaithOverlaysInMind)
+    if not allow:
+        raise HTTPException(status_code=403, detail={"code":"FAITH_BLOCKED","hint":"Enable Faith Mode (Light with consent, Disciple, or Kingdom) and unhide in Mind."})
+
+    key = make_cache_key("/scripture", body.model_dump())
+    cached = await cache.get(key)
+    if cached:
+        return await json_response(req, cached)
+
+    p = await build_scripture(body, allow)
+    return await json_response(req, await cache.set(key, p.model_dump()))
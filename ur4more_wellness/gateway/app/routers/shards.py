@@ -0,0 +1,31 @@
+import os
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request, Depends
+from app.config import settings
+from app.services.auth import require_auth
+from app.services.http_cache import json_response
+from app.services.static_files import shard_path, manifest_checksums, mode_manifest, file_checksum, file_response
+
+router = APIRouter(prefix="/content/shards", tags=["content"])
+
+@router.get("/manifest.json")
+async def shard_manifest(req: Request, mode: Optional[str] = None, _claims = Depends(require_auth)):
+    """The full manifest file, or with ?mode=off|faith only the shards a client in that faith mode needs"""
+    if mode is not None:
+        body = mode_manifest(mode)
+        if body is None:
+            raise HTTPException(status_code=404, detail="Unknown mode; use off or faith.")
+        return await json_response(req, body, "manifest")
+    path = os.path.join(settings.QUOTES_ASSETS_DIR, "manifest.json")
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Shard manifest not found.")
+    return file_response(req, path, file_checksum(path))
+
+@router.get("/{name}")
+async def shard_file(req: Request, name: str, _claims = Depends(require_auth)):
+    """Raw shard bytes from disk; supports Range, If-None-Match and .gz/.br siblings"""
+    path = shard_path(name)
+    if not path:
+        raise HTTPException(status_code=404, detail="Shard not found.")
+    checksum = manifest_checksums().get(name) or file_checksum(path)
+    return file_response(req, path, checksum)
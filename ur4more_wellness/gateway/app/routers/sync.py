@@ -0,0 +1,14 @@
+from fastapi import APIRouter, HTTPException, Request, Depends
+from app.services.auth import require_auth
+from app.services.http_cache import json_response
+from app.services.quote_sync import delta_body
+
+router = APIRouter(prefix="/content", tags=["content"])
+
+@router.get("/quotes/sync")
+async def quotes_sync(req: Request, since: str, _claims = Depends(require_auth)):
+    """Added, changed and removed quotes since the client's corpus version"""
+    body = await delta_body(since)
+    if body is None:
+        raise HTTPException(status_code=404, detail="Delta sync unavailable.")
+    return await json_response(req, body, "sync")
@@ -0,0 +1,86 @@
+import asyncio
+from fastapi import APIRouter, HTTPException, Request, Depends
+from app.models import TodayRequest, QuoteRequest, ScriptureRequest
+from app.services.gating import faith_allowed
+from app.services.cache import cache
+from app.routers.quotes import build_quotes
+from app.routers.scripture import build_scripture
+from app.routers.devotionals import build_prayers, build_devotionals
+from app.deps import limiter, make_cache_key
+from app.services.auth import require_auth
+from app.services.http_cache import json_response
+
+router = APIRouter(prefix="/content", tags=["content"])
+
+# Sections that are only served when faith content is allowed
+FAITH_ONLY = {"scripture", "prayers", "devotionals"}
+
+def _section_requests(body: TodayRequest) -> dict:
+    """Per-section request bodies, shaped exactly like the single-section routes so cache keys are shared"""
+    shared = {
+        "faithMode": body.faithMode,
+        "lightConsentGiven": body.lightConsentGiven,
+        "hideFaithOverlaysInMind": body.hideFaithOverlaysInMind,
+    }
+    return {
+        "quotes": QuoteRequest(**shared, topic=body.topic, limit=body.limit),
+        "scripture": ScriptureRequest(**shared, theme=body.theme),
+        "prayers": QuoteRequest(**shared, topic=body.topic, limit=body.limit),
+        "devotionals": QuoteRequest(**shared, topic=body.topic, limit=body.limit),
+    }
+
+async def _resolve(section: str, sub, allow: bool):
+    """Build one section and return its JSON-ready value"""
+    if section == "quotes":
+        return [q.model_dump() for q in await build_quotes(sub, allow)]
+    if section == "scripture":
+        return (await build_scripture(sub, allow)).model_dump()
+    if section == "prayers":
+        return await build_prayers(sub, allow)
+    return await build_devotionals(sub, allow)
+
+@router.post("/today")
+async def today_endpoint(req: Request, body: TodayRequest, _claims = Depends(require_auth)):
+    """Quotes, scripture, prayers and devotionals for the home screen in one call"""
+    allow = faith_allowed(body.faithMode, body.lightConsentGiven, body.hideFaithOverlaysInMind)
+    subs = _section_requests(body)
+
+    raw = {}
+    wanted = []
+    for section in dict.fromkeys(body.sections):
+        if section in FAITH_ONLY and not allow:
+            raw[section] = "null"
+        else:
+            wanted.append(section)
+
+    # One multi-key lookup for every section
+    keys = [make_cache_key(f"/{s}", subs[s].model_dump()) for s in wanted]
+    misses = []
+    for section, key, cached in zip(wanted, keys, await cache.get_many(keys)):
+        if cached:
+            raw[section] = cached
+        else:
+            misses.append((section, key))
+
+    # Resolve every miss concurrently; a failing section is returned as null
+    results = await asyncio.gather(
+        *(_resolve(s, subs[s], allow) for s, _ in misses), return_exceptions=True
+    )
+    fresh = {}
+    for (section, key), value in zip(misses, results):
+        if isinstance(value, HTTPException):
+            raw[section] = "null"
+            continue
+        if isinstance(value, BaseException):
+            raise value
+        fresh[key] = value
+    # Store every rebuilt section in one pipelined write
+    stored = await cache.set_many(fresh)
+    for section, key in misses:
+        if key in stored:
+            raw[section] = stored[key]
+
+    # Sections are already JSON, so splice them instead of re-parsing
+    parts = [f'"faithAllowed": {"true" if allow else "false"}']
+    parts += [f'"{s}": {raw[s]}' for s in dict.fromkeys(body.sections)]
+    return await json_response(req, "{" + ", ".join(parts) + "}")
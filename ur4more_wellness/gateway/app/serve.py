@@ -0,0 +1,226 @@
+"""
+Pre-fork production launcher:
+
+    python -m app.serve --workers 4 --port 8080
+
+The master imports the app and warms the corpus and its indices, freezes the
+heap with gc.freeze() so forked workers keep sharing those pages, binds the
+listening socket once and forks N uvicorn workers onto it. It then supervises:
+
+    worker exits unexpectedly  -> respawned (with backoff when it keeps crashing)
+    SIGHUP                     -> graceful reload: the master re-execs itself on the same socket,
+                                  preloads the new code and corpus, starts new workers, then drains the old ones
+    SIGUSR1                    -> print the per-worker memory report
+    SIGTERM / SIGINT           -> drain workers (in-flight requests finish) and exit
+
+The memory report lists each worker's RSS and its private (unshared) share; the
+private figure is what one more worker costs when sizing a container. Linux only.
+"""
+import argparse, gc, os, signal, socket, sys, time
+from typing import Dict, List, Optional
+
+LISTEN_FD_ENV = "UR4MORE_LISTEN_FD"
+OLD_WORKERS_ENV = "UR4MORE_OLD_WORKERS"
+
+def preload():
+    """Import the app and build everything workers would otherwise build on first request"""
+    gc.disable()  # no collections while the shared heap is built, so it stays compact
+    from app.main import app
+    from app.services import capture, static_files
+    from app.services.manifest import build_manifest
+    capture.vocabulary()
+    build_manifest()
+    static_files.manifest_checksums()
+    gc.collect()
+    gc.freeze()  # keep preloaded objects out of every worker's collections (no copy-on-write from gc bookkeeping)
+    return app
+
+def memory(pid: int) -> Optional[Dict[str, int]]:
+    """RSS and private (unshared) memory of a process in KiB, from /proc/<pid>/smaps_rollup"""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+            fields = {}
+            for line in f:
+                name, _, rest = line.partition(":")
+                parts = rest.split()
+                if parts and parts[-1] == "kB":
+                    fields[name] = int(parts[0])
+    except OSError:
+        return None
+    return {
+        "rss_kb": fields.get("Rss", 0),
+        "private_kb": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+        "shared_kb": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+    }
+
+def memory_report(master: int, workers: List[int]) -> str:
+    base = memory(master)
+    if base is None:
+        return "memory report unavailable (needs /proc/<pid>/smaps_rollup)"
+    lines = [f"master {master}: rss {base['rss_kb'] // 1024} MiB"]
+    private = []
+    for pid in workers:
+        m = memory(pid)
+        if m:
+            private.append(m["private_kb"])
+            lines.append(f"worker {pid}: rss {m['rss_kb'] // 1024} MiB, shared {m['shared_kb'] // 1024} MiB, private {m['private_kb'] // 1024} MiB")
+    if private:
+        lines.append(f"each extra worker adds ~{sum(private) // len(private) // 1024} MiB (mean private RSS)")
+    return "\n".join(lines)
+
+def _listen(host: str, port: int, backlog: int) -> socket.socket:
+    inherited = os.environ.pop(LISTEN_FD_ENV, None)
+    if inherited:
+        sock = socket.socket(fileno=int(inherited))
+    else:
+        sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+class Master:
+    def __init__(self, args, sock: socket.socket, app):
+        self.args = args
+        self.sock = sock
+        self.app = app
+        self.workers: Dict[int, float] = {}  # pid -> start time
+        self.prewarmer: Optional[int] = None  # the worker that runs READY_PREWARM_FILE
+        self.crashes = 0
+        self.stopping = False
+        self.reload_requested = False
+        self.report_requested = False
+
+    def spawn(self):
+        prewarm = self.prewarmer not in self.workers  # the first worker, or the replacement for it
+        pid = os.fork()
+        if pid:
+            self.workers[pid] = time.monotonic()
+            if prewarm:
+                self.prewarmer = pid
+            return
+        # Worker
+        from app.services.cache import cache
+        from app.services.readiness import startup
+        if not prewarm and (cache.r is not None or not isinstance(cache.mem, dict)):
+            startup.prewarm = False  # Redis or the shared L1 already holds what the prewarmer fills
+        for sig in (signal.SIGHUP, signal.SIGUSR1, signal.SIGTERM, signal.SIGINT, signal.SIGCHLD):
+            signal.signal(sig, signal.SIG_DFL)
+        gc.enable()
+        import uvicorn
+        config = uvicorn.Config(self.app, log_level=self.args.log_level, lifespan="on", proxy_headers=True,
+                                timeout_graceful_shutdown=self.args.graceful_timeout)
+        uvicorn.Server(config).run(sockets=[self.sock])
+        os._exit(0)
+
+    def reap(self):
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            started = self.workers.pop(pid, None)
+            if started is None or self.stopping:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            print(f"[serve] worker {pid} exited ({code}); respawning", flush=True)
+            # A worker that dies right after starting is probably crash-looping: back off
+            self.crashes = self.crashes + 1 if time.monotonic() - started < 5 else 0
+            time.sleep(min(10, 0.5 * self.crashes))
+
+    def drain(self, pids: List[int]):
+        """SIGTERM workers (uvicorn finishes in-flight requests) and SIGKILL stragglers"""
+        for pid in pids:
+            try: os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError: pass
+        deadline = time.monotonic() + self.args.graceful_timeout + 5
+        remaining = set(pids)
+        while remaining and time.monotonic() < deadline:
+            for pid in list(remaining):
+                try:
+                    done, _ = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    done = pid
+                if done:
+                    remaining.discard(pid)
+                    self.workers.pop(pid, None)
+            time.sleep(0.1)
+        for pid in remaining:
+            try: os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError: pass
+
+    def reexec(self):
+        """Graceful reload: a fresh interpreter takes over the socket; old workers keep serving until it is ready"""
+        print(f"[serve] reloading; {len(self.workers)} workers drain once the new ones are up", flush=True)
+        env = dict(os.environ, **{LISTEN_FD_ENV: str(self.sock.fileno()), OLD_WORKERS_ENV: ",".join(map(str, self.workers))})
+        os.execve(sys.executable, [sys.executable, "-m", "app.serve"] + sys.argv[1:], env)
+
+    def run(self, old_workers: List[int]):
+        signal.signal(signal.SIGHUP, lambda *_: setattr(self, "reload_requested", True))
+        signal.signal(signal.SIGUSR1, lambda *_: setattr(self, "report_requested", True))
+        signal.signal(signal.SIGTERM, lambda *_: setattr(self, "stopping", True))
+        signal.signal(signal.SIGINT, lambda *_: setattr(self, "stopping", True))
+
+        for _ in range(self.args.workers):
+            self.spawn()
+        print(f"[serve] {self.args.workers} workers on {self.args.host}:{self.sock.getsockname()[1]} (master {os.getpid()})", flush=True)
+        if old_workers:
+            time.sleep(self.args.warmup)  # let the new workers start accepting first
+            self.drain(old_workers)
+        report_at = time.monotonic() + self.args.warmup
+
+        while not self.stopping:
+            time.sleep(0.2)
+            self.reap()
+            if self.stopping:
+                break
+            while len(self.workers) < self.args.workers:
+                self.spawn()
+            if self.reload_requested:
+                self.reexec()
+            if self.report_requested or (report_at and time.monotonic() >= report_at):
+                print("[serve] memory\n" + memory_report(os.getpid(), list(self.workers)), flush=True)
+                self.report_requested = False
+                report_at = 0
+
+        print("[serve] shutting down", flush=True)
+        self.drain(list(self.workers))
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="UR4MORE gateway pre-fork launcher")
+    ap.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    ap.add_argument("--port", type=int, default=int(os.getenv("PORT", "8080")))
+    ap.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))))
+    ap.add_argument("--backlog", type=int, default=2048)
+    ap.add_argument("--graceful-timeout", type=int, default=30, help="seconds a draining worker gets for in-flight requests")
+    ap.add_argument("--warmup", type=float, default=2.0, help="seconds before the first memory report / before old workers drain")
+    ap.add_argument("--log-level", default="info")
+    args = ap.parse_args(argv)
+
+    old_workers = [int(p) for p in os.environ.pop(OLD_WORKERS_ENV, "").split(",") if p]
+    sock = _listen(args.host, args.port, args.backlog)
+    try:
+        app = preload()
+    except Exception as e:
+        if not old_workers:
+            raise
+        # The new code does not import: keep the previous generation serving instead of going down
+        print(f"[serve] reload failed ({e!r}); previous workers keep serving until they exit", flush=True)
+        def forward(sig, _frame):
+            for pid in old_workers:
+                try: os.kill(pid, sig)
+                except ProcessLookupError: pass
+        signal.signal(signal.SIGTERM, forward)
+        signal.signal(signal.SIGINT, forward)
+        for pid in old_workers:
+            try: os.waitpid(pid, 0)
+            except ChildProcessError: pass
+        return 1
+    Master(args, sock, app).run(old_workers)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
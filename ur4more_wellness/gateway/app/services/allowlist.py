@@ -1,3 +1,6 @@
+from urllib.parse import urlparse
+from app.config import settings
+
 # Single source of truth for external providers (disabled by default).
 ALLOWLISTED_PROVIDERS = {
     # Free quote APIs for 365-day content rotation
@@ -89,3 +92,13 @@ ALLOWLISTED_PROVIDERS = {
         }
     }
 }
+
+def simulated_url(url: str, simulator: str) -> str:
+    """Route an upstream URL through the provider simulator: https://host/path -> <simulator>/host/path"""
+    parts = urlparse(url)
+    return f"{simulator.rstrip('/')}/{parts.netloc}{parts.path}"
+
+if settings.PROVIDER_SIMULATOR_URL:
+    for _cfg in ALLOWLISTED_PROVIDERS.values():
+        _cfg["upstream_base_url"] = _cfg["base_url"]
+        _cfg["base_url"] = simulated_url(_cfg["base_url"], settings.PROVIDER_SIMULATOR_URL)
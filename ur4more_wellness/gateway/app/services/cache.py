@@ -1,16 +1,126 @@
-import time, json
-from typing import Any, Optional
+import asyncio, os, time, json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, List, Tuple
 from app.config import settings
+from content_engine.breaker import CircuitBreaker
+from app.services.capture import record_lookup
+from content_engine.disk_cache import DiskCache
 try:
-    import redis
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
 except Exception:
-    redis = None
+    aioredis = None
+    RedisError = OSError
+
+# Returned by _call when Redis could not be used for an operation
+_FAILED = object()
+
+# Response cache entries (deps.make_cache_key); counted for X-Cache and request capture
+CONTENT_PREFIX = "cg:"
 
 class CacheService:
-    def __init__(self):
+    """Response cache: in-process dict, or Redis through a shared asyncio connection pool.
+    Every operation is awaitable so concurrent requests overlap their round trips.
+    With L1_SHM_MB set the in-process dict is a SharedMemoryCache shared by all workers on the host.
+    With DISK_CACHE_PATH set every write also goes to a DiskCache that serves misses after a
+    restart: warm() reloads its hottest keys at startup and close() snapshots it at shutdown.
+    The disk tier never runs on the event loop: reads go through asyncio.to_thread, writes,
+    hit counts and compaction through one background writer thread. Disk hits and warmed keys
+    are promoted to Redis with their remaining TTL (to the in-process dict without Redis or
+    while it is failing).
+
+    Redis calls are bounded by REDIS_TIMEOUT_MS and guarded by a circuit breaker. While
+    Redis is failing or the circuit is open, reads and writes use the in-process dict;
+    keys written meanwhile are copied back to Redis (write-behind) once it recovers."""
+
+    def __init__(self, redis_url: Optional[str] = None):
+        redis_url = redis_url if redis_url is not None else settings.REDIS_URL
         self.ttl = settings.CACHE_TTL_SEC
         self.mem = {}
-        self.r = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True) if (redis and settings.REDIS_URL) else None
+        if settings.L1_SHM_MB > 0:
+            from content_engine.shm_cache import SharedMemoryCache
+            self.mem = SharedMemoryCache(settings.L1_SHM_PATH, settings.L1_SHM_MB, settings.L1_SHM_SLOT_BYTES)
+        self.r = None
+        self.rb = None
+        self.timeout = settings.REDIS_TIMEOUT_MS / 1000
+        self.breaker = CircuitBreaker(settings.REDIS_BREAKER_FAILURES, settings.REDIS_BREAKER_RESET_SEC)
+        # Keys written to the fallback while Redis was unavailable, oldest first
+        self.dirty: "OrderedDict[str, None]" = OrderedDict()
+        self._resync_task: Optional[asyncio.Task] = None
+        self.disk = DiskCache(settings.DISK_CACHE_PATH, settings.DISK_CACHE_MAX_MB) if settings.DISK_CACHE_PATH else None
+        self._writer_pool: Optional[ThreadPoolExecutor] = None
+        self._writer_pid = 0
+        if aioredis and redis_url:
+            opts = {"max_connections": settings.REDIS_MAX_CONNECTIONS, "socket_timeout": self.timeout, "socket_connect_timeout": self.timeout}
+            self.r = aioredis.Redis(connection_pool=aioredis.ConnectionPool.from_url(redis_url, decode_responses=True, **opts))
+            # Binary values (compressed response variants) need a non-decoding client
+            self.rb = aioredis.Redis(connection_pool=aioredis.ConnectionPool.from_url(redis_url, **opts))
+
+    async def _call(self, op: Callable[[], Awaitable[Any]]) -> Any:
+        """Run one Redis operation under the timeout and breaker; _FAILED when the fallback must serve it"""
+        if not self.breaker.allow():
+            return _FAILED
+        try:
+            result = await asyncio.wait_for(op(), self.timeout)
+        except (RedisError, OSError, asyncio.TimeoutError):
+            self.breaker.failure()
+            return _FAILED
+        except BaseException:
+            # Cancelled (client gone, gather/wait_for) mid-call: a half-open trial must not stay in flight forever
+            self.breaker.abandon()
+            raise
+        if self.breaker.success():
+            self._schedule_resync()
+        return result
+
+    def _fallback_set(self, k: str, v: Any, ttl: int):
+        self._mem_set(k, v, ttl)
+        self.dirty[k] = None
+        self.dirty.move_to_end(k)
+        while len(self.dirty) > settings.REDIS_RESYNC_MAX_KEYS:
+            self.dirty.popitem(last=False)
+
+    def _schedule_resync(self):
+        if self.dirty and (self._resync_task is None or self._resync_task.done()):
+            self._resync_task = asyncio.get_running_loop().create_task(self.resync())
+
+    async def _redis_write(self, entries: List[Tuple[str, Any, int]]):
+        """SET (key, value, ttl) entries in one pipelined round trip per client (text and binary)"""
+        async with self.r.pipeline(transaction=False) as text, self.rb.pipeline(transaction=False) as binary:
+            for k, v, ttl in entries:
+                (binary if isinstance(v, bytes) else text).set(k, v, ex=ttl)
+            await text.execute()
+            await binary.execute()
+
+    async def resync(self) -> int:
+        """Write keys stored in the fallback during an outage back to Redis with their remaining TTL"""
+        now = time.time()
+        keys, self.dirty = list(self.dirty), OrderedDict()
+        entries = []
+        for k in keys:
+            rec = self.mem.get(k)
+            if rec and (not rec[1] or rec[1] > now):
+                entries.append((k, rec[0], max(1, int(rec[1] - now)) if rec[1] else self.ttl))
+
+        if entries and await self._call(lambda: self._redis_write(entries)) is _FAILED:
+            for k in keys:
+                self.dirty[k] = None
+            return 0
+        # Redis holds them again; the fallback only has to cover the next outage
+        for k in keys:
+            self.mem.pop(k, None)
+        return len(entries)
+
+    async def ping(self) -> Optional[bool]:
+        """Redis reachability (None without Redis); goes through the breaker like any other call"""
+        if not self.r: return None
+        return await self._call(self.r.ping) is not _FAILED
+
+    def status(self) -> Dict[str, Any]:
+        shared = not isinstance(self.mem, dict)
+        return {"backend": "redis" if self.r else "memory", "breaker": self.breaker.state if self.r else None, "pendingResync": len(self.dirty),
+                "l1": "shared" if shared else "process", "l1Stats": self.mem.stats() if shared else None, "disk": self.disk is not None}
 
     def _mem_get(self, k: str) -> Optional[str]:
         rec = self.mem.get(k)
@@ -24,13 +134,129 @@ class CacheService:
     def _mem_set(self, k: str, v: str, ttl: int):
         self.mem[k] = (v, time.time()+ttl if ttl else None)
 
-    def get(self, k: str) -> Optional[str]:
-        return self.r.get(k) if self.r else self._mem_get(k)
+    def _disk_write(self, fn: Callable[..., Any], *args: Any):
+        """Queue a disk write (set, touch) on the writer thread; one per process, started after fork"""
+        if self._writer_pool is None or self._writer_pid != os.getpid():
+            self._writer_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk-cache")
+            self._writer_pid = os.getpid()
+        self._writer_pool.submit(fn, *args).add_done_callback(
+            lambda f: f.exception() and print(f"Disk cache write failed: {f.exception()!r}"))
+
+    def flush_disk(self):
+        """Block until every queued disk write has landed (shutdown and tests)"""
+        if self._writer_pool is not None and self._writer_pid == os.getpid():
+            self._writer_pool.shutdown(wait=True)
+        self._writer_pool = None
+
+    async def _promote(self, entries: List[Tuple[str, Any, float]]):
+        """Put disk entries (key, value, expires_at) back in the fastest tier: Redis with their
+        remaining TTL, or the in-process dict without Redis or while Redis is failing"""
+        if not entries: return
+        if self.r:
+            now = time.time()
+            with_ttl = [(k, v, max(1, int(exp - now))) for k, v, exp in entries]
+            if await self._call(lambda: self._redis_write(with_ttl)) is not _FAILED:
+                return
+        for k, v, exp in entries:
+            self.mem[k] = (v, exp)
 
-    def set(self, k: str, value: Any, ttl: Optional[int]=None):
+    async def _disk_get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """L3 lookup of keys missed by the faster tiers; hits are promoted"""
+        if not self.disk or not keys: return [None] * len(keys)
+        disk = self.disk
+        recs = await asyncio.to_thread(lambda: [disk.get(k) for k in keys])
+        hits = [(k, *rec) for k, rec in zip(keys, recs) if rec is not None]
+        for k, _, _ in hits:
+            self._disk_write(disk.touch, k)
+        await self._promote(hits)
+        return [rec[0] if rec else None for rec in recs]
+
+    def _persist(self, k: str, v: Any, ttl: int):
+        if self.disk: self._disk_write(self.disk.set, k, v, time.time() + ttl)
+
+    def _touch(self, k: str):
+        if self.disk: self._disk_write(self.disk.touch, k)
+
+    async def warm(self) -> int:
+        """Startup: promote the hottest unexpired disk entries (to Redis when it is up)"""
+        if not self.disk: return 0
+        entries = await asyncio.to_thread(self.disk.hottest, settings.DISK_CACHE_WARM_KEYS)
+        await self._promote(entries)
+        return len(entries)
+
+    async def get(self, k: str) -> Optional[str]:
+        v = await self._call(lambda: self.r.get(k)) if self.r else _FAILED
+        if v is _FAILED: v = self._mem_get(k)
+        if v is None: v = (await self._disk_get_many([k]))[0]
+        else: self._touch(k)
+        if k.startswith(CONTENT_PREFIX): record_lookup(v is not None)
+        return v
+
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """Fetch several keys in one round trip (MGET on Redis)"""
+        if not keys: return []
+        values = await self._call(lambda: self.r.mget(keys)) if self.r else _FAILED
+        if values is _FAILED: values = [self._mem_get(k) for k in keys]
+        if self.disk:
+            missed = [k for k, v in zip(keys, values) if v is None]
+            for k, v in zip(keys, values):
+                if v is not None: self._touch(k)
+            found = dict(zip(missed, await self._disk_get_many(missed)))
+            values = [found.get(k) if v is None else v for k, v in zip(keys, values)]
+        for k, v in zip(keys, values):
+            if k.startswith(CONTENT_PREFIX): record_lookup(v is not None)
+        return values
+
+    async def set(self, k: str, value: Any, ttl: Optional[int]=None) -> str:
+        """Store value as JSON and return the serialized string"""
         s = json.dumps(value)
         ttl = ttl or self.ttl
-        if self.r: self.r.setex(k, ttl, s)
-        else: self._mem_set(k, s, ttl)
+        if not self.r: self._mem_set(k, s, ttl)
+        elif await self._call(lambda: self.r.set(k, s, ex=ttl)) is _FAILED: self._fallback_set(k, s, ttl)
+        self._persist(k, s, ttl)
+        return s
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int]=None) -> Dict[str, str]:
+        """Store several values in one pipelined round trip; returns the serialized strings by key"""
+        serialized = {k: json.dumps(v) for k, v in items.items()}
+        if not serialized: return serialized
+        ttl = ttl or self.ttl
+
+        async def write():
+            async with self.r.pipeline(transaction=False) as pipe:
+                for k, s in serialized.items():
+                    pipe.set(k, s, ex=ttl)
+                await pipe.execute()
+
+        if not self.r:
+            for k, s in serialized.items(): self._mem_set(k, s, ttl)
+        elif await self._call(write) is _FAILED:
+            for k, s in serialized.items(): self._fallback_set(k, s, ttl)
+        for k, s in serialized.items(): self._persist(k, s, ttl)
+        return serialized
+
+    async def get_bytes(self, k: str) -> Optional[bytes]:
+        v = await self._call(lambda: self.rb.get(k)) if self.rb else _FAILED
+        if v is _FAILED: v = self._mem_get(k)
+        if v is None: return (await self._disk_get_many([k]))[0]
+        self._touch(k)
+        return v
+
+    async def set_bytes(self, k: str, data: bytes, ttl: Optional[int]=None):
+        ttl = ttl or self.ttl
+        if not self.rb: self._mem_set(k, data, ttl)
+        elif await self._call(lambda: self.rb.set(k, data, ex=ttl)) is _FAILED: self._fallback_set(k, data, ttl)
+        self._persist(k, data, ttl)
+
+    async def close(self):
+        """Release pooled Redis connections and snapshot the disk tier (application shutdown)"""
+        for client in (self.r, self.rb):
+            if client is not None:
+                await client.aclose()
+        self.flush_disk()
+        if self.disk:
+            self.disk.snapshot()
+            self.disk.close()
+            self.disk = None
 
 cache = CacheService()
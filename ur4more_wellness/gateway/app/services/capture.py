@@ -0,0 +1,112 @@
+"""
+Sampled request capture for workload replay (bench/replay.py).
+
+Each sampled /content/* request becomes one compact JSON line:
+    {"t": epoch seconds, "u": hashed JWT subject, "m": method, "p": path, "q": query,
+     "b": anonymised body, "inm": 1 if If-None-Match was sent, "s": status, "ms": latency, "c": hit|miss|partial}
+Users are sampled whole (by subject hash) so per-user revalidation patterns survive.
+"""
+import base64, hashlib, json, os, random, secrets, threading
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+from app.config import settings
+
+# Cache lookups made while serving the current request: True for a hit
+cache_lookups: ContextVar[Optional[List[bool]]] = ContextVar("cache_lookups", default=None)
+
+# Body fields that shape cache keys and ranking; anything else is dropped
+FLAG_FIELDS = ("faithMode", "lightConsentGiven", "hideFaithOverlaysInMind", "limit", "sections")
+TEXT_FIELDS = ("topic", "theme")
+
+_vocabulary: Optional[set] = None
+_lock = threading.Lock()
+_salts: Dict[str, str] = {}
+
+def record_lookup(hit: bool):
+    lookups = cache_lookups.get()
+    if lookups is not None:
+        lookups.append(hit)
+
+def cache_status(lookups: Optional[List[bool]]) -> Optional[str]:
+    if not lookups:
+        return None
+    hits = sum(lookups)
+    return "hit" if hits == len(lookups) else "miss" if hits == 0 else "partial"
+
+def persisted_salt(path: str) -> str:
+    """The salt stored at path, created on first use. The file is linked into place
+    atomically, so workers racing to create it all end up reading the same salt."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        pass
+    tmp = f"{path}.{os.getpid()}"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(secrets.token_hex(16))
+    try:
+        os.link(tmp, path)
+    except FileExistsError:
+        pass  # another worker won
+    finally:
+        os.unlink(tmp)
+    with open(path, encoding="utf-8") as f:
+        return f.read().strip()
+
+def salt() -> str:
+    """CAPTURE_SALT, else one generated next to CAPTURE_PATH: a per-process salt would hash the
+    same user differently in every worker and after every restart, breaking whole-user sampling"""
+    if settings.CAPTURE_SALT:
+        return settings.CAPTURE_SALT
+    path = settings.CAPTURE_PATH + ".salt"
+    if path not in _salts:
+        _salts[path] = persisted_salt(path)
+    return _salts[path]
+
+def _hash(value: str) -> str:
+    return hashlib.sha256((salt() + value).encode()).hexdigest()[:12]
+
+def vocabulary() -> set:
+    """Topics and themes the corpus knows; these are kept verbatim, free text is hashed"""
+    global _vocabulary
+    if _vocabulary is None:
+        from app.providers.quotes_local import PD
+        from app.providers.scripture_kjv_local import KJV_DB
+        _vocabulary = {t for q in PD for t in q.tags} | set(KJV_DB)
+    return _vocabulary
+
+def subject(authorization: Optional[str]) -> Optional[str]:
+    """Hashed `sub` claim of the bearer token (read without verification; auth still runs in the route)"""
+    if settings.CAPTURE_SAMPLE_RATE <= 0 or not authorization or not authorization.lower().startswith("bearer "):
+        return None
+    try:
+        payload = authorization.split(" ", 1)[1].split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return _hash(str(claims.get("sub", "")))
+    except (IndexError, ValueError, AttributeError):
+        return None
+
+def sampled(user: Optional[str]) -> bool:
+    rate = settings.CAPTURE_SAMPLE_RATE
+    if rate <= 0:
+        return False
+    if user:
+        return int(user[:8], 16) / 0xFFFFFFFF < rate
+    return random.random() < rate
+
+def anonymise(body: Any) -> Dict[str, Any]:
+    if not isinstance(body, dict):
+        return {}
+    out = {k: body[k] for k in FLAG_FIELDS if k in body}
+    for k in TEXT_FIELDS:
+        value = body.get(k)
+        if isinstance(value, str) and value:
+            term = value.lower().strip()
+            out[k] = term if term in vocabulary() else "h:" + _hash(term)
+    return out
+
+def write(record: Dict[str, Any]):
+    line = json.dumps(record, separators=(",", ":")) + "\n"
+    with _lock:
+        with open(settings.CAPTURE_PATH, "a", encoding="utf-8") as f:
+            f.write(line)
@@ -1,7 +1,6 @@
+from content_engine import gating
+from app.config import settings
 from app.models import FaithMode
 
 def faith_allowed(mode: FaithMode, lightConsent: bool, hideInMind: bool) -> bool:
-    if hideInMind: return False
-    if mode == "off": return False
-    if mode == "light": return bool(lightConsent)
-    return True
+    return gating.faith_allowed(mode, lightConsent, hideInMind, settings.ALLOW_FAITH_IN_LIGHT_BY_DEFAULT)
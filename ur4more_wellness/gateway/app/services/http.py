@@ -0,0 +1,9 @@
+import httpx
+from typing import Optional
+
+# Outbound transport for every provider call. None means the real network;
+# benchmarks and tests install an httpx.MockTransport here.
+transport: Optional[httpx.AsyncBaseTransport] = None
+
+def http_client(timeout: float = 10.0) -> httpx.AsyncClient:
+    return httpx.AsyncClient(timeout=timeout, transport=transport)
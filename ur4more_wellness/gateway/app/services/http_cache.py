@@ -0,0 +1,71 @@
+import hashlib
+from typing import Dict
+from fastapi import Request, Response
+from app.config import settings
+from app.services.cache import cache
+from content_engine.compression import negotiate, compress
+from app.services.manifest import CORPUS_VERSION
+
+# Cache-Control / Vary per endpoint family. Every route requires a bearer token, so
+# responses are private: a shared cache must never hand them to a caller without one.
+# Content bodies depend on the POSTed request; manifest and sync bodies are the same
+# for every caller and may be kept longer.
+POLICIES: Dict[str, Dict[str, str]] = {
+    "manifest": {
+        "Cache-Control": f"private, max-age={settings.MANIFEST_MAX_AGE_SEC}, must-revalidate",
+        "Vary": "Authorization, Accept-Encoding",
+    },
+    "sync": {
+        "Cache-Control": f"private, max-age={settings.MANIFEST_MAX_AGE_SEC}, must-revalidate",
+        "Vary": "Authorization, Accept-Encoding",
+    },
+    "content": {
+        "Cache-Control": f"private, max-age={settings.CACHE_TTL_SEC}",
+        "Vary": "Authorization, Accept-Encoding",
+    },
+}
+
+def _digest(body: bytes) -> str:
+    h = hashlib.sha256(CORPUS_VERSION.encode())
+    h.update(body)
+    return h.hexdigest()[:32]
+
+def etag_for(body: str) -> str:
+    """Strong validator: hash of the corpus version plus the serialized body"""
+    return '"' + _digest(body.encode()) + '"'
+
+def _matches(header: str, digest: str) -> bool:
+    if header.strip() == "*":
+        return True
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        # Encoded variants carry a "-<coding>" suffix but validate the same content
+        if tag.strip('"').split("-", 1)[0] == digest:
+            return True
+    return False
+
+async def _encoded(digest: str, raw: bytes, encoding: str) -> bytes:
+    """Compressed variant of raw, compressed at most once per TTL and shared through the cache"""
+    key = f"cz:{digest}:{encoding}"
+    data = await cache.get_bytes(key)
+    if data is None:
+        data = compress(raw, encoding)
+        await cache.set_bytes(key, data, settings.COMPRESSED_TTL_SEC)
+    return data
+
+async def json_response(req: Request, body: str, policy: str = "content") -> Response:
+    """Serve an already-serialized JSON body with validators and content-coding; 304 when the client copy is current"""
+    raw = body.encode()
+    digest = _digest(raw)
+    encoding = negotiate(req.headers.get("accept-encoding")) if len(raw) >= settings.COMPRESS_MIN_BYTES else None
+    etag = f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+    headers = {"ETag": etag, **POLICIES[policy]}
+    inm = req.headers.get("if-none-match")
+    if inm and _matches(inm, digest):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        return Response(content=await _encoded(digest, raw, encoding), media_type="application/json", headers=headers)
+    return Response(content=raw, media_type="application/json", headers=headers)
@@ -1,13 +1,28 @@
-from datetime import datetime, timezone
+import hashlib, json
+from content_engine.corpus import CORPUS_STAMP
+from app.config import settings
 from app.providers.quotes_local import PD as LOCAL_QUOTES
 from app.providers.scripture_kjv_local import KJV_DB
 from app.services.allowlist import ALLOWLISTED_PROVIDERS
 
+def _corpus_version() -> str:
+    """Content hash of the local corpus and provider switches; changes only when the content does"""
+    corpus = {
+        "quotes": [q.model_dump() for q in LOCAL_QUOTES],
+        "scripture": {k: [p.model_dump() for p in v] for k, v in KJV_DB.items()},
+        "providers": {k: v["enabled"] for k, v in ALLOWLISTED_PROVIDERS.items()},
+    }
+    s = json.dumps(corpus, sort_keys=True, separators=(",",":"))
+    return hashlib.sha256(s.encode()).hexdigest()[:16]
+
+CORPUS_VERSION = _corpus_version()
+
 def build_manifest():
     themes = {k: {"passageCount": len(v)} for k, v in KJV_DB.items()}
     total_passages = sum(len(v) for v in KJV_DB.values())
     return {
         "schemaVersion": 1,
+        "corpusVersion": CORPUS_VERSION,
         "quotes": {
             "localCount": len(LOCAL_QUOTES),
             "externalProviders": {k: v["enabled"] for k, v in ALLOWLISTED_PROVIDERS.items()}
@@ -17,5 +32,5 @@ def build_manifest():
             "totalPassages": total_passages,
             "themes": themes
         },
-        "updatedAt": datetime.now(timezone.utc).isoformat()
+        "updatedAt": settings.CORPUS_UPDATED_AT or CORPUS_STAMP
     }
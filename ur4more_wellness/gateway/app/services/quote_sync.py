@@ -0,0 +1,47 @@
+import json, os
+from typing import Optional
+from app.config import settings
+from app.services.cache import cache
+
+def _read(path: str) -> Optional[dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+async def _index() -> Optional[dict]:
+    cached = await cache.get("qs:index")
+    if cached:
+        return json.loads(cached)
+    index = _read(os.path.join(settings.QUOTES_SYNC_DIR, "index.json"))
+    if index:
+        await cache.set("qs:index", index)
+    return index
+
+async def current_version() -> Optional[str]:
+    """Corpus version the sync directory currently targets"""
+    index = await _index()
+    return index.get("current") if index else None
+
+async def delta_body(since: str) -> Optional[str]:
+    """Serialized delta from `since` to the current corpus version; None when sync is unavailable"""
+    index = await _index()
+    current = index.get("current") if index else None
+    if not current:
+        return None
+    if since == current:
+        return json.dumps({"from": since, "to": current, "added": [], "changed": [], "removed": []})
+    if since not in {v.get("version") for v in index.get("versions", [])}:
+        # Too old or never published: the client has to reload the full shard set. Not cached,
+        # so arbitrary `since` values cannot fill the cache
+        return json.dumps({"from": since, "to": current, "reset": True})
+
+    key = f"qs:{since}:{current}"
+    cached = await cache.get(key)
+    if cached:
+        return cached
+    delta = _read(os.path.join(settings.QUOTES_SYNC_DIR, "deltas", f"{since}__{current}.json"))
+    if delta is None:
+        delta = {"from": since, "to": current, "reset": True}
+    return await cache.set(key, delta, settings.SYNC_TTL_SEC)
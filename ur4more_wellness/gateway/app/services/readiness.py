@@ -0,0 +1,114 @@
+import asyncio, json, time
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+import httpx
+from app.config import settings
+from app.services.allowlist import ALLOWLISTED_PROVIDERS
+from app.services.cache import cache
+
+class Startup:
+    """Startup stages run after the process starts accepting connections; /ready stays 503 until they finish.
+
+    Each stage records whether it succeeded, how long it took and a short detail; a stage that
+    checks nothing sets checked=False and reports ok as null. Stages named in `optional` are
+    reported but do not hold readiness back (the gateway serves without them). Under app.serve
+    only one worker runs the prewarm stage when the cache is shared (prewarm=False elsewhere)."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.optional = {"redis", "providers"}
+        self.task: Optional[asyncio.Task] = None
+        self.prewarm = True
+
+    @asynccontextmanager
+    async def stage(self, name: str):
+        entry: Dict[str, Any] = {"ok": None}
+        self.stages[name] = entry
+        t0 = time.perf_counter()
+        try:
+            yield entry
+            if entry["ok"] is None and entry.get("checked", True):
+                entry["ok"] = True
+        except Exception as e:
+            entry.update(ok=False, error=repr(e))
+        entry["ms"] = round((time.perf_counter() - t0) * 1000, 1)
+
+    @property
+    def ready(self) -> bool:
+        return self.finished is not None and all(s["ok"] for n, s in self.stages.items() if n not in self.optional)
+
+    def report(self) -> Dict[str, Any]:
+        breaker = cache.breaker.state if cache.r else None
+        return {
+            "ready": self.ready and (breaker != "open" or not settings.READY_REQUIRE_REDIS),
+            "startupMs": round(((self.finished or time.monotonic()) - self.started) * 1000, 1),
+            "stages": self.stages,
+            "cache": cache.status(),
+        }
+
+startup = Startup()
+
+def _prewarm_requests(path: str, n: int) -> List[Dict[str, Any]]:
+    """The n most frequent (method, path, query, body) shapes in a capture file (CAPTURE_PATH format)"""
+    counts: Counter = Counter()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                r = json.loads(line)
+            except ValueError:
+                continue
+            if r.get("s", 200) == 200:
+                counts[json.dumps([r["m"], r["p"], r.get("q", ""), r.get("b")], sort_keys=True)] += 1
+    return [dict(zip(("m", "p", "q", "b"), json.loads(k))) for k, _ in counts.most_common(n)]
+
+async def prewarm(app, requests: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Send requests through the app in-process so their responses land in the cache"""
+    import jwt
+    now = int(time.time())
+    claims = {"sub": "prewarm", "iss": settings.JWT_ISS, "aud": settings.JWT_AUD, "iat": now, "exp": now + 600}
+    headers = {"Authorization": "Bearer " + jwt.encode(claims, settings.JWT_SECRET_V1, algorithm="HS256", headers={"kid": settings.JWT_KID})}
+    statuses: Counter = Counter()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://prewarm", headers=headers) as client:
+        for r in requests:
+            url = r["p"] + ("?" + r["q"] if r["q"] else "")
+            resp = await (client.post(url, json=r["b"] or {}) if r["m"] == "POST" else client.get(url))
+            statuses[str(resp.status_code)] += 1
+    return dict(statuses)
+
+async def run(app):
+    from app.services import capture, static_files
+    from app.services.manifest import CORPUS_VERSION, LOCAL_QUOTES, KJV_DB, build_manifest
+    from app.services.quote_sync import current_version
+
+    async with startup.stage("corpus") as s:
+        await asyncio.to_thread(capture.vocabulary)
+        s.update(version=CORPUS_VERSION, quotes=len(LOCAL_QUOTES), passages=sum(len(v) for v in KJV_DB.values()))
+    async with startup.stage("index") as s:
+        await asyncio.to_thread(build_manifest)
+        s.update(shards=len(await asyncio.to_thread(static_files.manifest_checksums)), syncVersion=await current_version())
+    async with startup.stage("cache") as s:
+        s["warmedKeys"] = await cache.warm()
+    async with startup.stage("redis") as s:
+        s["ok"] = await cache.ping()
+        s["breaker"] = cache.breaker.state if cache.r else None
+    async with startup.stage("providers") as s:
+        # Providers have no circuit breakers, so there is no state to check: list what the fan-out will call
+        s.update(checked=False, detail="providers have no circuit breakers; listed, not checked",
+                 external=settings.ENABLE_EXTERNAL, simulator=settings.PROVIDER_SIMULATOR_URL,
+                 enabled=sorted(k for k, v in ALLOWLISTED_PROVIDERS.items() if v["enabled"]))
+    if settings.READY_PREWARM_FILE and settings.READY_PREWARM_KEYS > 0:
+        async with startup.stage("prewarm") as s:
+            if not startup.prewarm:
+                s["skipped"] = "another worker prewarms the shared cache"
+            else:
+                requests = await asyncio.to_thread(_prewarm_requests, settings.READY_PREWARM_FILE, settings.READY_PREWARM_KEYS)
+                s.update(requests=len(requests), statuses=await prewarm(app, requests))
+    startup.finished = time.monotonic()
+    print(f"[startup] ready={startup.ready} in {startup.report()['startupMs']}ms: "
+          + ", ".join(f"{n} {s['ms']}ms" for n, s in startup.stages.items()), flush=True)
+
+def start(app):
+    startup.task = asyncio.get_running_loop().create_task(run(app))
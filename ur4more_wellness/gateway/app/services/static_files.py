@@ -0,0 +1,160 @@
+import hashlib, json, os, re
+from typing import Any, Dict, Optional, Tuple
+from fastapi import Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from app.config import settings
+from content_engine.compression import negotiate
+
+CHUNK = 64 * 1024
+SAFE_NAME = re.compile(r"^[A-Za-z0-9_\-]+\.json$")
+CACHE_CONTROL = "private, max-age=3600, must-revalidate"  # shard routes require auth
+
+# (path, mtime, size) -> sha256, for files the manifest has no checksum for
+_checksums: Dict[Tuple[str, float, int], str] = {}
+
+# manifest.json parsed once per (mtime, size), with its checksums and per-mode bodies
+_manifest: Dict[str, Any] = {"key": None, "data": {}, "checksums": {}, "modes": {}}
+
+def shard_path(name: str) -> Optional[str]:
+    """Absolute path of a shard file, or None for anything outside the shard directory"""
+    if not SAFE_NAME.match(name):
+        return None
+    path = os.path.join(settings.QUOTES_ASSETS_DIR, "shards", name)
+    return path if os.path.isfile(path) else None
+
+def _read_manifest() -> Dict[str, Any]:
+    """The parsed manifest; re-read only when the file's mtime or size changes"""
+    path = os.path.join(settings.QUOTES_ASSETS_DIR, "manifest.json")
+    try:
+        st = os.stat(path)
+        key = (path, st.st_mtime, st.st_size)
+    except OSError:
+        key = None
+    if key != _manifest["key"]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        checksums = {os.path.basename(k): v for k, v in data.get("checksums", {}).items()}
+        _manifest.update(key=key, data=data, checksums=checksums, modes={})
+    return _manifest["data"]
+
+def manifest_checksums() -> Dict[str, str]:
+    """Shard checksums recorded by tools/quotes_shard.py, keyed by file name"""
+    _read_manifest()
+    return _manifest["checksums"]
+
+def mode_manifest(mode: str) -> Optional[str]:
+    """The shard manifest, serialized, cut down to the shards a client in faith mode "off" or
+    "faith" needs (the manifest's modes index); None for an unknown mode. Manifests from the
+    older count-based sharder have no index, so every shard is listed."""
+    data = _read_manifest()
+    if mode not in _manifest["modes"]:
+        body = _mode_manifest(data, mode)
+        if body is None:
+            return None
+        _manifest["modes"][mode] = json.dumps(body)
+    return _manifest["modes"][mode]
+
+def _mode_manifest(data: Dict[str, Any], mode: str) -> Optional[Dict[str, Any]]:
+    modes = data.get("modes")
+    if modes is None:
+        if mode not in ("off", "faith"):
+            return None
+        files = data.get("files", [])
+    elif mode not in modes:
+        return None
+    else:
+        files = modes[mode]["files"]
+    keep = set(files)
+    return {
+        "version": data.get("version", 1),
+        "corpus_version": data.get("corpus_version"),
+        "mode": mode,
+        "shard_count": len(files),
+        "files": files,
+        "checksums": {k: v for k, v in data.get("checksums", {}).items() if k in keep},
+        "shards": [e for e in data.get("shards", []) if e.get("file") in keep],
+    }
+
+def file_checksum(path: str) -> str:
+    st = os.stat(path)
+    key = (path, st.st_mtime, st.st_size)
+    if key not in _checksums:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(CHUNK), b""):
+                h.update(block)
+        _checksums[key] = h.hexdigest()
+    return _checksums[key]
+
+def parse_range(header: str, size: int):
+    """Single byte range as (start, end) inclusive; None to send the whole file; "invalid" when unsatisfiable"""
+    if not header.startswith("bytes=") or "," in header:
+        return None  # multi-range is optional for servers; send the full body
+    start_s, _, end_s = header[6:].strip().partition("-")
+    try:
+        if start_s == "":
+            length = int(end_s)
+            if length <= 0:
+                return "invalid"
+            return max(0, size - length), size - 1
+        start = int(start_s)
+        end = int(end_s) if end_s else size - 1
+    except ValueError:
+        return None
+    if start >= size or end < start:
+        return "invalid"
+    return start, min(end, size - 1)
+
+def _read_slice(path: str, start: int, end: int):
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            block = f.read(min(CHUNK, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            yield block
+
+def file_response(req: Request, path: str, checksum: str) -> Response:
+    """Serve a file from disk with a strong ETag, precompressed siblings and Range support"""
+    encoding = negotiate(req.headers.get("accept-encoding"))
+    sibling = {"br": ".br", "gzip": ".gz"}.get(encoding or "")
+    if sibling and os.path.isfile(path + sibling):
+        path = path + sibling
+    else:
+        encoding = None
+
+    etag = f'"{checksum}-{encoding}"' if encoding else f'"{checksum}"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Authorization, Accept-Encoding", "Accept-Ranges": "bytes"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+
+    inm = req.headers.get("if-none-match")
+    if inm and (inm.strip() == "*" or etag in [t.strip().removeprefix("W/") for t in inm.split(",")]):
+        return Response(status_code=304, headers=headers)
+
+    # Let the front proxy (nginx X-Accel-Redirect, Apache X-Sendfile) stream the bytes with sendfile
+    if settings.SENDFILE_HEADER:
+        rel = os.path.relpath(path, settings.QUOTES_ASSETS_DIR).replace(os.sep, "/")
+        headers[settings.SENDFILE_HEADER] = settings.SENDFILE_PREFIX + rel
+        return Response(status_code=200, media_type="application/json", headers=headers)
+
+    size = os.path.getsize(path)
+    rng = req.headers.get("range")
+    if_range = req.headers.get("if-range")
+    if rng and (not if_range or if_range.strip() == etag):
+        parsed = parse_range(rng, size)
+        if parsed == "invalid":
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+        if parsed:
+            start, end = parsed
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(_read_slice(path, start, end), status_code=206, media_type="application/json", headers=headers)
+
+    # Whole file: FileResponse hands the path to the server (pathsend) where supported
+    return FileResponse(path, media_type="application/json", headers=headers)
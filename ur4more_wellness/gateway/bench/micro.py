@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the per-request CPU work: cache keys, ranking, filtering,
+faith gating and JWT verification, over synthetic corpora of 100, 10k and 100k quotes.
+
+    python -m bench.micro                           # print results
+    python -m bench.micro --sizes 100,10000 --json out.json
+    python -m bench.micro --record                  # append to bench/history/micro.jsonl
+    python -m bench.micro --check                   # compare with the last recorded run, exit 1 on regression
+
+Timing follows timeit: each sample runs enough loops to last --min-time, the
+best and median of --repeat samples are reported. Corpus benchmarks also report
+ns per quote so the 100 -> 100k columns show how cost scales.
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import jwt
+
+from app.config import settings
+from app.deps import make_cache_key
+from app.models import QuoteItem, QuoteRequest
+from app.services.auth import require_auth
+from app.services.filters import contains_profanity, filter_quote
+from app.services.gating import faith_allowed
+from app.services.rank import rank_quotes
+
+HISTORY = Path(__file__).with_name("history") / "micro.jsonl"
+SIZES = [100, 10_000, 100_000]
+
+WORDS = ("hope peace patience courage wisdom grace strength rest light truth love joy kindness mercy "
+         "the a of and in to is be with for not all that your heart mind soul day walk way life").split()
+TAGS = ["wisdom", "hope", "peace", "courage", "faith", "temperance", "love", "growth", "rest", "strength"]
+LICENSES = ["public_domain", "public_domain", "public_domain", "by", "by-nc", "unknown"]
+
+def make_corpus(n: int, seed: int = 0) -> List[QuoteItem]:
+    """n synthetic quotes: ~30% faith-tagged, ~1% profane, ~5% over the 180-char limit"""
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        words = rng.choices(WORDS, k=rng.randint(6, 40 if rng.random() < 0.05 else 24))
+        if rng.random() < 0.01:
+            words.insert(rng.randrange(len(words)), "shit")
+        tags = rng.sample(TAGS, 3)
+        if rng.random() < 0.3 and "faith" not in tags:
+            tags[0] = "faith"
+        items.append(QuoteItem(id=f"syn_{i}", text=" ".join(words).capitalize() + ".", author=f"Author {i % 997}",
+                               license=rng.choice(LICENSES), tags=tags))
+    return items
+
+def _token() -> str:
+    now = int(time.time())
+    payload = {"sub": "bench", "iss": settings.JWT_ISS, "aud": settings.JWT_AUD, "iat": now, "exp": now + 3600}
+    return "Bearer " + jwt.encode(payload, settings.JWT_SECRET_V1, algorithm="HS256", headers={"kid": settings.JWT_KID})
+
+def benchmarks(sizes: List[int]) -> Dict[str, tuple]:
+    """name -> (callable, items processed per call)"""
+    body = QuoteRequest(faithMode="light", lightConsentGiven=True, topic="hope", limit=5).model_dump()
+    auth = _token()
+    out: Dict[str, tuple] = {
+        "make_cache_key": (lambda: make_cache_key("/quotes", body), 1),
+        "faith_allowed": (lambda: faith_allowed("light", True, False), 1),
+        "jwt_decode": (lambda: require_auth(auth), 1),
+    }
+    for n in sizes:
+        corpus = make_corpus(n)
+        texts = [q.text for q in corpus]
+        out[f"rank_quotes[{n}]"] = (lambda c=corpus: rank_quotes(c, "hope"), n)
+        out[f"filter_quote[{n}]"] = (lambda c=corpus: [filter_quote(q, False) for q in c], n)
+        out[f"contains_profanity[{n}]"] = (lambda t=texts: [contains_profanity(x) for x in t], n)
+    return out
+
+def measure(fn: Callable[[], object], min_time: float, repeat: int) -> List[float]:
+    """Seconds per call for each of `repeat` samples"""
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        took = time.perf_counter() - t0
+        if took >= min_time:
+            break
+        loops = max(loops * 2, int(loops * min_time / max(took, 1e-9)))
+    samples = [took / loops]
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - t0) / loops)
+    return samples
+
+def run(sizes: List[int], min_time: float = 0.2, repeat: int = 5, only: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, (fn, items) in benchmarks(sizes).items():
+        if only and only not in name:
+            continue
+        samples = measure(fn, min_time, repeat)
+        median = statistics.median(samples)
+        results[name] = {
+            "best_us": round(min(samples) * 1e6, 3),
+            "median_us": round(median * 1e6, 3),
+            "stdev_us": round(statistics.pstdev(samples) * 1e6, 3),
+            "items": items,
+            "ns_per_item": round(median * 1e9 / items, 1),
+        }
+    return results
+
+def scaling(results: Dict[str, Dict[str, float]], factor: float) -> List[str]:
+    """Corpus benchmarks whose per-quote cost at the largest size is `factor`x the smallest (superlinear)"""
+    families: Dict[str, Dict[int, float]] = {}
+    for name, r in results.items():
+        if "[" in name:
+            base, _, n = name.partition("[")
+            families.setdefault(base, {})[int(n.rstrip("]"))] = r["ns_per_item"]
+    problems = []
+    for base, by_size in families.items():
+        small, large = min(by_size), max(by_size)
+        if large > small and by_size[small] > 0 and by_size[large] > by_size[small] * factor:
+            problems.append(f"{base}: {by_size[large]}ns/quote at {large} vs {by_size[small]}ns/quote at {small}")
+    return problems
+
+def compare(results: Dict[str, Dict[str, float]], previous: Dict[str, Dict[str, float]], threshold: float) -> List[str]:
+    """Benchmarks whose best sample is slower than the recorded best by more than threshold (best is the least noisy)"""
+    problems = []
+    for name, r in results.items():
+        old = previous.get(name)
+        if old and r["best_us"] > old["best_us"] * (1 + threshold):
+            problems.append(f"{name}: {r['best_us']}us vs {old['best_us']}us ({r['best_us'] / old['best_us'] - 1:+.0%})")
+    return problems
+
+def _git_rev() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+def last_recorded(path: Path) -> Optional[Dict]:
+    if not path.exists():
+        return None
+    lines = [l for l in path.read_text(encoding="utf-8").splitlines() if l.strip()]
+    return json.loads(lines[-1]) if lines else None
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="UR4MORE gateway micro-benchmarks")
+    ap.add_argument("--sizes", default=",".join(str(s) for s in SIZES), help="corpus sizes, comma separated")
+    ap.add_argument("--min-time", type=float, default=0.2, help="seconds per sample")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--only", help="run benchmarks whose name contains this")
+    ap.add_argument("--json", help="write results to this file")
+    ap.add_argument("--history", default=str(HISTORY), help="JSONL of recorded runs")
+    ap.add_argument("--record", action="store_true", help="append this run to --history")
+    ap.add_argument("--check", action="store_true", help="exit 1 on regressions against the last recorded run")
+    ap.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown as a fraction")
+    ap.add_argument("--scaling-factor", type=float, default=5.0, help="flag per-quote cost growing more than this across sizes")
+    args = ap.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    results = run(sizes, args.min_time, args.repeat, args.only)
+    run_info = {
+        "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git": _git_rev(),
+        "python": platform.python_version(),
+        "machine": platform.node(),
+        "results": results,
+    }
+
+    print(f"{'benchmark':<30}{'best us':>12}{'median us':>12}{'stdev us':>10}{'ns/item':>12}")
+    for name, r in results.items():
+        print(f"{name:<30}{r['best_us']:>12}{r['median_us']:>12}{r['stdev_us']:>10}{r['ns_per_item']:>12}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(run_info, indent=2))
+
+    problems = scaling(results, args.scaling_factor)
+    previous = last_recorded(Path(args.history))
+    if previous:
+        problems += compare(results, previous["results"], args.threshold)
+        print(f"\nCompared with {previous.get('git') or 'unknown rev'} recorded {previous['ts']}")
+
+    if args.record:
+        history = Path(args.history)
+        history.parent.mkdir(parents=True, exist_ok=True)
+        with open(history, "a", encoding="utf-8") as f:
+            f.write(json.dumps(run_info, separators=(",", ":")) + "\n")
+        print(f"Recorded to {history}")
+
+    if problems:
+        print("\nRegressions:")
+        for p in problems:
+            print(f"  - {p}")
+        return 1 if args.check else 0
+    print("\nNo regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+Stand-ins for every external provider either gateway calls.
+
+Each stub answers with the response shape the matching parser expects:
+app/providers/*_external.py here, and EXTERNAL_WISDOM_PROVIDERS /
+EXTERNAL_BIBLE_PROVIDERS in gateway_flask/app.py. Latency, failures and
+slow-drip bodies come from a profile so runs are repeatable for a given seed.
+The same responders back the in-process MockTransport (bench/run.py) and the
+standalone HTTP simulator (bench/simulator.py).
+"""
+import asyncio
+import math
+import random
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from app.services.allowlist import ALLOWLISTED_PROVIDERS
+
+# Per-provider behaviour. Latency is drawn from `dist`:
+#   uniform    latency_ms + U(0, jitter_ms)
+#   normal     N(latency_ms, jitter_ms), clipped at 0
+#   lognormal  median latency_ms, spread sigma = jitter_ms / latency_ms (long tail)
+# A `drip_rate` share of successful responses is sent at drip_bytes_per_sec.
+PROFILES: Dict[str, Dict[str, float]] = {
+    "instant":   {"dist": "uniform",   "latency_ms": 0,   "jitter_ms": 0,   "error_rate": 0.0,  "not_found_rate": 0.0,  "rate_limit_rate": 0.0,  "drip_rate": 0.0,  "drip_bytes_per_sec": 0},
+    "fast":      {"dist": "uniform",   "latency_ms": 5,   "jitter_ms": 5,   "error_rate": 0.0,  "not_found_rate": 0.0,  "rate_limit_rate": 0.0,  "drip_rate": 0.0,  "drip_bytes_per_sec": 0},
+    "realistic": {"dist": "uniform",   "latency_ms": 80,  "jitter_ms": 120, "error_rate": 0.02, "not_found_rate": 0.02, "rate_limit_rate": 0.01, "drip_rate": 0.0,  "drip_bytes_per_sec": 0},
+    "soak":      {"dist": "lognormal", "latency_ms": 120, "jitter_ms": 90,  "error_rate": 0.03, "not_found_rate": 0.02, "rate_limit_rate": 0.05, "drip_rate": 0.05, "drip_bytes_per_sec": 2048},
+    "degraded":  {"dist": "uniform",   "latency_ms": 400, "jitter_ms": 800, "error_rate": 0.15, "not_found_rate": 0.05, "rate_limit_rate": 0.1,  "drip_rate": 0.1,  "drip_bytes_per_sec": 512},
+}
+
+VERSES = [
+    ("John 3:16", "For God so loved the world, that he gave his only begotten Son."),
+    ("Psalm 23:1", "The Lord is my shepherd; I shall not want."),
+    ("Philippians 4:13", "I can do all things through Christ which strengtheneth me."),
+    ("Proverbs 3:5", "Trust in the Lord with all thine heart; and lean not unto thine own understanding."),
+]
+
+QUOTES = [
+    ("Well begun is half done.", "Aristotle"),
+    ("The journey of a thousand miles begins with one step.", "Lao Tzu"),
+    ("Know thyself.", "Socrates"),
+    ("Waste no more time arguing what a good man should be. Be one.", "Marcus Aurelius"),
+]
+
+def _quotable(req: httpx.Request, rng: random.Random) -> httpx.Response:
+    def one():
+        text, author = rng.choice(QUOTES)
+        return {"_id": f"q{rng.randrange(10**6)}", "content": text, "author": author, "tags": ["wisdom"]}
+    if req.url.path.endswith("/random"):
+        return httpx.Response(200, json=one())
+    # /quotes and /search/quotes list endpoints (Flask reads "results")
+    count = min(int(req.url.params.get("limit", 10)), 50)
+    return httpx.Response(200, json={"count": count, "results": [one() for _ in range(count)]})
+
+def _zenquotes(req: httpx.Request, rng: random.Random) -> httpx.Response:
+    count = 1 if req.url.path.endswith("/today") else 3 if req.url.path.endswith("/random") else 10
+    return httpx.Response(200, json=[{"q": t, "a": a} for t, a in (rng.choice(QUOTES) for _ in range(count))])
+
+def _quotegarden(req: httpx.Request, rng: random.Random) -> httpx.Response:
+    def one():
+        text, author = rng.choice(QUOTES)
+        return {"_id": f"g{rng.randrange(10**6)}", "quoteText": text, "quoteAuthor": author}
+    if req.url.path.endswith("/random"):
+        return httpx.Response(200, json={"statusCode": 200, "data": one()})
+    count = min(int(req.url.params.get("limit", 10)), 50)
+    return httpx.Response(200, json={"statusCode": 200, "totalQuotes": count, "data": [one() for _ in range(count)]})
+
+def _reference_text(req: httpx.Request, rng: random.Random) -> httpx.Response:
+    ref, text = rng.choice(VERSES)
+    return httpx.Response(200, json={"reference": ref, "text": text})
+
+def _labs_bible(req: httpx.Request, rng: random.Random) -> httpx.Response:
+    ref, text = rng.choice(VERSES)
+    if req.url.params.get("type") == "json":
+        book, _, cv = ref.rpartition(" ")
+        chapter, _, verse = cv.partition(":")
+        return httpx.Response(200, json=[{"bookname": book, "chapter": chapter, "verse": verse, "text": text}])
+    return httpx.Response(200, text=f"{ref} - {text}")
+
+def _bible_gateway_votd(req: httpx.Request, rng: random.Random) -> httpx.Response:
+    ref, text = rng.choice(VERSES)
+    return httpx.Response(200, json={"votd": {"content": text, "display_ref": ref}})
+
+def _empty(req: httpx.Request, rng: random.Random) -> httpx.Response:
+    return httpx.Response(200, json={})
+
+RESPONDERS: Dict[str, Callable[[httpx.Request, random.Random], httpx.Response]] = {
+    "quotable": _quotable,
+    "zenquotes": _zenquotes,
+    "quotegarden": _quotegarden,
+    "scripture_api": _reference_text,
+    "bible_api_wldeh": _reference_text,
+    "labs_bible": _labs_bible,
+    "bible_gateway_votd": _bible_gateway_votd,
+    "prayer_api": _empty,
+    "devotional_api": _empty,
+}
+
+def provider_for(url: httpx.URL) -> str:
+    """Name of the allowlisted provider whose upstream base_url the request targets"""
+    for name, cfg in ALLOWLISTED_PROVIDERS.items():
+        base = urlparse(cfg.get("upstream_base_url", cfg["base_url"]))
+        if url.host == base.hostname and url.path.startswith(base.path):
+            return name
+    # Flask URLs that sit outside an allowlisted base path (e.g. biblegateway /votd/get)
+    for name, cfg in ALLOWLISTED_PROVIDERS.items():
+        if url.host == urlparse(cfg.get("upstream_base_url", cfg["base_url"])).hostname:
+            return name
+    return ""
+
+def sample_latency(p: Dict[str, float], rng: random.Random) -> float:
+    """Delay in ms for one response under profile p"""
+    base, spread = p["latency_ms"], p["jitter_ms"]
+    dist = p.get("dist", "uniform")
+    if dist == "normal":
+        return max(0.0, rng.gauss(base, spread))
+    if dist == "lognormal" and base > 0:
+        return base * math.exp(rng.gauss(0, spread / base))
+    return base + rng.random() * spread
+
+def fault_for(p: Dict[str, float], rng: random.Random) -> Optional[httpx.Response]:
+    """Injected failure for this request, or None to answer normally"""
+    roll = rng.random()
+    if roll < p["error_rate"]:
+        return httpx.Response(500, text="stub error")
+    roll -= p["error_rate"]
+    if roll < p["not_found_rate"]:
+        return httpx.Response(404, text="not found")
+    roll -= p["not_found_rate"]
+    if roll < p["rate_limit_rate"]:
+        return httpx.Response(429, headers={"Retry-After": "1"}, text="slow down")
+    return None
+
+def respond(req: httpx.Request, p: Dict[str, float], rng: random.Random) -> httpx.Response:
+    """Fault or stub response for one request (latency and drip are the caller's job)"""
+    fault = fault_for(p, rng)
+    if fault is not None:
+        return fault
+    responder = RESPONDERS.get(provider_for(req.url))
+    return responder(req, rng) if responder else httpx.Response(404, text="unknown provider")
+
+def should_drip(p: Dict[str, float], rng: random.Random) -> bool:
+    return p.get("drip_rate", 0) > 0 and p.get("drip_bytes_per_sec", 0) > 0 and rng.random() < p["drip_rate"]
+
+async def _drip(body: bytes, bytes_per_sec: float, chunk: int = 256):
+    for i in range(0, len(body), chunk):
+        await asyncio.sleep(min(chunk, len(body) - i) / bytes_per_sec)
+        yield body[i:i + chunk]
+
+def make_transport(profile: str = "fast", seed: int = 0, stats: Dict[str, int] = None) -> httpx.MockTransport:
+    """MockTransport that plays every allowlisted provider under the given profile"""
+    p = PROFILES[profile]
+    rng = random.Random(seed)
+
+    async def handler(req: httpx.Request) -> httpx.Response:
+        if stats is not None:
+            name = provider_for(req.url) or "unknown"
+            stats[name] = stats.get(name, 0) + 1
+        delay = sample_latency(p, rng)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        resp = respond(req, p, rng)
+        if resp.status_code == 200 and should_drip(p, rng):
+            body = resp.content
+            headers = {k: v for k, v in resp.headers.items() if k.lower() != "content-length"}
+            return httpx.Response(200, headers=headers, content=_drip(body, p["drip_bytes_per_sec"]))
+        return resp
+
+    return httpx.MockTransport(handler)
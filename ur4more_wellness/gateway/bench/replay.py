@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Replay a captured workload (CAPTURE_SAMPLE_RATE on either gateway) and report
+latency percentiles and cache efficiency.
+
+    python -m bench.replay capture.jsonl                                   # in-process FastAPI app, stub providers
+    python -m bench.replay capture.jsonl --target http://127.0.0.1:8080 --speedup 10
+    python -m bench.replay capture.jsonl --target http://127.0.0.1:5000 --speedup 0   # Flask, as fast as possible
+
+Requests keep their captured spacing divided by --speedup (0 sends them back to back).
+Each captured user gets its own token, and requests captured with If-None-Match
+revalidate against the ETag that user last received for the same request.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional
+
+import httpx
+import jwt
+
+from app.config import settings
+from bench.run import percentile
+
+def load(path: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue  # a torn last line from a live capture
+            if limit and len(records) >= limit:
+                break
+    records.sort(key=lambda r: r.get("t", 0))
+    return records
+
+def _token(sub: str) -> str:
+    now = int(time.time())
+    payload = {"sub": sub, "iss": settings.JWT_ISS, "aud": settings.JWT_AUD, "iat": now, "exp": now + 6 * 3600}
+    return jwt.encode(payload, settings.JWT_SECRET_V1, algorithm="HS256", headers={"kid": settings.JWT_KID})
+
+def _summary(ms: List[float]) -> Dict[str, float]:
+    ms = sorted(ms)
+    return {"count": len(ms), "p50_ms": round(percentile(ms, 50), 2), "p95_ms": round(percentile(ms, 95), 2), "p99_ms": round(percentile(ms, 99), 2)}
+
+def _hit_ratio(counts: Counter) -> Optional[float]:
+    total = counts["hit"] + counts["miss"] + counts["partial"]
+    return round((counts["hit"] + 0.5 * counts["partial"]) / total, 3) if total else None
+
+async def replay(client: httpx.AsyncClient, records: List[Dict[str, Any]], speedup: float, concurrency: int) -> Dict[str, Any]:
+    sem = asyncio.Semaphore(concurrency)
+    tokens: Dict[str, str] = {}
+    etags: Dict[tuple, str] = {}
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    lag: List[float] = []
+    statuses: Counter = Counter()
+    replay_cache: Counter = Counter()
+    captured_cache: Counter = Counter()
+    conditional = Counter()
+    received = 0
+
+    t_first = records[0].get("t", 0) if records else 0
+    start = time.perf_counter()
+
+    async def one(rec: Dict[str, Any]):
+        nonlocal received
+        due = (rec.get("t", t_first) - t_first) / speedup if speedup > 0 else 0
+        wait = start + due - time.perf_counter()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        user = rec.get("u") or "anon"
+        if user not in tokens:
+            tokens[user] = _token(f"replay-{user}")
+        headers = {"Authorization": f"Bearer {tokens[user]}", "Accept-Encoding": "gzip, br"}
+        ident = (user, rec["m"], rec["p"], rec.get("q"), json.dumps(rec.get("b"), sort_keys=True))
+        url = rec["p"] + ("?" + rec["q"] if rec.get("q") else "")
+        async with sem:
+            # Looked up once a slot is free, so an earlier response for this user can supply the ETag
+            if rec.get("inm") and ident in etags:
+                headers["If-None-Match"] = etags[ident]
+            lag.append(max(0.0, (time.perf_counter() - start - due) * 1000))
+            t0 = time.perf_counter()
+            try:
+                r = await client.request(rec["m"], url, json=rec.get("b") if rec["m"] == "POST" else None, headers=headers)
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+                return
+            latencies[rec["p"]].append((time.perf_counter() - t0) * 1000)
+        statuses[str(r.status_code)] += 1
+        received += len(r.content)
+        if r.headers.get("etag"):
+            etags[ident] = r.headers["etag"]
+        if r.headers.get("x-cache"):
+            replay_cache[r.headers["x-cache"]] += 1
+        if rec.get("c"):
+            captured_cache[rec["c"]] += 1
+        if "If-None-Match" in headers:
+            conditional["sent"] += 1
+            conditional["not_modified"] += r.status_code == 304
+
+    await asyncio.gather(*(one(rec) for rec in records))
+    wall = time.perf_counter() - start
+
+    everything = [ms for values in latencies.values() for ms in values]
+    return {
+        "requests": len(records),
+        "wall_sec": round(wall, 2),
+        "rps": round(len(records) / wall, 1) if wall else 0.0,
+        "statuses": dict(statuses),
+        "latency": _summary(everything),
+        "by_path": {p: _summary(v) for p, v in sorted(latencies.items())},
+        "schedule_lag_p95_ms": round(percentile(sorted(lag), 95), 2),
+        "cache": {
+            "replay": dict(replay_cache),
+            "replay_hit_ratio": _hit_ratio(replay_cache),
+            "captured_hit_ratio": _hit_ratio(captured_cache),
+            "conditional_sent": conditional["sent"],
+            "not_modified": conditional["not_modified"],
+        },
+        "bytes_received": received,
+    }
+
+async def _run(args, records) -> Dict[str, Any]:
+    if args.target == "inproc":
+        from app.main import app
+        from app.services import http as outbound
+        from bench.providers import make_transport
+        settings.ENABLE_EXTERNAL = True
+        outbound.transport = make_transport(args.profile, args.seed)
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://replay"
+    else:
+        transport = None
+        base_url = args.target
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=args.timeout, limits=limits) as client:
+        return await replay(client, records, args.speedup, args.concurrency)
+
+def main(argv=None) -> int:
+    from bench.providers import PROFILES
+    ap = argparse.ArgumentParser(description="Replay a captured UR4MORE gateway workload")
+    ap.add_argument("capture", help="JSONL written by CAPTURE_PATH")
+    ap.add_argument("--target", default="inproc", help="gateway base URL, or 'inproc' for the FastAPI app with stub providers")
+    ap.add_argument("--speedup", type=float, default=1.0, help="divide captured gaps by this (0 = no pacing)")
+    ap.add_argument("--concurrency", type=int, default=64)
+    ap.add_argument("--limit", type=int, help="replay only the first N records")
+    ap.add_argument("--timeout", type=float, default=30.0)
+    ap.add_argument("--profile", choices=sorted(PROFILES), default="fast", help="stub provider profile for inproc")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--json", help="also write the report to this file")
+    args = ap.parse_args(argv)
+
+    records = load(args.capture, args.limit)
+    if not records:
+        print(f"No records in {args.capture}")
+        return 1
+
+    if args.target == "inproc":
+        import contextlib, io
+        with contextlib.redirect_stdout(io.StringIO()):  # provider fetch logging
+            report = asyncio.run(_run(args, records))
+    else:
+        report = asyncio.run(_run(args, records))
+
+    lat, cache = report["latency"], report["cache"]
+    print(f"Replayed {report['requests']} requests in {report['wall_sec']}s ({report['rps']} req/s), schedule lag p95 {report['schedule_lag_p95_ms']}ms")
+    print(f"Statuses: {report['statuses']}")
+    print(f"{'path':<36}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for path, s in list(report["by_path"].items()) + [("all", lat)]:
+        print(f"{path:<36}{s['count']:>8}{s['p50_ms']:>10}{s['p95_ms']:>10}{s['p99_ms']:>10}")
+    print(f"Cache: replay hit ratio {cache['replay_hit_ratio']} {cache['replay']} (captured {cache['captured_hit_ratio']}), "
+          f"304s {cache['not_modified']}/{cache['conditional_sent']} conditional, {report['bytes_received']} bytes received")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Gateway benchmark: drives the FastAPI app in-process against stub providers
+and reports throughput and p50/p95/p99 per /content/* endpoint, cold and warm.
+
+    python -m bench.run                      # print results
+    python -m bench.run --check              # compare with bench/baselines.json, exit 1 on regression
+    python -m bench.run --update-baselines   # record the current numbers as the baseline
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+import jwt
+
+from app.config import settings
+from app.main import app
+from app.services import http as outbound
+from app.services.cache import cache
+from bench.providers import PROFILES, make_transport
+
+BASELINES = Path(__file__).with_name("baselines.json")
+
+FAITH = {"faithMode": "disciple", "lightConsentGiven": False, "hideFaithOverlaysInMind": False}
+
+# name -> (method, path, body factory); the factory gets the request index and
+# whether the run is cold (every request must miss the cache)
+ENDPOINTS: Dict[str, tuple] = {
+    "quotes": ("POST", "/content/quotes", lambda i, cold: {**FAITH, "topic": f"hope{i}" if cold else "hope", "limit": 5}),
+    "scripture": ("POST", "/content/scripture", lambda i, cold: {**FAITH, "theme": f"peace{i}" if cold else "peace", "limit": 1}),
+    "prayers": ("POST", "/content/prayers", lambda i, cold: {**FAITH, "topic": f"peace{i}" if cold else "peace", "limit": 1}),
+    "devotionals": ("POST", "/content/devotionals", lambda i, cold: {**FAITH, "topic": f"love{i}" if cold else "love", "limit": 1}),
+    "today": ("POST", "/content/today", lambda i, cold: {**FAITH, "topic": f"hope{i}" if cold else "hope", "theme": "peace", "limit": 3}),
+    "manifest": ("GET", "/content/manifest", None),
+}
+
+def _token() -> str:
+    now = int(time.time())
+    payload = {"sub": "bench", "iss": settings.JWT_ISS, "aud": settings.JWT_AUD, "iat": now, "exp": now + 3600}
+    return jwt.encode(payload, settings.JWT_SECRET_V1, algorithm="HS256", headers={"kid": settings.JWT_KID})
+
+def percentile(sorted_ms: List[float], pct: float) -> float:
+    if not sorted_ms:
+        return 0.0
+    idx = min(len(sorted_ms) - 1, max(0, int(round(pct / 100 * len(sorted_ms) + 0.5)) - 1))
+    return sorted_ms[idx]
+
+async def _run_endpoint(client: httpx.AsyncClient, name: str, cold: bool, requests: int, concurrency: int) -> Dict[str, float]:
+    method, path, body_for = ENDPOINTS[name]
+    latencies: List[float] = []
+    errors = 0
+    sem = asyncio.Semaphore(concurrency)
+
+    if not cold and body_for:
+        # Prime the entry every warm request will hit
+        await client.request(method, path, json=body_for(0, False))
+
+    async def one(i: int):
+        nonlocal errors
+        async with sem:
+            body = body_for(i, cold) if body_for else None
+            t0 = time.perf_counter()
+            r = await client.request(method, path, json=body)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            if r.status_code >= 500:
+                errors += 1
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    wall = time.perf_counter() - t0
+
+    latencies.sort()
+    return {
+        "rps": round(requests / wall, 1),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "errors": errors,
+    }
+
+def _median_round(rounds: List[Dict[str, float]]) -> Dict[str, float]:
+    """Per-metric median across rounds, which damps scheduler noise on shared CI machines"""
+    out = {}
+    for metric in rounds[0]:
+        values = sorted(r[metric] for r in rounds)
+        out[metric] = values[len(values) // 2]
+    return out
+
+async def run(profile: str, requests: int, concurrency: int, seed: int, only: Optional[List[str]] = None, rounds: int = 3) -> Dict[str, Dict[str, float]]:
+    settings.ENABLE_EXTERNAL = True
+    outbound.transport = make_transport(profile, seed)
+    results: Dict[str, Dict[str, float]] = {}
+    headers = {"Authorization": f"Bearer {_token()}", "Accept-Encoding": "gzip"}
+    asgi = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=asgi, base_url="http://bench", headers=headers, timeout=60) as client:
+        for name in only or ENDPOINTS:
+            modes = ["warm"] if ENDPOINTS[name][2] is None else ["cold", "warm"]
+            for mode in modes:
+                samples = []
+                for _ in range(rounds):
+                    cache.mem.clear()
+                    samples.append(await _run_endpoint(client, name, mode == "cold", requests, concurrency))
+                results[f"{name}:{mode}"] = _median_round(samples)
+    return results
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float, min_delta_ms: float = 10.0) -> List[str]:
+    """Human-readable regressions: p95 slower or throughput lower than baseline by more than threshold.
+    p95 must also be min_delta_ms slower, so scheduler noise on millisecond paths does not fail the check."""
+    problems = []
+    for key, cur in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        slower = cur["p95_ms"] - base["p95_ms"]
+        if base["p95_ms"] > 0 and cur["p95_ms"] > base["p95_ms"] * (1 + threshold) and slower >= min_delta_ms:
+            problems.append(f"{key}: p95 {cur['p95_ms']}ms vs baseline {base['p95_ms']}ms")
+        if cur["rps"] < base["rps"] * (1 - threshold):
+            problems.append(f"{key}: {cur['rps']} req/s vs baseline {base['rps']} req/s")
+    return problems
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="UR4MORE gateway benchmark")
+    ap.add_argument("--profile", choices=sorted(PROFILES), default="fast")
+    ap.add_argument("--requests", type=int, default=200)
+    ap.add_argument("--concurrency", type=int, default=16)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--rounds", type=int, default=3, help="rounds per scenario; the median is reported")
+    ap.add_argument("--endpoint", action="append", choices=sorted(ENDPOINTS), help="limit to these endpoints")
+    ap.add_argument("--threshold", type=float, default=0.3, help="allowed regression as a fraction (0.3 = 30%%)")
+    ap.add_argument("--min-delta-ms", type=float, default=10.0, help="ignore p95 slowdowns smaller than this")
+    ap.add_argument("--check", action="store_true", help="fail when results regress past the baseline")
+    ap.add_argument("--update-baselines", action="store_true")
+    ap.add_argument("--json", help="also write results to this file")
+    args = ap.parse_args(argv)
+
+    # Providers log every failed fetch with print(); keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = asyncio.run(run(args.profile, args.requests, args.concurrency, args.seed, args.endpoint, args.rounds))
+    meta = {"profile": args.profile, "requests": args.requests, "concurrency": args.concurrency, "seed": args.seed, "rounds": args.rounds}
+
+    print(f"{'endpoint':<20}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'5xx':>6}")
+    for key, r in results.items():
+        print(f"{key:<20}{r['rps']:>10}{r['p50_ms']:>10}{r['p95_ms']:>10}{r['p99_ms']:>10}{r['errors']:>6}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"meta": meta, "results": results}, indent=2))
+
+    if args.update_baselines:
+        BASELINES.write_text(json.dumps({"meta": meta, "results": results}, indent=2) + "\n")
+        print(f"Baselines written to {BASELINES}")
+        return 0
+
+    if args.check:
+        if not BASELINES.exists():
+            print("No baselines recorded; run with --update-baselines first")
+            return 1
+        stored = json.loads(BASELINES.read_text())
+        if stored.get("meta") != meta:
+            print(f"Baseline was recorded with {stored.get('meta')}; rerun with the same settings")
+            return 1
+        problems = compare(results, stored["results"], args.threshold, args.min_delta_ms)
+        if problems:
+            print("\nPerformance regressions:")
+            for p in problems:
+                print(f"  - {p}")
+            return 1
+        print("\nNo regressions past the baseline threshold")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Local provider simulator for offline soak tests of either gateway.
+
+Serves every external provider under /<upstream host>/<upstream path>, e.g.
+/api.quotable.io/random or /labs.bible.org/api/?passage=votd, with the stub
+responses from bench/providers.py. Start it, then run a gateway with
+PROVIDER_SIMULATOR_URL pointing here:
+
+    python -m bench.simulator --profile soak --port 9900
+    PROVIDER_SIMULATOR_URL=http://127.0.0.1:9900 uvicorn app.main:app
+    PROVIDER_SIMULATOR_URL=http://127.0.0.1:9900 python ../gateway_flask/app.py
+
+Control endpoints:
+    GET  /_sim/stats     requests and status codes per provider
+    GET  /_sim/profile   current profile (and per-provider overrides)
+    POST /_sim/profile   {"profile": "degraded"} or individual fields, optionally {"provider": "zenquotes", ...}
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+import httpx
+
+from bench.providers import PROFILES, provider_for, respond, sample_latency, should_drip
+
+class Simulator:
+    """Profile state and counters shared by every request thread"""
+
+    def __init__(self, profile: Dict[str, float], seed: int = 0, overrides: Optional[Dict[str, Dict[str, float]]] = None):
+        self.profile = dict(profile)
+        self.overrides = {k: dict(v) for k, v in (overrides or {}).items()}
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def profile_for(self, provider: str) -> Dict[str, float]:
+        return self.overrides.get(provider, self.profile)
+
+    def update(self, body: Dict) -> None:
+        provider = body.pop("provider", None)
+        base = dict(PROFILES[body.pop("profile")]) if "profile" in body else dict(self.profile_for(provider or ""))
+        base.update(body)
+        with self.lock:
+            if provider:
+                self.overrides[provider] = base
+            else:
+                self.profile = base
+
+    def plan(self, url: httpx.URL):
+        """Latency, response and drip decision for one request, drawn under the lock so runs replay per seed"""
+        provider = provider_for(url) or "unknown"
+        p = self.profile_for(provider)
+        with self.lock:
+            delay = sample_latency(p, self.rng)
+            resp = respond(httpx.Request("GET", url), p, self.rng)
+            drip = resp.status_code == 200 and should_drip(p, self.rng)
+            counts = self.stats.setdefault(provider, {})
+            counts[str(resp.status_code)] = counts.get(str(resp.status_code), 0) + 1
+            counts["requests"] = counts.get("requests", 0) + 1
+        return provider, p, delay, resp, drip
+
+def make_handler(sim: Simulator):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass  # soak runs would drown in access logs
+
+        def _send(self, status: int, body: bytes, headers: Dict[str, str], drip_bps: float = 0):
+            self.send_response(status)
+            for k, v in headers.items():
+                if k.lower() not in ("content-length", "content-encoding", "transfer-encoding", "connection"):
+                    self.send_header(k, v)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if not drip_bps:
+                self.wfile.write(body)
+                return
+            # Slow-drip body: headers arrive promptly, the payload trickles in
+            for i in range(0, len(body), 256):
+                chunk = body[i:i + 256]
+                time.sleep(len(chunk) / drip_bps)
+                self.wfile.write(chunk)
+                self.wfile.flush()
+
+        def _json(self, status: int, payload) -> None:
+            self._send(status, json.dumps(payload).encode("utf-8"), {"Content-Type": "application/json"})
+
+        def do_GET(self):
+            if self.path == "/_sim/stats":
+                with sim.lock:
+                    return self._json(200, sim.stats)
+            if self.path == "/_sim/profile":
+                return self._json(200, {"profile": sim.profile, "overrides": sim.overrides})
+
+            host, _, rest = self.path.lstrip("/").partition("/")
+            if not host:
+                return self._json(404, {"error": "expected /<upstream host>/<path>"})
+            url = httpx.URL(f"https://{host}/{rest}")
+            _, p, delay, resp, drip = sim.plan(url)
+            if delay:
+                time.sleep(delay / 1000)
+            self._send(resp.status_code, resp.content, dict(resp.headers), p["drip_bytes_per_sec"] if drip else 0)
+
+        def do_POST(self):
+            if self.path != "/_sim/profile":
+                return self._json(404, {"error": "not found"})
+            try:
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+                sim.update(body)
+            except (ValueError, KeyError) as e:
+                return self._json(400, {"error": f"bad profile: {e}"})
+            return self._json(200, {"profile": sim.profile, "overrides": sim.overrides})
+
+    return Handler
+
+def serve(host: str, port: int, sim: Simulator) -> ThreadingHTTPServer:
+    """Bound server; call serve_forever() on it (or run it in a thread)"""
+    server = ThreadingHTTPServer((host, port), make_handler(sim))
+    server.daemon_threads = True
+    return server
+
+def _latency(spec: str) -> Dict[str, float]:
+    """--latency DIST:MS[:SPREAD], e.g. lognormal:120:90"""
+    dist, _, rest = spec.partition(":")
+    ms, _, spread = rest.partition(":")
+    if dist not in ("uniform", "normal", "lognormal") or not ms:
+        raise argparse.ArgumentTypeError("expected uniform|normal|lognormal:MS[:SPREAD]")
+    return {"dist": dist, "latency_ms": float(ms), "jitter_ms": float(spread or 0)}
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="UR4MORE external provider simulator")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=9900)
+    ap.add_argument("--profile", choices=sorted(PROFILES), default="realistic")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--latency", type=_latency, help="override latency, e.g. lognormal:120:90")
+    ap.add_argument("--error-rate", type=float)
+    ap.add_argument("--not-found-rate", type=float)
+    ap.add_argument("--rate-limit-rate", type=float)
+    ap.add_argument("--drip-rate", type=float, help="share of 200s sent as a slow-drip body")
+    ap.add_argument("--drip-bytes-per-sec", type=float)
+    ap.add_argument("--provider-profile", action="append", default=[], metavar="NAME=PROFILE",
+                    help="per-provider profile, e.g. zenquotes=degraded")
+    args = ap.parse_args(argv)
+
+    profile = dict(PROFILES[args.profile])
+    if args.latency:
+        profile.update(args.latency)
+    for field in ("error_rate", "not_found_rate", "rate_limit_rate", "drip_rate", "drip_bytes_per_sec"):
+        if getattr(args, field) is not None:
+            profile[field] = getattr(args, field)
+    overrides = {}
+    for item in args.provider_profile:
+        name, _, prof = item.partition("=")
+        if prof not in PROFILES:
+            ap.error(f"unknown profile {prof!r} for {name}")
+        overrides[name] = dict(PROFILES[prof])
+
+    server = serve(args.host, args.port, Simulator(profile, args.seed, overrides))
+    print(f"Provider simulator on http://{args.host}:{server.server_port} (profile {args.profile})")
+    print(f"Set PROVIDER_SIMULATOR_URL=http://{args.host}:{server.server_port} on the gateway")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+import asyncio
+import httpx
+from app.services.allowlist import ALLOWLISTED_PROVIDERS
+from bench.providers import RESPONDERS, provider_for, make_transport
+
+def test_every_provider_has_a_stub():
+    assert set(ALLOWLISTED_PROVIDERS) <= set(RESPONDERS)
+
+def test_stub_routes_by_base_url():
+    for name, cfg in ALLOWLISTED_PROVIDERS.items():
+        assert provider_for(httpx.URL(cfg["base_url"].rstrip("/") + "/x")) == name
+
+def test_transport_answers_instantly():
+    stats = {}
+    async def go():
+        async with httpx.AsyncClient(transport=make_transport("instant", stats=stats)) as c:
+            return await c.get(ALLOWLISTED_PROVIDERS["quotable"]["base_url"].rstrip("/") + "/random")
+    r = asyncio.run(go())
+    assert r.status_code == 200 and r.json()["content"]
+    assert stats == {"quotable": 1}
+
+def test_simulated_url_keeps_host_and_path():
+    from app.services.allowlist import simulated_url
+    assert simulated_url("https://zenquotes.io/api", "http://127.0.0.1:9900/") == "http://127.0.0.1:9900/zenquotes.io/api"
+
+def test_simulator_serves_provider_shapes():
+    import threading
+    from bench.providers import PROFILES
+    from bench.simulator import Simulator, serve
+    server = serve("127.0.0.1", 0, Simulator(PROFILES["instant"]))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        base = f"http://127.0.0.1:{server.server_port}"
+        r = httpx.get(f"{base}/bible-api.com/john+3:16")
+        assert r.status_code == 200 and r.json()["reference"]
+        r = httpx.get(f"{base}/labs.bible.org/api/", params={"passage": "votd", "formatting": "plain"})
+        assert " - " in r.text
+        httpx.post(f"{base}/_sim/profile", json={"provider": "quotable", "rate_limit_rate": 1.0})
+        r = httpx.get(f"{base}/api.quotable.io/random")
+        assert r.status_code == 429 and r.headers["retry-after"] == "1"
+        assert httpx.get(f"{base}/_sim/stats").json()["quotable"]["429"] == 1
+    finally:
+        server.shutdown()
@@ -0,0 +1,98 @@
+import asyncio
+from app.services.cache import CacheService
+
+def test_batch_round_trip():
+    async def go():
+        c = CacheService()
+        stored = await c.set_many({"cg:a": [1], "cg:b": {"x": 2}})
+        assert stored == {"cg:a": "[1]", "cg:b": '{"x": 2}'}
+        assert await c.get_many(["cg:a", "cg:missing", "cg:b"]) == ["[1]", None, '{"x": 2}']
+        assert await c.set("k", "v") == '"v"'
+        assert await c.get("k") == '"v"'
+    asyncio.run(go())
+
+def test_concurrent_gets():
+    async def go():
+        c = CacheService()
+        await c.set("k", 1)
+        return await asyncio.gather(*(c.get("k") for _ in range(50)))
+    assert asyncio.run(go()) == ["1"] * 50
+
+from content_engine.breaker import CircuitBreaker
+
+def test_breaker_opens_then_half_opens():
+    now = [0.0]
+    b = CircuitBreaker(failures=2, reset_after=5, clock=lambda: now[0])
+    b.failure(); assert b.allow()
+    b.failure(); assert b.state == "open" and not b.allow()
+    now[0] = 6
+    assert b.allow() and b.state == "half_open"
+    assert not b.allow()  # one trial at a time
+    b.failure(); assert b.state == "open"
+    now[0] = 12
+    assert b.allow() and b.success() is True and b.state == "closed"
+
+def test_unreachable_redis_falls_back_to_memory():
+    async def go():
+        c = CacheService(redis_url="redis://127.0.0.1:1/0")
+        for i in range(3):
+            await c.set(f"cg:{i}", i)
+        assert await c.get("cg:1") == "1"
+        assert await c.get_many(["cg:0", "cg:2"]) == ["0", "2"]
+        await c.set_bytes("cz:x", b"\x00")
+        assert await c.get_bytes("cz:x") == b"\x00"
+        assert c.status()["breaker"] == "open"
+        assert c.status()["pendingResync"] == 4
+        await c.close()
+    asyncio.run(go())
+
+class _Store:
+    """Minimal stand-in for a recovered Redis server: records SET EX calls"""
+    def __init__(self): self.data = {}
+    async def get(self, k): return self.data.get(k)
+    def pipeline(self, transaction=False): return _Pipe(self)
+
+class _Pipe:
+    def __init__(self, store): self.store, self.ops = store, []
+    async def __aenter__(self): return self
+    async def __aexit__(self, *exc): return False
+    def set(self, k, v, ex=None): self.ops.append((k, v, ex))
+    async def execute(self):
+        for k, v, ex in self.ops: self.store.data[k] = (v, ex)
+
+def test_outage_writes_resync_on_recovery():
+    async def go():
+        c = CacheService(redis_url="redis://127.0.0.1:1/0")
+        c.breaker.failures = 1
+        await c.set("cg:hot", {"q": 1}, ttl=60)
+        await c.set_bytes("cz:hot", b"gz", ttl=60)
+        assert c.breaker.state == "open"
+        # Redis comes back
+        await c.close()
+        c.r, c.rb = _Store(), _Store()
+        c.breaker.opened_at -= c.breaker.reset_after
+        assert await c.get("cg:other") is None
+        await c._resync_task
+        assert c.r.data["cg:hot"][0] == '{"q": 1}' and 0 < c.r.data["cg:hot"][1] <= 60
+        assert c.rb.data["cz:hot"][0] == b"gz"
+        assert not c.dirty and "cg:hot" not in c.mem
+    asyncio.run(go())
+
+def test_cancelled_half_open_trial_frees_the_breaker():
+    class _Hang(_Store):
+        async def get(self, k): await asyncio.sleep(60)
+
+    async def go():
+        c = CacheService()
+        c.r = _Hang()
+        c.breaker.state, c.breaker.opened_at = "open", -c.breaker.reset_after
+        trial = asyncio.ensure_future(c.get("cg:k"))
+        await asyncio.sleep(0)
+        assert c.breaker.state == "half_open" and c.breaker.trial_in_flight
+        trial.cancel()  # client disconnect
+        try:
+            await trial
+        except asyncio.CancelledError:
+            pass
+        assert not c.breaker.trial_in_flight and c.breaker.allow()
+    asyncio.run(go())
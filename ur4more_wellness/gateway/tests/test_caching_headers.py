@@ -0,0 +1,59 @@
+from fastapi.testclient import TestClient
+from app.main import app
+import jwt, time
+from app.config import settings
+
+def token():
+    now = int(time.time())
+    payload = {"sub":"test","iss":settings.JWT_ISS,"aud":settings.JWT_AUD,"iat":now,"exp":now+3600}
+    return jwt.encode(payload, settings.JWT_SECRET_V1, algorithm="HS256", headers={"kid":settings.JWT_KID})
+
+client = TestClient(app)
+HDR = lambda: {"Authorization": f"Bearer {token()}"}
+
+def test_manifest_etag_stable_and_304():
+    r1 = client.get("/content/manifest", headers=HDR())
+    r2 = client.get("/content/manifest", headers=HDR())
+    assert r1.status_code == 200
+    assert r1.headers["etag"] == r2.headers["etag"]
+    assert r1.json()["corpusVersion"]
+    assert r1.headers["cache-control"].startswith("private") and "Authorization" in r1.headers["vary"]
+    from content_engine import CORPUS_STAMP
+    assert r1.json()["updatedAt"] == CORPUS_STAMP  # committed, so every replica sends the same ETag
+    r3 = client.get("/content/manifest", headers={**HDR(), "If-None-Match": r1.headers["etag"]})
+    assert r3.status_code == 304
+    assert r3.content == b""
+
+def test_quotes_conditional_request():
+    body = {"faithMode":"off","lightConsentGiven":False,"hideFaithOverlaysInMind":False,"topic":"growth","limit":3}
+    r1 = client.post("/content/quotes", headers=HDR(), json=body)
+    assert r1.status_code == 200
+    assert r1.headers["cache-control"].startswith("private")
+    assert "Accept-Encoding" in r1.headers["vary"]
+    r2 = client.post("/content/quotes", headers={**HDR(), "If-None-Match": r1.headers["etag"]}, json=body)
+    assert r2.status_code == 304
+    r3 = client.post("/content/quotes", headers={**HDR(), "If-None-Match": '"stale"'}, json=body)
+    assert r3.status_code == 200
+    assert r3.json() == r1.json()
+
+def test_large_bodies_negotiate_encoding():
+    body = {"faithMode":"disciple","lightConsentGiven":False,"hideFaithOverlaysInMind":False,"topic":"faith","limit":20}
+    r = client.post("/content/quotes", headers={**HDR(), "Accept-Encoding": "gzip"}, json=body)
+    assert r.status_code == 200
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers["etag"].endswith('-gzip"')
+    assert len(r.json()) >= 1
+    plain = client.post("/content/quotes", headers={**HDR(), "Accept-Encoding": "identity"}, json=body)
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == r.json()
+    # Any variant's validator revalidates the same content
+    r304 = client.post("/content/quotes", headers={**HDR(), "If-None-Match": plain.headers["etag"], "Accept-Encoding": "gzip"}, json=body)
+    assert r304.status_code == 304
+
+def test_small_bodies_stay_uncompressed():
+    r = client.post("/content/scripture", headers={**HDR(), "Accept-Encoding": "gzip, br"}, json={
+        "faithMode":"light","lightConsentGiven":True,"hideFaithOverlaysInMind":False,"theme":"gluttony","limit":1
+    })
+    assert r.status_code == 200
+    assert len(r.content) < 1024
+    assert "content-encoding" not in r.headers
@@ -0,0 +1,100 @@
+from fastapi.testclient import TestClient
+from app.main import app
+import asyncio, json, jwt, time
+import httpx
+from app.config import settings
+from app.services.cache import cache
+from bench.replay import load, replay
+
+def token(sub="test"):
+    now = int(time.time())
+    payload = {"sub":sub,"iss":settings.JWT_ISS,"aud":settings.JWT_AUD,"iat":now,"exp":now+3600}
+    return jwt.encode(payload, settings.JWT_SECRET_V1, algorithm="HS256", headers={"kid":settings.JWT_KID})
+
+client = TestClient(app)
+BODY = {"faithMode":"off","lightConsentGiven":False,"hideFaithOverlaysInMind":False,"topic":"call my sister","limit":2}
+
+def test_capture_is_sampled_and_anonymised(tmp_path, monkeypatch):
+    log = tmp_path / "capture.jsonl"
+    monkeypatch.setattr(settings, "CAPTURE_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(settings, "CAPTURE_PATH", str(log))
+    cache.mem.clear()
+    hdr = {"Authorization": f"Bearer {token('alice@example.com')}"}
+    first = client.post("/content/quotes", headers=hdr, json=BODY)
+    second = client.post("/content/quotes", headers=hdr, json={**BODY, "topic": "Peace"})
+    assert first.headers["X-Cache"] == "miss" and second.headers["X-Cache"] == "miss"
+    client.get("/health")
+
+    raw = log.read_text()
+    assert "alice" not in raw and "sister" not in raw
+    records = [json.loads(line) for line in raw.splitlines()]
+    assert [r["p"] for r in records] == ["/content/quotes", "/content/quotes"]
+    assert records[0]["u"] == records[1]["u"]
+    assert records[0]["b"]["topic"].startswith("h:")
+    assert records[1]["b"]["topic"] == "peace"
+    assert records[0]["s"] == 200 and records[0]["c"] == "miss"
+
+def test_capture_off_by_default(tmp_path, monkeypatch):
+    log = tmp_path / "capture.jsonl"
+    monkeypatch.setattr(settings, "CAPTURE_PATH", str(log))
+    client.post("/content/quotes", headers={"Authorization": f"Bearer {token()}"}, json=BODY)
+    assert not log.exists()
+
+def test_replay_reports_cache_efficiency(tmp_path):
+    log = tmp_path / "capture.jsonl"
+    rec = {"u": "abc", "m": "POST", "p": "/content/quotes", "b": {**BODY, "topic": "hope"}}
+    log.write_text("\n".join(json.dumps({**rec, "t": 100 + i, **({"inm": 1} if i else {})}) for i in range(3)) + "\n{torn")
+    cache.mem.clear()
+
+    async def go():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://replay") as c:
+            return await replay(c, load(str(log)), speedup=0, concurrency=1)
+    report = asyncio.run(go())
+    assert report["requests"] == 3
+    assert report["cache"]["replay"] == {"miss": 1, "hit": 2}
+    assert report["cache"]["not_modified"] == 2
+
+def test_generated_salt_survives_restarts(tmp_path, monkeypatch):
+    from app.services import capture
+    monkeypatch.setattr(settings, "CAPTURE_SALT", "")
+    monkeypatch.setattr(settings, "CAPTURE_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(settings, "CAPTURE_PATH", str(tmp_path / "capture.jsonl"))
+    hdr = f"Bearer {token('alice@example.com')}"
+    first = capture.subject(hdr)
+    monkeypatch.setattr(capture, "_salts", {})  # a new worker or process
+    assert capture.subject(hdr) == first
+    assert (tmp_path / "capture.jsonl.salt").read_text() == capture.salt()
+    assert [p.name for p in tmp_path.iterdir()] == ["capture.jsonl.salt"]
+    monkeypatch.setattr(settings, "CAPTURE_SALT", "configured")
+    assert capture.subject(hdr) != first
+
+def test_sampled_body_is_replayed_to_the_app(tmp_path, monkeypatch):
+    # Plain ASGI, independent of the Starlette version: the app must still receive the body
+    # (chunked here) that capture consumed, and the disconnect after it
+    from app.main import TimingMiddleware
+    monkeypatch.setattr(settings, "CAPTURE_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(settings, "CAPTURE_PATH", str(tmp_path / "capture.jsonl"))
+    body = json.dumps(BODY).encode()
+    incoming = [{"type": "http.request", "body": body[:10], "more_body": True},
+                {"type": "http.request", "body": body[10:], "more_body": False},
+                {"type": "http.disconnect"}]
+    seen, sent = [], []
+
+    async def inner(scope, receive, send):
+        seen.extend([await receive(), await receive(), await receive()])
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    async def receive():
+        return incoming.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "path": "/content/quotes", "query_string": b"",
+             "headers": [(b"authorization", f"Bearer {token()}".encode())]}
+    asyncio.run(asyncio.wait_for(TimingMiddleware(inner)(scope, receive, send), 5))
+    assert b"".join(m.get("body", b"") for m in seen) == body and seen[-1]["type"] == "http.disconnect"
+    record = json.loads((tmp_path / "capture.jsonl").read_text())
+    assert record["b"]["topic"].startswith("h:") and record["s"] == 200
+    assert [m["type"] for m in sent] == ["http.response.start", "http.response.body"]
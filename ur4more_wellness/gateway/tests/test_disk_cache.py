@@ -0,0 +1,57 @@
+import asyncio, time
+from app.services.cache import CacheService
+from content_engine.disk_cache import DiskCache
+
+def test_restart_is_warm(tmp_path, monkeypatch):
+    from app.config import settings
+    monkeypatch.setattr(settings, "DISK_CACHE_PATH", str(tmp_path / "l3.sqlite"))
+    first = CacheService(redis_url="")
+    asyncio.run(first.set("cg:hot", {"items": [1]}))
+    asyncio.run(first.set_bytes("cz:hot", b"\x1f\x8b"))
+    asyncio.run(first.set("cg:cold", {"items": []}))
+    assert asyncio.run(first.get("cg:hot"))
+    asyncio.run(first.close())
+
+    second = CacheService(redis_url="")
+    monkeypatch.setattr(settings, "DISK_CACHE_WARM_KEYS", 1)
+    assert asyncio.run(second.warm()) == 1 and "cg:hot" in second.mem  # no Redis: hottest key preloaded in process
+    assert asyncio.run(second.get("cg:cold")) == '{"items": []}'  # the rest served from disk
+    assert asyncio.run(second.get_bytes("cz:hot")) == b"\x1f\x8b"
+    asyncio.run(second.close())
+
+def test_compaction_expires_and_caps_size(tmp_path):
+    d = DiskCache(str(tmp_path / "l3.sqlite"), max_mb=1)
+    now = time.time()
+    d.set("old", "x", now - 1)
+    for i in range(12):
+        d.set(f"k{i}", "v" * 100_000, now + 60)
+    d.touch("k0")
+    stats = d.compact()
+    assert stats["expired"] == 1 and stats["evicted"] >= 2
+    assert d.get("k0") is not None  # hit entries outlive cold ones
+    assert d.snapshot()["entries"] <= 10
+    d.close()
+
+def test_disk_hits_and_warm_keys_go_to_redis(tmp_path, monkeypatch):
+    from app.config import settings
+    from test_cache import _Store
+    monkeypatch.setattr(settings, "DISK_CACHE_PATH", str(tmp_path / "l3.sqlite"))
+    c = CacheService(redis_url="")
+    c.disk.set("cg:a", '{"a": 1}', time.time() + 60)
+    c.disk.set("cz:b", b"\x1f\x8b", time.time() + 60)
+    c.r, c.rb = _Store(), _Store()  # Redis up
+    assert asyncio.run(c.get("cg:a")) == '{"a": 1}'
+    assert c.r.data["cg:a"][0] == '{"a": 1}' and 0 < c.r.data["cg:a"][1] <= 60
+    assert asyncio.run(c.warm()) == 2 and c.rb.data["cz:b"][0] == b"\x1f\x8b"
+    assert not c.mem  # the in-process dict only backs Redis outages
+    c.r = c.rb = None
+    asyncio.run(c.close())
+
+def test_pending_hits_are_capped(tmp_path):
+    d = DiskCache(str(tmp_path / "l3.sqlite"), max_pending_hits=3)
+    d.set("k", "v", time.time() + 60)
+    for i in range(5):
+        d.touch(f"r{i}")
+    d.touch("k")
+    assert len(d.pending_hits) < 3
+    d.close()
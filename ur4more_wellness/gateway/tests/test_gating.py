@@ -9,3 +9,10 @@ def test_light_needs_consent():
 
 def test_hide_blocks_all():
   assert faith_allowed("disciple", True, True) is False
+
+def test_light_by_default_setting(monkeypatch):
+  from app.config import settings
+  monkeypatch.setattr(settings, "ALLOW_FAITH_IN_LIGHT_BY_DEFAULT", True)
+  assert faith_allowed("light", False, False) is True
+  assert faith_allowed("light", False, True) is False
+  assert faith_allowed("off", True, False) is False
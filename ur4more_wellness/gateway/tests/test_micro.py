@@ -0,0 +1,20 @@
+from bench.micro import make_corpus, run, scaling, compare
+from app.services.filters import filter_quote
+
+def test_corpus_is_deterministic_and_mixed():
+    a, b = make_corpus(500, seed=3), make_corpus(500, seed=3)
+    assert [q.text for q in a] == [q.text for q in b]
+    kept = [q for q in a if filter_quote(q, False)]
+    assert 0 < len(kept) < len(a)
+
+def test_run_reports_every_benchmark():
+    results = run([100], min_time=0.001, repeat=2)
+    assert {"make_cache_key", "faith_allowed", "jwt_decode", "rank_quotes[100]", "filter_quote[100]", "contains_profanity[100]"} <= set(results)
+    assert results["rank_quotes[100]"]["items"] == 100
+
+def test_scaling_and_history_comparison():
+    results = {"rank_quotes[100]": {"ns_per_item": 100.0, "best_us": 10.0},
+               "rank_quotes[100000]": {"ns_per_item": 900.0, "best_us": 90000.0}}
+    assert scaling(results, 5.0) and not scaling(results, 10.0)
+    assert compare(results, {"rank_quotes[100]": {"best_us": 5.0}}, 0.2)
+    assert not compare(results, {"rank_quotes[100]": {"best_us": 9.0}}, 0.2)
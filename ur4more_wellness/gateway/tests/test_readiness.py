@@ -0,0 +1,41 @@
+import json
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services import readiness
+
+async def _wait_for_startup():
+    await readiness.startup.task  # the stages run in the background after startup
+
+def test_ready_after_startup_stages(tmp_path, monkeypatch):
+    capture = tmp_path / "capture.jsonl"
+    rec = {"t": 1, "m": "POST", "p": "/content/quotes", "b": {"faithMode": "off", "topic": "hope", "limit": 3}, "s": 200}
+    capture.write_text("\n".join(json.dumps(rec) for _ in range(3)) + "\n")
+    monkeypatch.setattr(readiness.settings, "READY_PREWARM_FILE", str(capture))
+    monkeypatch.setattr(readiness, "startup", readiness.Startup())
+
+    with TestClient(app) as client:
+        assert client.get("/live").status_code == 200
+        client.portal.call(_wait_for_startup)
+        r = client.get("/ready")
+    assert r.status_code == 200
+    body = r.json()
+    assert list(body["stages"]) == ["corpus", "index", "cache", "redis", "providers", "prewarm"]
+    assert all("ms" in s for s in body["stages"].values())
+    assert body["stages"]["prewarm"] == {**body["stages"]["prewarm"], "requests": 1, "statuses": {"200": 1}}
+    assert body["stages"]["providers"]["ok"] is None and body["stages"]["providers"]["checked"] is False
+
+def test_prewarm_skipped_in_other_workers(tmp_path, monkeypatch):
+    capture = tmp_path / "capture.jsonl"
+    capture.write_text(json.dumps({"m": "GET", "p": "/content/manifest", "s": 200}) + "\n")
+    monkeypatch.setattr(readiness.settings, "READY_PREWARM_FILE", str(capture))
+    monkeypatch.setattr(readiness, "startup", readiness.Startup())
+    readiness.startup.prewarm = False
+    with TestClient(app) as client:
+        client.portal.call(_wait_for_startup)
+        body = client.get("/ready").json()
+    assert body["ready"] and "requests" not in body["stages"]["prewarm"] and body["stages"]["prewarm"]["skipped"]
+
+def test_not_ready_before_startup(monkeypatch):
+    monkeypatch.setattr(readiness, "startup", readiness.Startup())
+    r = TestClient(app).get("/ready")
+    assert r.status_code == 503 and r.json()["ready"] is False
@@ -0,0 +1,12 @@
+import os
+from app.serve import memory, memory_report
+
+def test_memory_of_this_process():
+    m = memory(os.getpid())
+    if m is None:
+        return  # no /proc/<pid>/smaps_rollup on this platform
+    assert m["rss_kb"] > 0 and m["private_kb"] <= m["rss_kb"]
+    assert "each extra worker adds" in memory_report(os.getpid(), [os.getpid()])
+
+def test_memory_of_missing_process():
+    assert memory(2**22 + 12345) is None
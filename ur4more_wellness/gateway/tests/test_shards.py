@@ -0,0 +1,100 @@
+import gzip, hashlib, json
+from fastapi.testclient import TestClient
+from app.main import app
+import jwt, time
+from app.config import settings
+
+def token():
+    now = int(time.time())
+    payload = {"sub":"test","iss":settings.JWT_ISS,"aud":settings.JWT_AUD,"iat":now,"exp":now+3600}
+    return jwt.encode(payload, settings.JWT_SECRET_V1, algorithm="HS256", headers={"kid":settings.JWT_KID})
+
+client = TestClient(app)
+HDR = lambda: {"Authorization": f"Bearer {token()}", "Accept-Encoding": "identity"}
+
+SHARD = json.dumps({"version": 1, "quotes": [{"id": f"q{i}", "text": "x" * 40} for i in range(50)]}).encode()
+
+def _assets(tmp_path, monkeypatch, checksum=None):
+    (tmp_path / "shards").mkdir()
+    (tmp_path / "shards" / "quotes_000.json").write_bytes(SHARD)
+    (tmp_path / "shards" / "quotes_000.json.gz").write_bytes(gzip.compress(SHARD))
+    manifest = {"version": 1, "files": ["assets/quotes/shards/quotes_000.json"]}
+    if checksum:
+        manifest["checksums"] = {"assets/quotes/shards/quotes_000.json": checksum}
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+    monkeypatch.setattr(settings, "QUOTES_ASSETS_DIR", str(tmp_path))
+
+def test_shard_full_and_etag(tmp_path, monkeypatch):
+    _assets(tmp_path, monkeypatch, checksum="abc123")
+    r = client.get("/content/shards/quotes_000.json", headers=HDR())
+    assert r.status_code == 200
+    assert r.content == SHARD
+    assert r.headers["etag"] == '"abc123"'
+    assert r.headers["accept-ranges"] == "bytes"
+    r304 = client.get("/content/shards/quotes_000.json", headers={**HDR(), "If-None-Match": '"abc123"'})
+    assert r304.status_code == 304
+
+def test_shard_range_resume(tmp_path, monkeypatch):
+    _assets(tmp_path, monkeypatch)
+    r = client.get("/content/shards/quotes_000.json", headers={**HDR(), "Range": "bytes=100-199"})
+    assert r.status_code == 206
+    assert r.content == SHARD[100:200]
+    assert r.headers["content-range"] == f"bytes 100-199/{len(SHARD)}"
+    tail = client.get("/content/shards/quotes_000.json", headers={**HDR(), "Range": "bytes=-10"})
+    assert tail.content == SHARD[-10:]
+    bad = client.get("/content/shards/quotes_000.json", headers={**HDR(), "Range": f"bytes={len(SHARD)}-"})
+    assert bad.status_code == 416
+
+def test_shard_precompressed_sibling(tmp_path, monkeypatch):
+    _assets(tmp_path, monkeypatch)
+    r = client.get("/content/shards/quotes_000.json", headers={**HDR(), "Accept-Encoding": "gzip"})
+    assert r.status_code == 200
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.content == SHARD  # decoded by the client
+    assert r.headers["etag"] == f'"{hashlib.sha256(SHARD).hexdigest()}-gzip"'
+
+def test_shard_rejects_other_paths(tmp_path, monkeypatch):
+    _assets(tmp_path, monkeypatch)
+    assert client.get("/content/shards/..%2Fmanifest.json", headers=HDR()).status_code == 404
+    assert client.get("/content/shards/missing.json", headers=HDR()).status_code == 404
+    assert client.get("/content/shards/manifest.json", headers=HDR()).status_code == 200
+
+def test_shard_sendfile_offload(tmp_path, monkeypatch):
+    _assets(tmp_path, monkeypatch)
+    monkeypatch.setattr(settings, "SENDFILE_HEADER", "X-Accel-Redirect")
+    r = client.get("/content/shards/quotes_000.json", headers=HDR())
+    assert r.headers["x-accel-redirect"] == "/_quotes/shards/quotes_000.json"
+    assert r.content == b""
+
+def test_shard_manifest_for_mode(tmp_path, monkeypatch):
+    _assets(tmp_path, monkeypatch)
+    files = {p: f"assets/quotes/shards/quotes_{p}_000.json" for p in ("universal", "off", "faith")}
+    manifest = {
+        "version": 1, "files": list(files.values()), "checksums": {f: p for p, f in files.items()},
+        "shards": [{"file": f, "partition": p, "count": 1} for p, f in files.items()],
+        "modes": {"off": {"files": [files["universal"], files["off"]]}, "faith": {"files": [files["universal"], files["faith"]]}},
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+    r = client.get("/content/shards/manifest.json?mode=off", headers=HDR())
+    assert r.status_code == 200
+    body = r.json()
+    assert body["files"] == [files["universal"], files["off"]]
+    assert set(body["checksums"]) == set(body["files"])
+    assert [s["partition"] for s in body["shards"]] == ["universal", "off"]
+    assert client.get("/content/shards/manifest.json?mode=other", headers=HDR()).status_code == 404
+
+def test_manifest_parsed_once_per_change(tmp_path, monkeypatch):
+    from app.services import static_files
+    _assets(tmp_path, monkeypatch, checksum="abc123")
+    loads = []
+    real_load = json.load
+    monkeypatch.setattr(static_files.json, "load", lambda f: loads.append(1) or real_load(f))
+    for _ in range(3):
+        assert client.get("/content/shards/quotes_000.json", headers=HDR()).headers["etag"] == '"abc123"'
+        client.get("/content/shards/manifest.json?mode=off", headers=HDR())
+    assert len(loads) == 1
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    manifest["checksums"] = {"assets/quotes/shards/quotes_000.json": "def4567"}
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+    assert client.get("/content/shards/quotes_000.json", headers=HDR()).headers["etag"] == '"def4567"'
+    assert len(loads) == 2
@@ -0,0 +1,39 @@
+import os, time
+from content_engine.shm_cache import SharedMemoryCache, WAYS
+
+def test_fill_in_one_worker_is_hit_in_another(tmp_path):
+    path = str(tmp_path / "l1")
+    a, b = SharedMemoryCache(path, 1), SharedMemoryCache(path, 1)
+    a["cg:k"] = ('{"items":[]}', time.time() + 60)
+    a["cz:k"] = (b"\x1f\x8b binary", None)
+    assert b.get("cg:k")[0] == '{"items":[]}'
+    assert b.get("cz:k") == (b"\x1f\x8b binary", None)
+    assert b.pop("cg:k")[0] == '{"items":[]}' and a.get("cg:k") is None
+
+    pid = os.fork()
+    if pid == 0:
+        SharedMemoryCache(path, 1)["cg:child"] = ("from child", None)
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert a.get("cg:child") == ("from child", None)
+
+def test_fixed_capacity_evicts_soonest_expiring(tmp_path):
+    c = SharedMemoryCache(str(tmp_path / "l1"), 0, slot_bytes=256)  # a single set
+    now = time.time()
+    for i in range(WAYS + 4):
+        c[f"k{i}"] = (f"v{i}", now + 100 + i)
+    assert c.stats()["used"] == WAYS
+    assert all(c.get(f"k{i}") is None for i in range(4))
+    assert c.get(f"k{WAYS + 3}")[0] == f"v{WAYS + 3}"
+    c["big"] = ("small", None)
+    c["big"] = ("x" * 1000, None)  # larger than a slot: not cached, and the old value is gone
+    assert c.get("big") is None and c.stats()["oversize"] == 1
+
+def test_reads_split_key_and_value_exactly(tmp_path):
+    c = SharedMemoryCache(str(tmp_path / "l1"), 0, slot_bytes=256)
+    c["e"] = ("", None)
+    exp = time.time() + 60
+    c["b"] = (b"\x00" * 10, exp)
+    c["s"] = ("x" * (256 - 33 - 1), None)  # fills the slot to the last byte
+    assert c.get("e") == ("", None) and c.get("b") == (b"\x00" * 10, exp)
+    assert c.get("s") == ("x" * 222, None) and c.get("missing") is None
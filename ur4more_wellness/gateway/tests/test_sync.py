@@ -0,0 +1,47 @@
+import json
+from fastapi.testclient import TestClient
+from app.main import app
+import jwt, time
+from app.config import settings
+from app.services.cache import cache
+
+def token():
+    now = int(time.time())
+    payload = {"sub":"test","iss":settings.JWT_ISS,"aud":settings.JWT_AUD,"iat":now,"exp":now+3600}
+    return jwt.encode(payload, settings.JWT_SECRET_V1, algorithm="HS256", headers={"kid":settings.JWT_KID})
+
+client = TestClient(app)
+HDR = lambda: {"Authorization": f"Bearer {token()}"}
+
+def _sync_dir(tmp_path, monkeypatch):
+    (tmp_path / "deltas").mkdir()
+    (tmp_path / "index.json").write_text(json.dumps({"current": "bbb", "versions": [{"version": "aaa"}, {"version": "bbb"}]}))
+    (tmp_path / "deltas" / "aaa__bbb.json").write_text(json.dumps({
+        "from": "aaa", "to": "bbb", "added": [{"id": "q2", "text": "New"}], "changed": [], "removed": ["q1"]
+    }))
+    monkeypatch.setattr(settings, "QUOTES_SYNC_DIR", str(tmp_path))
+    cache.mem.clear()
+
+def test_sync_returns_precomputed_delta(tmp_path, monkeypatch):
+    _sync_dir(tmp_path, monkeypatch)
+    r = client.get("/content/quotes/sync", params={"since": "aaa"}, headers=HDR())
+    assert r.status_code == 200
+    data = r.json()
+    assert data["to"] == "bbb"
+    assert [q["id"] for q in data["added"]] == ["q2"]
+    assert data["removed"] == ["q1"]
+    assert "etag" in r.headers
+
+def test_sync_current_and_unknown_versions(tmp_path, monkeypatch):
+    _sync_dir(tmp_path, monkeypatch)
+    same = client.get("/content/quotes/sync", params={"since": "bbb"}, headers=HDR()).json()
+    assert same["added"] == [] and same["removed"] == []
+    old = client.get("/content/quotes/sync", params={"since": "zzz"}, headers=HDR()).json()
+    assert old == {"from": "zzz", "to": "bbb", "reset": True}
+    assert "qs:zzz:bbb" not in cache.mem  # unknown versions are never cached
+
+def test_sync_unavailable(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "QUOTES_SYNC_DIR", str(tmp_path / "missing"))
+    cache.mem.clear()
+    r = client.get("/content/quotes/sync", params={"since": "aaa"}, headers=HDR())
+    assert r.status_code == 404
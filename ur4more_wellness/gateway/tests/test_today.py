@@ -0,0 +1,47 @@
+import asyncio
+from fastapi.testclient import TestClient
+from app.main import app
+import jwt, time
+from app.config import settings
+from app.deps import make_cache_key
+from app.services.cache import cache
+
+def token():
+    now = int(time.time())
+    payload = {"sub":"test","iss":settings.JWT_ISS,"aud":settings.JWT_AUD,"iat":now,"exp":now+3600}
+    return jwt.encode(payload, settings.JWT_SECRET_V1, algorithm="HS256", headers={"kid":settings.JWT_KID})
+
+client = TestClient(app)
+HDR = lambda: {"Authorization": f"Bearer {token()}"}
+
+def test_today_off_only_quotes():
+    r = client.post("/content/today", headers=HDR(), json={
+        "faithMode":"off","lightConsentGiven":False,"hideFaithOverlaysInMind":False,"topic":"temperance","limit":3
+    })
+    assert r.status_code == 200
+    data = r.json()
+    assert data["faithAllowed"] is False
+    assert data["scripture"] is None and data["prayers"] is None and data["devotionals"] is None
+    assert len(data["quotes"]) >= 1
+    for q in data["quotes"]:
+        assert "faith" not in q.get("tags", [])
+
+def test_today_light_all_sections():
+    r = client.post("/content/today", headers=HDR(), json={
+        "faithMode":"light","lightConsentGiven":True,"hideFaithOverlaysInMind":False,"topic":"peace","theme":"gluttony","limit":2
+    })
+    assert r.status_code == 200
+    data = r.json()
+    assert data["faithAllowed"] is True
+    assert data["scripture"]["ref"].startswith("1 Corinthians 9")
+    assert len(data["prayers"]) >= 1 and len(data["devotionals"]) >= 1
+
+def test_today_shares_cache_with_single_routes():
+    body = {"faithMode":"disciple","lightConsentGiven":False,"hideFaithOverlaysInMind":False,"topic":"hope","limit":4}
+    single = client.post("/content/quotes", headers=HDR(), json=body).json()
+    key = make_cache_key("/quotes", body)
+    assert asyncio.run(cache.get(key)) is not None
+    r = client.post("/content/today", headers=HDR(), json={**body, "sections":["quotes"]})
+    assert r.status_code == 200
+    assert r.json()["quotes"] == single
+    assert "scripture" not in r.json()
@@ -1,8 +1,10 @@
-import os, time, json, hashlib, functools
-from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List, Tuple
+import os, sys, time, json, hashlib, functools, base64, random, secrets, threading, sqlite3, atexit
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple, Union
+from urllib.parse import urlparse
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g, has_request_context
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
@@ -11,6 +13,12 @@ import jwt
 from dotenv import load_dotenv
 import requests
 
+from content_engine import CORPUS_STAMP, KJV_DB, LOCAL_QUOTES, filter_quote, filter_scripture, gating, rank_quotes
+from content_engine.compression import compress, negotiate
+from content_engine.breaker import CircuitBreaker
+from content_engine.disk_cache import DiskCache
+from content_engine.fanout import first_success, gather_within
+
 # -------------------------
 # Config
 # -------------------------
@@ -20,12 +28,33 @@ PORT = int(os.getenv("PORT", "8080"))
 ENV = os.getenv("ENV", "dev")
 
 REDIS_URL = os.getenv("REDIS_URL") or ""
+# Redis call cap; after REDIS_BREAKER_FAILURES errors the cache serves from memory for REDIS_BREAKER_RESET_SEC
+REDIS_TIMEOUT_MS = int(os.getenv("REDIS_TIMEOUT_MS", "100"))
+REDIS_BREAKER_FAILURES = int(os.getenv("REDIS_BREAKER_FAILURES", "5"))
+REDIS_BREAKER_RESET_SEC = float(os.getenv("REDIS_BREAKER_RESET_SEC", "10"))
+# /ready only fails on Redis when this is set (the memory fallback serves otherwise), as in the FastAPI gateway
+READY_REQUIRE_REDIS = os.getenv("READY_REQUIRE_REDIS", "0") == "1"
 CACHE_TTL_SEC = int(os.getenv("CACHE_TTL_SEC", "120"))
+# On-disk cache tier that survives restarts (SQLite file; empty = off), its size cap, hot keys reloaded at startup
+DISK_CACHE_PATH = os.getenv("DISK_CACHE_PATH") or ""
+DISK_CACHE_MAX_MB = int(os.getenv("DISK_CACHE_MAX_MB", "256"))
+DISK_CACHE_WARM_KEYS = int(os.getenv("DISK_CACHE_WARM_KEYS", "1000"))
+
+# Response compression (bodies below the threshold go out as-is)
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+COMPRESSED_TTL_SEC = int(os.getenv("COMPRESSED_TTL_SEC", "3600"))
 
 RATE_LIMIT_PER_MIN = int(os.getenv("RATE_LIMIT_PER_MIN", "60"))
 
 ENABLE_EXTERNAL = os.getenv("ENABLE_EXTERNAL", "1") == "1"  # Enable by default for wisdom quotes
 ALLOW_FAITH_IN_LIGHT_BY_DEFAULT = os.getenv("ALLOW_FAITH_IN_LIGHT_BY_DEFAULT", "0") == "1"
+# External fan-out: pooled threads shared by all requests, and the most any request waits on providers
+EXTERNAL_FETCH_WORKERS = int(os.getenv("EXTERNAL_FETCH_WORKERS", "16"))
+EXTERNAL_DEADLINE_SEC = float(os.getenv("EXTERNAL_DEADLINE_SEC", "3"))
+# Background thread that fetches and accumulates the daily external content (0 = queue only, e.g. a separate worker runs it)
+DAILY_WORKER = os.getenv("DAILY_WORKER", "1") == "1"
+# Point every external provider at a local simulator (gateway/bench/simulator.py), e.g. http://127.0.0.1:9900
+PROVIDER_SIMULATOR_URL = os.getenv("PROVIDER_SIMULATOR_URL") or ""
 
 JWT_KID = os.getenv("JWT_KID", "v1")
 JWT_SECRET_V1 = os.getenv("JWT_SECRET_V1", "dev-secret-change-me")
@@ -35,6 +64,14 @@ JWT_AUD = os.getenv("JWT_AUD", "ur4more-apps")
 
 CORS_ORIGINS = [x.strip() for x in os.getenv("CORS_ORIGINS", "*").split(",") if x.strip()]
 
+# Release stamp reported as the manifest updatedAt (default: the corpus's committed CORPUS_STAMP)
+CORPUS_UPDATED_AT = os.getenv("CORPUS_UPDATED_AT") or ""
+
+# Request capture for gateway/bench/replay.py: share of users sampled (0 = off), JSONL output, hashing salt
+CAPTURE_SAMPLE_RATE = float(os.getenv("CAPTURE_SAMPLE_RATE", "0"))
+CAPTURE_PATH = os.getenv("CAPTURE_PATH", "capture.jsonl")
+CAPTURE_SALT = os.getenv("CAPTURE_SALT", "")  # empty: generated once and kept in CAPTURE_PATH.salt
+
 # -------------------------
 # Flask
 # -------------------------
@@ -52,15 +89,75 @@ limiter = Limiter(
 # -------------------------
 try:
     import redis
-    rds = redis.Redis.from_url(REDIS_URL, decode_responses=True) if REDIS_URL else None
+    from redis.exceptions import RedisError
+    _redis_opts = {"socket_timeout": REDIS_TIMEOUT_MS / 1000, "socket_connect_timeout": REDIS_TIMEOUT_MS / 1000}
+    rds = redis.Redis.from_url(REDIS_URL, decode_responses=True, **_redis_opts) if REDIS_URL else None
+    rds_bin = redis.Redis.from_url(REDIS_URL, **_redis_opts) if REDIS_URL else None  # compressed variants
 except Exception:
     rds = None
+    rds_bin = None
+    RedisError = OSError
 
-_mem_cache: Dict[str, Tuple[str, float]] = {}
+# key -> (JSON text or compressed bytes, expires_at or None); also the fallback while Redis is failing
+_mem_cache: Dict[str, Tuple[Union[str, bytes], Optional[float]]] = {}
 
-def cache_get(key: str) -> Optional[str]:
+redis_breaker = CircuitBreaker(REDIS_BREAKER_FAILURES, REDIS_BREAKER_RESET_SEC)
+_REDIS_DOWN = object()
+
+def _redis_call(fn, *args) -> Any:
+    """One Redis call under the breaker; _REDIS_DOWN when the in-process cache has to serve it"""
+    if not redis_breaker.allow():
+        return _REDIS_DOWN
+    try:
+        result = fn(*args)
+    except (RedisError, OSError):
+        redis_breaker.failure()
+        return _REDIS_DOWN
+    except BaseException:
+        redis_breaker.abandon()  # a half-open trial must not stay in flight forever
+        raise
+    redis_breaker.success()
+    return result
+
+disk_cache = DiskCache(DISK_CACHE_PATH, DISK_CACHE_MAX_MB) if DISK_CACHE_PATH else None
+
+def _promote(key: str, value: Any, exp: float):
+    """Put a disk entry back in the tier lookups read first (Redis when configured) for its remaining TTL"""
+    client = rds_bin if isinstance(value, bytes) else rds
+    if not client or _redis_call(client.setex, key, max(1, int(exp - time.time())), value) is _REDIS_DOWN:
+        _mem_cache[key] = (value, exp)
+
+def _disk_lookup(key: str) -> Optional[Any]:
+    """L3 lookup; a hit is promoted for its remaining TTL"""
+    rec = disk_cache.get(key) if disk_cache else None
+    if rec is None: return None
+    disk_cache.touch(key)
+    _promote(key, *rec)
+    return rec[0]
+
+def _disk_store(key: str, value: Any, ttl: int):
+    if disk_cache:
+        disk_cache.set(key, value, time.time() + ttl)
+
+# Startup stage timings reported by /ready
+STARTUP_STAGES: Dict[str, Dict[str, Any]] = {}
+
+def _disk_warm():
+    """Startup: promote the hottest unexpired disk entries"""
+    t0 = time.perf_counter()
+    warmed = 0
+    if disk_cache:
+        for key, value, exp in disk_cache.hottest(DISK_CACHE_WARM_KEYS):
+            _promote(key, value, exp)
+            warmed += 1
+        atexit.register(disk_cache.snapshot)
+    STARTUP_STAGES["cache"] = {"ok": True, "ms": round((time.perf_counter() - t0) * 1000, 1), "warmedKeys": warmed}
+
+def _cache_lookup(key: str) -> Optional[str]:
     if rds:
-        return rds.get(key)
+        val = _redis_call(rds.get, key)
+        if val is not _REDIS_DOWN:
+            return val
     rec = _mem_cache.get(key)
     if not rec: return None
     val, exp = rec
@@ -69,18 +166,169 @@ def cache_get(key: str) -> Optional[str]:
         return None
     return val
 
+def cache_get(key: str) -> Optional[str]:
+    val = _cache_lookup(key)
+    if val is None:
+        val = _disk_lookup(key)
+    elif disk_cache:
+        disk_cache.touch(key)
+    # Response cache entries are counted for X-Cache and request capture
+    if key.startswith("cg:") and has_request_context() and "cache_lookups" in g:
+        g.cache_lookups.append(val is not None)
+    return val
+
 def cache_set(key: str, value: Any, ttl: Optional[int] = None):
     s = json.dumps(value)
     ttl = ttl or CACHE_TTL_SEC
-    if rds:
-        rds.setex(key, ttl, s)
-    else:
+    if not rds or _redis_call(rds.setex, key, ttl, s) is _REDIS_DOWN:
         _mem_cache[key] = (s, time.time() + ttl)
+    _disk_store(key, s, ttl)
 
 def make_cache_key(path: str, payload: Dict[str, Any]) -> str:
     body = json.dumps({"p": path, "b": payload}, sort_keys=True, separators=(",", ":"))
     return "cg:" + hashlib.sha256(body.encode()).hexdigest()
 
+def cache_get_bytes(key: str) -> Optional[bytes]:
+    val = _redis_call(rds_bin.get, key) if rds_bin else _REDIS_DOWN
+    if val is _REDIS_DOWN:
+        rec = _mem_cache.get(key)
+        val = rec[0] if rec and not (rec[1] and rec[1] < time.time()) else None
+        if rec and val is None:
+            _mem_cache.pop(key, None)
+    if val is None:
+        return _disk_lookup(key)
+    if disk_cache:
+        disk_cache.touch(key)
+    return val
+
+def cache_set_bytes(key: str, data: bytes, ttl: Optional[int] = None):
+    ttl = ttl or CACHE_TTL_SEC
+    if not rds_bin or _redis_call(rds_bin.setex, key, ttl, data) is _REDIS_DOWN:
+        _mem_cache[key] = (data, time.time() + ttl)
+    _disk_store(key, data, ttl)
+
+_disk_warm()
+
+# -------------------------
+# Compressed JSON responses (negotiation and compression from the shared content engine)
+# -------------------------
+def json_response(payload: str):
+    """Send a serialized JSON body, compressed once per content hash and reused from the cache"""
+    raw = payload.encode()
+    encoding = negotiate(request.headers.get("Accept-Encoding")) if len(raw) >= COMPRESS_MIN_BYTES else None
+    if not encoding:
+        resp = app.response_class(response=raw, mimetype="application/json")
+    else:
+        key = f"cz:{hashlib.sha256(raw).hexdigest()[:32]}:{encoding}"
+        data = cache_get_bytes(key)
+        if data is None:
+            data = compress(raw, encoding)
+            cache_set_bytes(key, data, COMPRESSED_TTL_SEC)
+        resp = app.response_class(response=data, mimetype="application/json")
+        resp.headers["Content-Encoding"] = encoding
+    resp.headers["Vary"] = "Accept-Encoding"
+    return resp
+
+# -------------------------
+# Request capture (same compact JSONL format as the FastAPI gateway)
+# -------------------------
+CAPTURE_FLAG_FIELDS = ("faithMode", "lightConsentGiven", "hideFaithOverlaysInMind", "limit", "sections")
+CAPTURE_TEXT_FIELDS = ("topic", "theme")
+_capture_lock = threading.Lock()
+_capture_vocabulary: Optional[set] = None
+_capture_salts: Dict[str, str] = {}
+
+def capture_salt() -> str:
+    """CAPTURE_SALT, else one generated next to CAPTURE_PATH and shared by every worker and restart
+    (a per-process salt would break whole-user sampling). Linked into place so racing workers agree."""
+    if CAPTURE_SALT:
+        return CAPTURE_SALT
+    path = CAPTURE_PATH + ".salt"
+    if path not in _capture_salts:
+        if not os.path.exists(path):
+            tmp = f"{path}.{os.getpid()}"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(secrets.token_hex(16))
+            try:
+                os.link(tmp, path)
+            except FileExistsError:
+                pass  # another worker won
+            finally:
+                os.unlink(tmp)
+        with open(path, encoding="utf-8") as f:
+            _capture_salts[path] = f.read().strip()
+    return _capture_salts[path]
+
+def _capture_hash(value: str) -> str:
+    return hashlib.sha256((capture_salt() + value).encode()).hexdigest()[:12]
+
+def capture_subject(authorization: str) -> Optional[str]:
+    """Hashed `sub` claim of the bearer token (read without verification)"""
+    if not authorization.lower().startswith("bearer "):
+        return None
+    try:
+        part = authorization.split(" ", 1)[1].split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(part + "=" * (-len(part) % 4)))
+        return _capture_hash(str(claims.get("sub", "")))
+    except (IndexError, ValueError, AttributeError):
+        return None
+
+def capture_anonymise(body: Any) -> Dict[str, Any]:
+    """Keep the fields that drive caching; corpus topics stay verbatim, free text is hashed"""
+    global _capture_vocabulary
+    if not isinstance(body, dict):
+        return {}
+    if _capture_vocabulary is None:
+        _capture_vocabulary = {t for q in LOCAL_QUOTES for t in q.get("tags", [])} | set(KJV_DB)
+    out = {k: body[k] for k in CAPTURE_FLAG_FIELDS if k in body}
+    for k in CAPTURE_TEXT_FIELDS:
+        value = body.get(k)
+        if isinstance(value, str) and value:
+            term = value.lower().strip()
+            out[k] = term if term in _capture_vocabulary else "h:" + _capture_hash(term)
+    return out
+
+@app.before_request
+def _capture_start():
+    if not request.path.startswith("/content/"):
+        return
+    g.cache_lookups = []
+    g.capture = None
+    if CAPTURE_SAMPLE_RATE <= 0:
+        return
+    user = capture_subject(request.headers.get("Authorization", ""))
+    # Sample whole users so their revalidation pattern survives
+    if not (int(user[:8], 16) / 0xFFFFFFFF < CAPTURE_SAMPLE_RATE if user else random.random() < CAPTURE_SAMPLE_RATE):
+        return
+    record = {"t": round(time.time(), 3), "u": user, "m": request.method, "p": request.path}
+    if request.query_string:
+        record["q"] = request.query_string.decode()
+    if request.method == "POST":
+        record["b"] = capture_anonymise(request.get_json(force=True, silent=True))
+    if request.headers.get("If-None-Match"):
+        record["inm"] = 1
+    g.capture = record
+    g.capture_t0 = time.perf_counter()
+
+@app.after_request
+def _capture_finish(resp):
+    lookups = g.get("cache_lookups")
+    status = None
+    if lookups:
+        hits = sum(lookups)
+        status = "hit" if hits == len(lookups) else "miss" if hits == 0 else "partial"
+        resp.headers["X-Cache"] = status
+    record = g.get("capture")
+    if record is not None:
+        record.update({"s": resp.status_code, "ms": round((time.perf_counter() - g.capture_t0) * 1000, 1)})
+        if status:
+            record["c"] = status
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with _capture_lock:
+            with open(CAPTURE_PATH, "a", encoding="utf-8") as f:
+                f.write(line)
+    return resp
+
 # -------------------------
 # Auth (JWT HS256)
 # -------------------------
@@ -207,204 +455,221 @@ EXTERNAL_BIBLE_PROVIDERS = {
     }
 }
 
+def simulated_url(url: str) -> str:
+    """https://host/path -> PROVIDER_SIMULATOR_URL/host/path"""
+    parts = urlparse(url)
+    return f"{PROVIDER_SIMULATOR_URL.rstrip('/')}/{parts.netloc}{parts.path}"
+
+if PROVIDER_SIMULATOR_URL:
+    for _config in list(EXTERNAL_WISDOM_PROVIDERS.values()) + list(EXTERNAL_BIBLE_PROVIDERS.values()):
+        _config["url"] = simulated_url(_config["url"])
+
 # -------------------------
-# External Wisdom Quote Fetching
+# Provider connection pools and fan-out
 # -------------------------
+_provider_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+_fetch_pool = ThreadPoolExecutor(max_workers=EXTERNAL_FETCH_WORKERS, thread_name_prefix="provider")
+
+def provider_session(name: str) -> requests.Session:
+    """One keep-alive connection pool per provider, shared by all fetch threads"""
+    with _sessions_lock:
+        session = _provider_sessions.get(name)
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=EXTERNAL_FETCH_WORKERS, max_retries=0)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["User-Agent"] = "UR4More-Wellness/1.0"
+            _provider_sessions[name] = session
+        return session
+
+PROVIDER_READ_CHUNK = 16 * 1024
+
+def provider_get(name: str, url: str, params: Dict[str, Any]) -> Any:
+    """GET JSON from a provider within EXTERNAL_DEADLINE_SEC overall. The timeout passed to
+    requests only bounds each socket read, so the body is streamed and the deadline checked
+    after every read: a provider trickling its body frees the fetch thread at most one read
+    timeout after the deadline instead of holding it until the body ends."""
+    deadline = time.monotonic() + EXTERNAL_DEADLINE_SEC
+    with provider_session(name).get(url, params=params, stream=True,
+                                    timeout=(min(2.0, EXTERNAL_DEADLINE_SEC), EXTERNAL_DEADLINE_SEC)) as response:
+        response.raise_for_status()
+        body = bytearray()
+        while True:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{name}: response body not received within {EXTERNAL_DEADLINE_SEC}s")
+            chunk = response.raw.read1(PROVIDER_READ_CHUNK, decode_content=True)  # whatever has arrived, not a full chunk
+            if not chunk:
+                break
+            body += chunk
+    return json.loads(body)
+
 def fetch_external_wisdom_quotes() -> List[Dict[str, Any]]:
     """Fetch wisdom quotes from external APIs"""
     if not ENABLE_EXTERNAL:
         return []
     
-    all_quotes = []
-    
-    for provider_name, config in EXTERNAL_WISDOM_PROVIDERS.items():
-        if not config.get("enabled", False):
-            continue
-            
+    # All providers at once; the request waits for the slowest one only up to the deadline
+    deadline = time.monotonic() + EXTERNAL_DEADLINE_SEC
+    futures = [(name, _fetch_pool.submit(_fetch_wisdom_provider, name, config))
+               for name, config in EXTERNAL_WISDOM_PROVIDERS.items() if config.get("enabled", False)]
+    all_quotes = [q for _, quotes in gather_within(futures, deadline) for q in quotes]
+
+    print(f"Total external wisdom quotes fetched: {len(all_quotes)}")
+    return all_quotes
+
+def _fetch_wisdom_provider(provider_name: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    data = provider_get(provider_name, config["url"], config["params"])
+    quotes = data.get("results", data) if isinstance(data, dict) else data
+
+    transformed_quotes = []
+    for quote in quotes[:10]:  # Limit to 10 per provider
         try:
-            print(f"Fetching wisdom quotes from {provider_name}...")
-            response = requests.get(
-                config["url"], 
-                params=config["params"],
-                timeout=10,
-                headers={"User-Agent": "UR4More-Wellness/1.0"}
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            quotes = data.get("results", data) if isinstance(data, dict) else data
-            
-            for quote in quotes[:10]:  # Limit to 10 per provider
-                try:
-                    transformed = config["transform"](quote)
-                    all_quotes.append(transformed)
-                except Exception as e:
-                    print(f"Error transforming quote from {provider_name}: {e}")
-                    continue
-                    
-            print(f"Fetched {len(quotes[:10])} quotes from {provider_name}")
-            
+            transformed_quotes.append(config["transform"](quote))
         except Exception as e:
-            print(f"Error fetching from {provider_name}: {e}")
+            print(f"Error transforming quote from {provider_name}: {e}")
             continue
-    
-    print(f"Total external wisdom quotes fetched: {len(all_quotes)}")
-    return all_quotes
+
+    print(f"Fetched {len(transformed_quotes)} quotes from {provider_name}")
+    return transformed_quotes
 
 def get_daily_wisdom_quotes() -> List[Dict[str, Any]]:
     """Get wisdom quotes for today (local + external + accumulated)"""
     # Get local wisdom quotes
     local_wisdom = [q for q in LOCAL_QUOTES if "wisdom" in q.get("tags", [])]
     
-    # Get external wisdom quotes (cached for the day)
-    cache_key = f"wisdom_external_{datetime.now().strftime('%Y-%m-%d')}"
-    external_quotes = cache_get(cache_key)
-    
-    if external_quotes is None:
-        external_quotes = fetch_external_wisdom_quotes()
-        if external_quotes:
-            # Add new external quotes to accumulated storage
-            add_to_accumulated_quotes(external_quotes)
-            cache_set(cache_key, external_quotes, ttl=86400)  # Cache for 24 hours
+    # Get external wisdom quotes (cached for the day); the daily worker fetches them if missing
+    date = datetime.now().strftime('%Y-%m-%d')
+    cached = cache_get(f"wisdom_external_{date}")
+    if cached is None:
+        enqueue_daily_job("daily_wisdom", {"date": date})
+    external_quotes = json.loads(cached) if cached else []
     
     # Get accumulated quotes from previous days
-    accumulated_quotes = load_accumulated_quotes()
+    accumulated_quotes = daily_snapshot()["quotes"]
     
     # Combine and return (local + external + accumulated)
-    if external_quotes is None:
-        external_quotes = []
     all_wisdom = local_wisdom + external_quotes + accumulated_quotes
     print(f"Total wisdom quotes available: {len(all_wisdom)} (local: {len(local_wisdom)}, external: {len(external_quotes)}, accumulated: {len(accumulated_quotes)})")
     return all_wisdom
 
+def run_daily_wisdom_job(date: str):
+    """Daily worker: fetch today's external quotes, add them to the accumulated store and cache them"""
+    external_quotes = fetch_external_wisdom_quotes()
+    if external_quotes:
+        add_to_accumulated_quotes(external_quotes)
+        cache_set(f"wisdom_external_{date}", external_quotes, ttl=86400)  # Cache for 24 hours
+    elif ENABLE_EXTERNAL:
+        raise RuntimeError("no wisdom provider answered")  # retried with backoff
+
 # -------------------------
 # External Bible Scripture Fetching
 # -------------------------
 def fetch_external_bible_scripture(reference: str) -> Optional[Dict[str, Any]]:
-    """Fetch scripture from external Bible APIs"""
+    """Fetch scripture from external Bible APIs (all providers at once, first in priority order wins)"""
     if not ENABLE_EXTERNAL:
         return None
-    
-    for provider_name, config in EXTERNAL_BIBLE_PROVIDERS.items():
-        if not config.get("enabled", False):
-            continue
-            
-        try:
-            print(f"Fetching scripture from {provider_name} for {reference}...")
-            
-            # Prepare URL and parameters
-            url = config["url"]
-            params = config["params"].copy()
-            
-            # Add reference to params based on provider
-            if provider_name == "bible_api":
-                url = f"{url}/{reference.replace(' ', '%20')}"
-            elif provider_name == "bible_gateway_votd":
-                # VOTD doesn't need reference, it's daily
-                pass
-            elif provider_name == "bible_org_labs":
-                url = f"{url}?passage={reference.replace(' ', '%20')}"
-            
-            response = requests.get(
-                url,
-                params=params,
-                timeout=10,
-                headers={"User-Agent": "UR4More-Wellness/1.0"}
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Extract text based on provider response format
-            text = ""
-            if provider_name == "bible_api":
-                text = data.get("text", "")
-            elif provider_name == "bible_gateway_votd":
-                text = data.get("votd", {}).get("content", "")
-                reference = data.get("votd", {}).get("display_ref", reference)
-            elif provider_name == "bible_org_labs":
-                text = data[0].get("text", "") if data else ""
+    return first_success(_submit_bible_providers(reference), time.monotonic() + EXTERNAL_DEADLINE_SEC)
+
+def _submit_bible_providers(reference: str) -> List[Tuple[str, Future]]:
+    return [(name, _fetch_pool.submit(_fetch_bible_provider, name, config, reference))
+            for name, config in EXTERNAL_BIBLE_PROVIDERS.items() if config.get("enabled", False)]
+
+def _fetch_bible_provider(provider_name: str, config: Dict[str, Any], reference: str) -> Optional[Dict[str, Any]]:
+    try:
+        print(f"Fetching scripture from {provider_name} for {reference}...")
+        
+        # Prepare URL and parameters
+        url = config["url"]
+        params = config["params"].copy()
+        
+        # Add reference to params based on provider
+        if provider_name == "bible_api":
+            url = f"{url}/{reference.replace(' ', '%20')}"
+        elif provider_name == "bible_gateway_votd":
+            # VOTD doesn't need reference, it's daily
+            pass
+        elif provider_name == "bible_org_labs":
+            url = f"{url}?passage={reference.replace(' ', '%20')}"
+        
+        data = provider_get(provider_name, url, params)
+        
+        # Extract text based on provider response format
+        text = ""
+        if provider_name == "bible_api":
+            text = data.get("text", "")
+        elif provider_name == "bible_gateway_votd":
+            text = data.get("votd", {}).get("content", "")
+            reference = data.get("votd", {}).get("display_ref", reference)
+        elif provider_name == "bible_org_labs":
+            text = data[0].get("text", "") if data else ""
+        
+        if text:
+            transformed = config["transform"](reference, text)
+            print(f"Fetched scripture from {provider_name}")
+            return transformed
             
-            if text:
-                transformed = config["transform"](reference, text)
-                print(f"Fetched scripture from {provider_name}")
-                return transformed
-                
-        except Exception as e:
-            print(f"Error fetching from {provider_name}: {e}")
-            continue
+    except Exception as e:
+        print(f"Error fetching from {provider_name}: {e}")
     
     return None
 
+# All 66 books of the Bible with key verses; the daily worker samples these
+BIBLE_REFERENCES = [
+    # Old Testament (39 books)
+    "Genesis 1:1", "Genesis 3:15", "Genesis 12:2", "Genesis 22:17",
+    "Exodus 3:14", "Exodus 20:3", "Exodus 34:6", "Leviticus 19:18",
+    "Numbers 6:24", "Numbers 14:18", "Deuteronomy 6:4", "Deuteronomy 31:6",
+    "Joshua 1:9", "Joshua 24:15", "Judges 6:12", "Ruth 1:16",
+    "1 Samuel 16:7", "2 Samuel 7:16", "1 Kings 8:27", "2 Kings 19:15",
+    "1 Chronicles 16:34", "2 Chronicles 7:14", "Ezra 7:10", "Nehemiah 8:10",
+    "Esther 4:14", "Job 1:21", "Job 42:2", "Psalm 1:1", "Psalm 23:1", "Psalm 46:1", "Psalm 91:1", "Psalm 100:1", "Psalm 119:105", "Psalm 139:14",
+    "Proverbs 1:7", "Proverbs 3:5", "Proverbs 9:10", "Proverbs 16:9", "Proverbs 22:6", "Proverbs 31:10",
+    "Ecclesiastes 3:1", "Ecclesiastes 12:13", "Song of Solomon 2:16", "Song of Solomon 8:7",
+    "Isaiah 7:14", "Isaiah 9:6", "Isaiah 40:31", "Isaiah 53:5", "Isaiah 55:8", "Isaiah 61:1",
+    "Jeremiah 1:5", "Jeremiah 29:11", "Jeremiah 31:3", "Lamentations 3:22",
+    "Ezekiel 36:26", "Ezekiel 37:5", "Daniel 2:20", "Daniel 6:23",
+    "Hosea 6:6", "Joel 2:28", "Amos 5:24", "Obadiah 1:4",
+    "Jonah 2:2", "Micah 6:8", "Nahum 1:7", "Habakkuk 2:4",
+    "Zephaniah 3:17", "Haggai 2:9", "Zechariah 4:6", "Malachi 3:6",
+
+    # New Testament (27 books)
+    "Matthew 1:23", "Matthew 5:14", "Matthew 6:33", "Matthew 11:28", "Matthew 16:18", "Matthew 28:19",
+    "Mark 1:15", "Mark 10:45", "Mark 16:15", "Luke 1:37", "Luke 2:11", "Luke 6:31", "Luke 19:10",
+    "John 1:1", "John 3:16", "John 8:12", "John 10:10", "John 14:6", "John 15:13", "John 20:31",
+    "Acts 1:8", "Acts 2:38", "Acts 4:12", "Acts 16:31", "Acts 20:24",
+    "Romans 1:16", "Romans 3:23", "Romans 5:8", "Romans 6:23", "Romans 8:28", "Romans 10:9", "Romans 12:1",
+    "1 Corinthians 13:4", "1 Corinthians 15:55", "2 Corinthians 5:17", "2 Corinthians 9:8",
+    "Galatians 2:20", "Galatians 5:22", "Galatians 6:9", "Ephesians 2:8", "Ephesians 4:32", "Ephesians 6:10",
+    "Philippians 1:21", "Philippians 4:13", "Philippians 4:19", "Colossians 3:23", "Colossians 4:6",
+    "1 Thessalonians 5:16", "1 Thessalonians 5:18", "2 Thessalonians 3:3", "1 Timothy 1:15", "1 Timothy 4:12",
+    "2 Timothy 1:7", "2 Timothy 3:16", "Titus 2:11", "Titus 3:5", "Philemon 1:6",
+    "Hebrews 4:12", "Hebrews 11:1", "Hebrews 12:2", "Hebrews 13:8", "James 1:2", "James 1:17", "James 2:26",
+    "1 Peter 2:9", "1 Peter 3:15", "1 Peter 5:7", "2 Peter 1:3", "2 Peter 3:9",
+    "1 John 1:9", "1 John 3:16", "1 John 4:8", "1 John 4:19", "2 John 1:6", "3 John 1:2",
+    "Jude 1:24", "Revelation 1:8", "Revelation 3:20", "Revelation 21:4", "Revelation 22:13"
+]
+
 def get_daily_bible_scripture(theme: str = "") -> List[Dict[str, Any]]:
     """Get Bible scripture for today (external + local + accumulated)"""
-    # Try external scripture first (cached for the day)
-    cache_key = f"bible_external_{datetime.now().strftime('%Y-%m-%d')}_{theme}"
-    external_scripture = cache_get(cache_key)
-    
-    if external_scripture is None:
-        # Fetch multiple scriptures from external APIs to build up the library
-        import random
-        # All 66 books of the Bible with key verses
-        all_bible_references = [
-            # Old Testament (39 books)
-            "Genesis 1:1", "Genesis 3:15", "Genesis 12:2", "Genesis 22:17",
-            "Exodus 3:14", "Exodus 20:3", "Exodus 34:6", "Leviticus 19:18",
-            "Numbers 6:24", "Numbers 14:18", "Deuteronomy 6:4", "Deuteronomy 31:6",
-            "Joshua 1:9", "Joshua 24:15", "Judges 6:12", "Ruth 1:16",
-            "1 Samuel 16:7", "2 Samuel 7:16", "1 Kings 8:27", "2 Kings 19:15",
-            "1 Chronicles 16:34", "2 Chronicles 7:14", "Ezra 7:10", "Nehemiah 8:10",
-            "Esther 4:14", "Job 1:21", "Job 42:2", "Psalm 1:1", "Psalm 23:1", "Psalm 46:1", "Psalm 91:1", "Psalm 100:1", "Psalm 119:105", "Psalm 139:14",
-            "Proverbs 1:7", "Proverbs 3:5", "Proverbs 9:10", "Proverbs 16:9", "Proverbs 22:6", "Proverbs 31:10",
-            "Ecclesiastes 3:1", "Ecclesiastes 12:13", "Song of Solomon 2:16", "Song of Solomon 8:7",
-            "Isaiah 7:14", "Isaiah 9:6", "Isaiah 40:31", "Isaiah 53:5", "Isaiah 55:8", "Isaiah 61:1",
-            "Jeremiah 1:5", "Jeremiah 29:11", "Jeremiah 31:3", "Lamentations 3:22",
-            "Ezekiel 36:26", "Ezekiel 37:5", "Daniel 2:20", "Daniel 6:23",
-            "Hosea 6:6", "Joel 2:28", "Amos 5:24", "Obadiah 1:4",
-            "Jonah 2:2", "Micah 6:8", "Nahum 1:7", "Habakkuk 2:4",
-            "Zephaniah 3:17", "Haggai 2:9", "Zechariah 4:6", "Malachi 3:6",
-            
-            # New Testament (27 books)
-            "Matthew 1:23", "Matthew 5:14", "Matthew 6:33", "Matthew 11:28", "Matthew 16:18", "Matthew 28:19",
-            "Mark 1:15", "Mark 10:45", "Mark 16:15", "Luke 1:37", "Luke 2:11", "Luke 6:31", "Luke 19:10",
-            "John 1:1", "John 3:16", "John 8:12", "John 10:10", "John 14:6", "John 15:13", "John 20:31",
-            "Acts 1:8", "Acts 2:38", "Acts 4:12", "Acts 16:31", "Acts 20:24",
-            "Romans 1:16", "Romans 3:23", "Romans 5:8", "Romans 6:23", "Romans 8:28", "Romans 10:9", "Romans 12:1",
-            "1 Corinthians 13:4", "1 Corinthians 15:55", "2 Corinthians 5:17", "2 Corinthians 9:8",
-            "Galatians 2:20", "Galatians 5:22", "Galatians 6:9", "Ephesians 2:8", "Ephesians 4:32", "Ephesians 6:10",
-            "Philippians 1:21", "Philippians 4:13", "Philippians 4:19", "Colossians 3:23", "Colossians 4:6",
-            "1 Thessalonians 5:16", "1 Thessalonians 5:18", "2 Thessalonians 3:3", "1 Timothy 1:15", "1 Timothy 4:12",
-            "2 Timothy 1:7", "2 Timothy 3:16", "Titus 2:11", "Titus 3:5", "Philemon 1:6",
-            "Hebrews 4:12", "Hebrews 11:1", "Hebrews 12:2", "Hebrews 13:8", "James 1:2", "James 1:17", "James 2:26",
-            "1 Peter 2:9", "1 Peter 3:15", "1 Peter 5:7", "2 Peter 1:3", "2 Peter 3:9",
-            "1 John 1:9", "1 John 3:16", "1 John 4:8", "1 John 4:19", "2 John 1:6", "3 John 1:2",
-            "Jude 1:24", "Revelation 1:8", "Revelation 3:20", "Revelation 21:4", "Revelation 22:13"
-        ]
-        
-        # Fetch 3-5 random scriptures to build up the library
-        num_to_fetch = random.randint(3, 5)
-        fetched_scriptures = []
-        
-        for _ in range(num_to_fetch):
-            reference = random.choice(all_bible_references)
-            scripture = fetch_external_bible_scripture(reference)
-            if scripture:
-                fetched_scriptures.append(scripture)
-        
-        if fetched_scriptures:
-            external_scripture = fetched_scriptures
-            # Add new external scriptures to accumulated storage
-            add_to_accumulated_scripture(external_scripture)
-            cache_set(cache_key, external_scripture, ttl=86400)  # Cache for 24 hours
-        else:
-            external_scripture = []
+    # Only known themes get their own job and cache entry; free text shares the general one
+    theme = theme.strip().lower()
+    if theme not in KJV_DB:
+        theme = ""
+    # Try external scripture first (cached for the day); the daily worker fetches it if missing
+    date = datetime.now().strftime('%Y-%m-%d')
+    cached = cache_get(f"bible_external_{date}_{theme}")
+    if cached is None:
+        enqueue_daily_job("daily_scripture", {"date": date, "theme": theme})
+    external_scripture = json.loads(cached) if cached else []
     
     # Get accumulated scripture from previous days
-    accumulated_scripture = load_accumulated_scripture()
+    accumulated_scripture = daily_snapshot()["scripture"]
     
     # Get local scripture as fallback
     local_scripture = []
-    if theme and theme in KJV_DB:
+    if theme:
         local_scripture = KJV_DB[theme]
     else:
         # Get all local scripture
@@ -416,6 +681,27 @@ def get_daily_bible_scripture(theme: str = "") -> List[Dict[str, Any]]:
     print(f"Total scripture available: {len(all_scripture)} (external: {len(external_scripture)}, accumulated: {len(accumulated_scripture)}, local: {len(local_scripture)})")
     return all_scripture
 
+def run_daily_scripture_job(date: str, theme: str = ""):
+    """Daily worker: fetch 3-5 random scriptures to build up the library, then cache them for the day"""
+    num_to_fetch = random.randint(3, 5)
+    fetched_scriptures = []
+    
+    if ENABLE_EXTERNAL:
+        # Every reference and provider in flight together, under one deadline
+        deadline = time.monotonic() + EXTERNAL_DEADLINE_SEC
+        in_flight = [_submit_bible_providers(random.choice(BIBLE_REFERENCES)) for _ in range(num_to_fetch)]
+        for futures in in_flight:
+            scripture = first_success(futures, deadline)
+            if scripture:
+                fetched_scriptures.append(scripture)
+    
+    if fetched_scriptures:
+        # Add new external scriptures to accumulated storage
+        add_to_accumulated_scripture(fetched_scriptures)
+        cache_set(f"bible_external_{date}_{theme}", fetched_scriptures, ttl=86400)  # Cache for 24 hours
+    elif ENABLE_EXTERNAL:
+        raise RuntimeError("no scripture provider answered")  # retried with backoff
+
 # -------------------------
 # Daily Storage System
 # -------------------------
@@ -444,8 +730,10 @@ def save_accumulated_quotes(quotes: List[Dict[str, Any]]):
     """Save accumulated quotes to storage"""
     ensure_storage_dir()
     try:
-        with open(QUOTES_STORAGE_FILE, 'w', encoding='utf-8') as f:
+        # Write then rename, so readers never see a half-written file
+        with open(QUOTES_STORAGE_FILE + ".tmp", 'w', encoding='utf-8') as f:
             json.dump(quotes, f, indent=2, ensure_ascii=False)
+        os.replace(QUOTES_STORAGE_FILE + ".tmp", QUOTES_STORAGE_FILE)
         print(f"Saved {len(quotes)} accumulated quotes to storage")
     except Exception as e:
         print(f"Error saving accumulated quotes: {e}")
@@ -465,8 +753,9 @@ def save_accumulated_scripture(scripture: List[Dict[str, Any]]):
     """Save accumulated scripture to storage"""
     ensure_storage_dir()
     try:
-        with open(SCRIPTURE_STORAGE_FILE, 'w', encoding='utf-8') as f:
+        with open(SCRIPTURE_STORAGE_FILE + ".tmp", 'w', encoding='utf-8') as f:
             json.dump(scripture, f, indent=2, ensure_ascii=False)
+        os.replace(SCRIPTURE_STORAGE_FILE + ".tmp", SCRIPTURE_STORAGE_FILE)
         print(f"Saved {len(scripture)} accumulated scripture to storage")
     except Exception as e:
         print(f"Error saving accumulated scripture: {e}")
@@ -540,309 +829,139 @@ def add_to_accumulated_scripture(new_scripture: List[Dict[str, Any]]):
     return accumulated
 
 # -------------------------
-# Faith gating
+# Daily worker (write-behind accumulation)
 # -------------------------
-def faith_allowed(mode: str, light_consent: bool, hide_in_mind: bool) -> bool:
-    if hide_in_mind: return False
-    m = (mode or "off").lower()
-    if m == "off": return False
-    if m == "light":
-        return light_consent or ALLOW_FAITH_IN_LIGHT_BY_DEFAULT
-    return True  # disciple/kingdom
+# Requests never fetch or write the store: they enqueue the day's job and read the snapshot.
+# Jobs live in SQLite, so a restart resumes them; a job left "running" by a crash is retried.
+JOBS_DB_FILE = os.path.join(STORAGE_DIR, "jobs.sqlite")
+DAILY_JOB_MAX_ATTEMPTS = 5
+DAILY_JOB_RETRY_SEC = 60
+DAILY_JOB_KEEP_DAYS = 3  # finished and failed jobs are deleted after this long
 
-# -------------------------
-# Local content (expanded from your gateway)
-# -------------------------
-LOCAL_QUOTES = [
-    # Faith-based quotes
-    {"id": "faith_1", "text": "The fear of the Lord is the beginning of wisdom.", "author": "Proverbs 9:10 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","wisdom"]},
-    {"id": "faith_2", "text": "Trust in the Lord with all thine heart; and lean not unto thine own understanding.", "author": "Proverbs 3:5 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","trust"]},
-    {"id": "faith_3", "text": "I can do all things through Christ which strengtheneth me.", "author": "Philippians 4:13 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","strength"]},
-    {"id": "faith_4", "text": "For I know the thoughts that I think toward you, saith the Lord, thoughts of peace, and not of evil, to give you an expected end.", "author": "Jeremiah 29:11 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","hope"]},
-    {"id": "faith_5", "text": "Be still, and know that I am God: I will be exalted among the heathen, I will be exalted in the earth.", "author": "Psalm 46:10 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","peace"]},
-    {"id": "faith_6", "text": "And we know that all things work together for good to them that love God, to them who are the called according to his purpose.", "author": "Romans 8:28 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","purpose"]},
-    {"id": "faith_7", "text": "But they that wait upon the Lord shall renew their strength; they shall mount up with wings as eagles; they shall run, and not be weary; and they shall walk, and not faint.", "author": "Isaiah 40:31 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","endurance"]},
-    {"id": "faith_8", "text": "For God so loved the world, that he gave his only begotten Son, that whosoever believeth in him should not perish, but have everlasting life.", "author": "John 3:16 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","love"]},
-    {"id": "faith_9", "text": "The Lord is my shepherd; I shall not want.", "author": "Psalm 23:1 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","provision"]},
-    {"id": "faith_10", "text": "Come unto me, all ye that labour and are heavy laden, and I will give you rest.", "author": "Matthew 11:28 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","rest"]},
-    {"id": "faith_11", "text": "Greater love hath no man than this, that a man lay down his life for his friends.", "author": "John 15:13 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","sacrifice"]},
-    {"id": "faith_12", "text": "Let not your heart be troubled: ye believe in God, believe also in me.", "author": "John 14:1 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","comfort"]},
-    {"id": "faith_13", "text": "But seek ye first the kingdom of God, and his righteousness; and all these things shall be added unto you.", "author": "Matthew 6:33 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","priority"]},
-    {"id": "faith_14", "text": "For where your treasure is, there will your heart be also.", "author": "Matthew 6:21 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","values"]},
-    {"id": "faith_15", "text": "And he said unto me, My grace is sufficient for thee: for my strength is made perfect in weakness.", "author": "2 Corinthians 12:9 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","grace"]},
-    {"id": "faith_16", "text": "Therefore if any man be in Christ, he is a new creature: old things are passed away; behold, all things are become new.", "author": "2 Corinthians 5:17 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","transformation"]},
-    {"id": "faith_17", "text": "For by grace are ye saved through faith; and that not of yourselves: it is the gift of God.", "author": "Ephesians 2:8 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","salvation"]},
-    {"id": "faith_18", "text": "And we have known and believed the love that God hath to us. God is love; and he that dwelleth in love dwelleth in God, and God in him.", "author": "1 John 4:16 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","love"]},
-    {"id": "faith_19", "text": "But the fruit of the Spirit is love, joy, peace, longsuffering, gentleness, goodness, faith, meekness, temperance.", "author": "Galatians 5:22-23 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","fruit"]},
-    {"id": "faith_20", "text": "For I am persuaded, that neither death, nor life, nor angels, nor principalities, nor powers, nor things present, nor things to come, nor height, nor depth, nor any other creature, shall be able to separate us from the love of God.", "author": "Romans 8:38-39 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","security"]},
-    {"id": "faith_21", "text": "And let us not be weary in well doing: for in due season we shall reap, if we faint not.", "author": "Galatians 6:9 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","perseverance"]},
-    {"id": "faith_22", "text": "But they that will be rich fall into temptation and a snare, and into many foolish and hurtful lusts, which drown men in destruction and perdition.", "author": "1 Timothy 6:9 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","contentment"]},
-    {"id": "faith_23", "text": "For the love of money is the root of all evil: which while some coveted after, they have erred from the faith, and pierced themselves through with many sorrows.", "author": "1 Timothy 6:10 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","money"]},
-    {"id": "faith_24", "text": "But godliness with contentment is great gain.", "author": "1 Timothy 6:6 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","contentment"]},
-    {"id": "faith_25", "text": "And whatsoever ye do, do it heartily, as to the Lord, and not unto men.", "author": "Colossians 3:23 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","excellence"]},
-    {"id": "faith_26", "text": "Rejoice evermore. Pray without ceasing. In every thing give thanks: for this is the will of God in Christ Jesus concerning you.", "author": "1 Thessalonians 5:16-18 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","gratitude"]},
-    {"id": "faith_27", "text": "And be not conformed to this world: but be ye transformed by the renewing of your mind, that ye may prove what is that good, and acceptable, and perfect, will of God.", "author": "Romans 12:2 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","transformation"]},
-    {"id": "faith_28", "text": "For we walk by faith, not by sight.", "author": "2 Corinthians 5:7 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","walk"]},
-    {"id": "faith_29", "text": "Now faith is the substance of things hoped for, the evidence of things not seen.", "author": "Hebrews 11:1 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","definition"]},
-    {"id": "faith_30", "text": "Jesus saith unto him, I am the way, the truth, and the life: no man cometh unto the Father, but by me.", "author": "John 14:6 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","way"]},
-    {"id": "faith_31", "text": "And Jesus said unto them, I am the bread of life: he that cometh to me shall never hunger; and he that believeth on me shall never thirst.", "author": "John 6:35 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","satisfaction"]},
-    {"id": "faith_32", "text": "Then spake Jesus again unto them, saying, I am the light of the world: he that followeth me shall not walk in darkness, but shall have the light of life.", "author": "John 8:12 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","light"]},
-    {"id": "faith_33", "text": "I am the resurrection, and the life: he that believeth in me, though he were dead, yet shall he live.", "author": "John 11:25 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["faith","life"]},
-    
-    # Secular wisdom quotes
-    {"id": "secular_1", "text": "What we achieve inwardly will change outer reality.", "author": "Plutarch (PD)", "license": "public_domain", "source": "Gateway", "tags": ["secular","temperance"]},
-    {"id": "secular_2", "text": "Patience is bitter, but its fruit is sweet.", "author": "Aristotle (PD)", "license": "public_domain", "source": "Gateway", "tags": ["secular","temperance"]},
-    {"id": "secular_3", "text": "He that is slow to wrath is of great understanding.", "author": "Proverbs (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["secular","temperance"]},
-    {"id": "secular_4", "text": "The only way to do great work is to love what you do.", "author": "Steve Jobs", "license": "public_domain", "source": "Gateway", "tags": ["secular","passion"]},
-    {"id": "secular_5", "text": "Success is not final, failure is not fatal: it is the courage to continue that counts.", "author": "Winston Churchill", "license": "public_domain", "source": "Gateway", "tags": ["secular","perseverance"]},
-    {"id": "secular_6", "text": "The future belongs to those who believe in the beauty of their dreams.", "author": "Eleanor Roosevelt", "license": "public_domain", "source": "Gateway", "tags": ["secular","dreams"]},
-    {"id": "secular_7", "text": "In the middle of difficulty lies opportunity.", "author": "Albert Einstein", "license": "public_domain", "source": "Gateway", "tags": ["secular","opportunity"]},
-    {"id": "secular_8", "text": "The way to get started is to quit talking and begin doing.", "author": "Walt Disney", "license": "public_domain", "source": "Gateway", "tags": ["secular","action"]},
-    {"id": "secular_9", "text": "Life is what happens to you while you're busy making other plans.", "author": "John Lennon", "license": "public_domain", "source": "Gateway", "tags": ["secular","life"]},
-    {"id": "secular_10", "text": "The only impossible journey is the one you never begin.", "author": "Tony Robbins", "license": "public_domain", "source": "Gateway", "tags": ["secular","journey"]},
-
-    # Wisdom quotes (for daily wisdom feature)
-    {"id": "wisdom_1", "text": "The fear of the Lord is the beginning of wisdom, and knowledge of the Holy One is understanding.", "author": "Proverbs 9:10 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["wisdom", "faith"]},
-    {"id": "wisdom_2", "text": "Trust in the Lord with all thine heart; and lean not unto thine own understanding.", "author": "Proverbs 3:5 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["wisdom", "trust"]},
-    {"id": "wisdom_3", "text": "For the Lord giveth wisdom: out of his mouth cometh knowledge and understanding.", "author": "Proverbs 2:6 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["wisdom", "knowledge"]},
-    {"id": "wisdom_4", "text": "The wise in heart are called discerning, and gracious words promote instruction.", "author": "Proverbs 16:21 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["wisdom", "discernment"]},
-    {"id": "wisdom_5", "text": "How much better to get wisdom than gold, to get insight rather than silver!", "author": "Proverbs 16:16 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["wisdom", "value"]},
-    {"id": "wisdom_6", "text": "The beginning of wisdom is this: Get wisdom. Though it cost all you have, get understanding.", "author": "Proverbs 4:7 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["wisdom", "understanding"]},
-    {"id": "wisdom_7", "text": "A wise man will hear, and will increase learning; and a man of understanding shall attain unto wise counsels.", "author": "Proverbs 1:5 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["wisdom", "learning"]},
-    {"id": "wisdom_8", "text": "The wise store up knowledge, but the mouth of a fool invites ruin.", "author": "Proverbs 10:14 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["wisdom", "knowledge"]},
-    {"id": "wisdom_9", "text": "Whoever walks with the wise becomes wise, but the companion of fools will suffer harm.", "author": "Proverbs 13:20 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["wisdom", "fellowship"]},
-    {"id": "wisdom_10", "text": "The wise woman builds her house, but with her own hands the foolish one tears hers down.", "author": "Proverbs 14:1 (KJV)", "license": "public_domain", "source": "Gateway", "tags": ["wisdom", "building"]},
-]
+_jobs_lock = threading.Lock()
+_jobs_db: Optional[sqlite3.Connection] = None
+_enqueued: set = set()  # keys queued by this process for _enqueued_date
+_enqueued_date = ""
+_worker: Optional[threading.Thread] = None
+_worker_wake = threading.Event()
+
+_snapshot_lock = threading.Lock()
+_snapshot: Dict[str, Any] = {"quotes": [], "scripture": [], "mtimes": None, "checked": 0.0}
+
+def jobs_db() -> sqlite3.Connection:
+    global _jobs_db
+    if _jobs_db is None:
+        ensure_storage_dir()
+        _jobs_db = sqlite3.connect(JOBS_DB_FILE, timeout=5.0, isolation_level=None, check_same_thread=False)
+        _jobs_db.execute("PRAGMA journal_mode=WAL")
+        _jobs_db.execute("CREATE TABLE IF NOT EXISTS jobs (key TEXT PRIMARY KEY, kind TEXT NOT NULL, payload TEXT NOT NULL, "
+                         "state TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, run_after REAL NOT NULL, "
+                         "created REAL NOT NULL, error TEXT)")
+        # Claimed by a process that died before finishing
+        _jobs_db.execute("UPDATE jobs SET state = 'pending' WHERE state = 'running'")
+    return _jobs_db
 
-KJV_DB = {
-    "gluttony": [{
-        "ref": "1 Corinthians 9:24–27 (KJV)",
-        "verses": [
-            {"v": 24, "t": "Know ye not that they which run in a race run all, but one receiveth the prize? So run, that ye may obtain."},
-            {"v": 25, "t": "And every man that striveth for the mastery is temperate in all things. Now they do it to obtain a corruptible crown; but we an incorruptible."},
-            {"v": 26, "t": "I therefore so run, not as uncertainly; so fight I, not as one that beateth the air:"},
-            {"v": 27, "t": "But I keep under my body, and bring it into subjection: lest that by any means, when I have preached to others, I myself should be a castaway."}
-        ],
-        "actNow": "Plate plan → pray → eat with temperance; log one small victory.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "pride": [{
-        "ref": "Proverbs 16:18 (KJV)",
-        "verses": [
-            {"v": 18, "t": "Pride goeth before destruction, and an haughty spirit before a fall."}
-        ],
-        "actNow": "Humble yourself before God and others today.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "envy": [{
-        "ref": "Proverbs 14:30 (KJV)",
-        "verses": [
-            {"v": 30, "t": "A sound heart is the life of the flesh: but envy the rottenness of the bones."}
-        ],
-        "actNow": "Count your blessings and rejoice with others.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "lust": [{
-        "ref": "Matthew 5:28 (KJV)",
-        "verses": [
-            {"v": 28, "t": "But I say unto you, That whosoever looketh on a woman to lust after her hath committed adultery with her already in his heart."}
-        ],
-        "actNow": "Guard your heart and mind with God's truth.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "greed": [{
-        "ref": "1 Timothy 6:10 (KJV)",
-        "verses": [
-            {"v": 10, "t": "For the love of money is the root of all evil: which while some coveted after, they have erred from the faith, and pierced themselves through with many sorrows."}
-        ],
-        "actNow": "Practice generosity and contentment today.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "anger": [{
-        "ref": "Ephesians 4:26-27 (KJV)",
-        "verses": [
-            {"v": 26, "t": "Be ye angry, and sin not: let not the sun go down upon your wrath:"},
-            {"v": 27, "t": "Neither give place to the devil."}
-        ],
-        "actNow": "Resolve conflicts quickly and forgive others.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "sloth": [{
-        "ref": "Proverbs 6:6-8 (KJV)",
-        "verses": [
-            {"v": 6, "t": "Go to the ant, thou sluggard; consider her ways, and be wise:"},
-            {"v": 7, "t": "Which having no guide, overseer, or ruler,"},
-            {"v": 8, "t": "Provideth her meat in the summer, and gathereth her food in the harvest."}
-        ],
-        "actNow": "Take one productive action toward your goals.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "feeling_lost": [{
-        "ref": "Jeremiah 29:11 (KJV)",
-        "verses": [
-            {"v": 11, "t": "For I know the thoughts that I think toward you, saith the Lord, thoughts of peace, and not of evil, to give you an expected end."}
-        ],
-        "actNow": "Trust God's plan and take one step forward in faith.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "strength": [{
-        "ref": "Philippians 4:13 (KJV)",
-        "verses": [
-            {"v": 13, "t": "I can do all things through Christ which strengtheneth me."}
-        ],
-        "actNow": "Draw strength from Christ for today's challenges.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "peace": [{
-        "ref": "John 14:27 (KJV)",
-        "verses": [
-            {"v": 27, "t": "Peace I leave with you, my peace I give unto you: not as the world giveth, give I unto you. Let not your heart be troubled, neither let it be afraid."}
-        ],
-        "actNow": "Rest in God's peace and cast your cares on Him.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "hope": [{
-        "ref": "Romans 15:13 (KJV)",
-        "verses": [
-            {"v": 13, "t": "Now the God of hope fill you with all joy and peace in believing, that ye may abound in hope, through the power of the Holy Ghost."}
-        ],
-        "actNow": "Let God fill you with hope and joy today.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "love": [{
-        "ref": "1 Corinthians 13:4-7 (KJV)",
-        "verses": [
-            {"v": 4, "t": "Charity suffereth long, and is kind; charity envieth not; charity vaunteth not itself, is not puffed up,"},
-            {"v": 5, "t": "Doth not behave itself unseemly, seeketh not her own, is not easily provoked, thinketh no evil;"},
-            {"v": 6, "t": "Rejoiceth not in iniquity, but rejoiceth in the truth;"},
-            {"v": 7, "t": "Beareth all things, believeth all things, hopeth all things, endureth all things."}
-        ],
-        "actNow": "Show God's love to someone today.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "wisdom": [{
-        "ref": "Proverbs 9:10 (KJV)",
-        "verses": [
-            {"v": 10, "t": "The fear of the Lord is the beginning of wisdom: and the knowledge of the holy is understanding."}
-        ],
-        "actNow": "Seek God's wisdom in your decisions today.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "faith": [{
-        "ref": "Hebrews 11:1 (KJV)",
-        "verses": [
-            {"v": 1, "t": "Now faith is the substance of things hoped for, the evidence of things not seen."}
-        ],
-        "actNow": "Step out in faith and trust God's promises.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "gratitude": [{
-        "ref": "1 Thessalonians 5:18 (KJV)",
-        "verses": [
-            {"v": 18, "t": "In every thing give thanks: for this is the will of God in Christ Jesus concerning you."}
-        ],
-        "actNow": "Count your blessings and thank God for them.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "forgiveness": [{
-        "ref": "Ephesians 4:32 (KJV)",
-        "verses": [
-            {"v": 32, "t": "And be ye kind one to another, tenderhearted, forgiving one another, even as God for Christ's sake hath forgiven you."}
-        ],
-        "actNow": "Forgive someone who has hurt you today.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "perseverance": [{
-        "ref": "Galatians 6:9 (KJV)",
-        "verses": [
-            {"v": 9, "t": "And let us not be weary in well doing: for in due season we shall reap, if we faint not."}
-        ],
-        "actNow": "Keep doing good even when it's hard.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "humility": [{
-        "ref": "Philippians 2:3-4 (KJV)",
-        "verses": [
-            {"v": 3, "t": "Let nothing be done through strife or vainglory; but in lowliness of mind let each esteem other better than themselves."},
-            {"v": 4, "t": "Look not every man on his own things, but every man also on the things of others."}
-        ],
-        "actNow": "Put others' needs before your own today.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "purpose": [{
-        "ref": "Jeremiah 1:5 (KJV)",
-        "verses": [
-            {"v": 5, "t": "Before I formed thee in the belly I knew thee; and before thou camest forth out of the womb I sanctified thee, and I ordained thee a prophet unto the nations."}
-        ],
-        "actNow": "Seek God's purpose for your life today.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
-    "rest": [{
-        "ref": "Matthew 11:28-30 (KJV)",
-        "verses": [
-            {"v": 28, "t": "Come unto me, all ye that labour and are heavy laden, and I will give you rest."},
-            {"v": 29, "t": "Take my yoke upon you, and learn of me; for I am meek and lowly in heart: and ye shall find rest unto your souls."},
-            {"v": 30, "t": "For my yoke is easy, and my burden is light."}
-        ],
-        "actNow": "Find rest in Jesus and His gentle ways.",
-        "license": "public_domain",
-        "source": "kjv.local"
-    }],
+def enqueue_daily_job(kind: str, payload: Dict[str, Any]):
+    """Queue a job once (same kind and payload = same job) and make sure the worker runs"""
+    global _enqueued_date
+    key = kind + ":" + json.dumps(payload, sort_keys=True)
+    if payload.get("date") != _enqueued_date:
+        _enqueued.clear()
+        _enqueued_date = payload.get("date", "")
+    if key not in _enqueued:
+        with _jobs_lock:
+            jobs_db().execute("INSERT OR IGNORE INTO jobs (key, kind, payload, state, run_after, created) VALUES (?, ?, ?, 'pending', 0, ?)",
+                              (key, kind, json.dumps(payload), time.time()))
+        _enqueued.add(key)
+        _worker_wake.set()
+    start_daily_worker()
+
+def _claim_job() -> Optional[Tuple[str, str, Dict[str, Any], int]]:
+    with _jobs_lock:
+        db = jobs_db()
+        row = db.execute("SELECT key, kind, payload, attempts FROM jobs WHERE state = 'pending' AND run_after <= ? "
+                         "ORDER BY created LIMIT 1", (time.time(),)).fetchone()
+        # The state check makes the claim atomic across processes sharing the file
+        if row and db.execute("UPDATE jobs SET state = 'running' WHERE key = ? AND state = 'pending'", (row[0],)).rowcount:
+            return row[0], row[1], json.loads(row[2]), row[3]
+    return None
+
+def _finish_job(key: str, attempts: int, error: Optional[str]):
+    with _jobs_lock:
+        if error is None:
+            jobs_db().execute("UPDATE jobs SET state = 'done', attempts = ?, error = NULL WHERE key = ?", (attempts, key))
+        else:
+            state = "failed" if attempts >= DAILY_JOB_MAX_ATTEMPTS else "pending"
+            jobs_db().execute("UPDATE jobs SET state = ?, attempts = ?, run_after = ?, error = ? WHERE key = ?",
+                              (state, attempts, time.time() + DAILY_JOB_RETRY_SEC * 2 ** (attempts - 1), error, key))
+
+def prune_jobs() -> int:
+    """Delete done and failed jobs older than DAILY_JOB_KEEP_DAYS; returns how many"""
+    with _jobs_lock:
+        return jobs_db().execute("DELETE FROM jobs WHERE state IN ('done', 'failed') AND created < ?",
+                                 (time.time() - DAILY_JOB_KEEP_DAYS * 86400,)).rowcount
+
+DAILY_JOBS = {
+    "daily_wisdom": run_daily_wisdom_job,
+    "daily_scripture": run_daily_scripture_job,
 }
 
-BANNED = {"fuck", "shit", "bitch"}  # extend safely
+def run_pending_jobs() -> int:
+    """Run every due job; returns how many ran"""
+    ran = 0
+    while True:
+        job = _claim_job()
+        if job is None:
+            return ran
+        key, kind, payload, attempts = job
+        try:
+            DAILY_JOBS[kind](**payload)
+            error = None
+        except Exception as e:
+            error = repr(e)
+            print(f"Daily job {key} failed (attempt {attempts + 1}): {error}")
+        _finish_job(key, attempts + 1, error)
+        ran += 1
 
-def filter_quote(item: Dict[str, Any], allow_faith: bool) -> Optional[Dict[str, Any]]:
-    text = item.get("text", "").strip()
-    if not allow_faith and "faith" in item.get("tags", []):
-        return None
-    if any(b in text.lower() for b in BANNED):
-        return None
-    if len(text) > 180:
-        return None
-    if item.get("license") not in {"public_domain","by","by-nc","unknown"}:
-        return None
-    item["text"] = text
-    return item
-
-def filter_scripture(passage: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    for v in passage.get("verses", []):
-        if any(b in v.get("t", "").lower() for b in BANNED):
-            return None
-    if len(passage.get("actNow", "")) > 140:
-        return None
-    return passage
+def _daily_worker_loop():
+    while True:
+        # Schedule today's jobs ahead of the first request after midnight
+        date = datetime.now().strftime('%Y-%m-%d')
+        enqueue_daily_job("daily_wisdom", {"date": date})
+        enqueue_daily_job("daily_scripture", {"date": date, "theme": ""})
+        try:
+            run_pending_jobs()
+            prune_jobs()
+        except Exception as e:
+            print(f"Daily worker error: {e}")
+        _worker_wake.wait(timeout=60)
+        _worker_wake.clear()
 
-def rank_quotes(items: List[Dict[str, Any]], topic: str) -> List[Dict[str, Any]]:
-    t = (topic or "").lower().strip()
-    if not t: return items
-    scored = []
-    for q in items:
-        s = 0
-        if t and t in q.get("text","").lower(): s += 2
-        if t and any(t in tag for tag in q.get("tags", [])): s += 1
-        scored.append((s, q))
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [q for _, q in scored]
+def start_daily_worker():
+    global _worker
+    if _worker is None and DAILY_WORKER:
+        with _jobs_lock:
+            if _worker is None:
+                _worker = threading.Thread(target=_daily_worker_loop, name="daily-worker", daemon=True)
+                _worker.start()
+
+def daily_snapshot() -> Dict[str, List[Dict[str, Any]]]:
+    """Accumulated quotes and scripture as last written by a worker (in any process); reloaded when the files change"""
+    now = time.time()
+    if now - _snapshot["checked"] < 1.0 and _snapshot["mtimes"] is not None:
+        return _snapshot
+    with _snapshot_lock:
+        mtimes = tuple(os.path.getmtime(f) if os.path.exists(f) else 0 for f in (QUOTES_STORAGE_FILE, SCRIPTURE_STORAGE_FILE))
+        if mtimes != _snapshot["mtimes"]:
+            _snapshot.update(quotes=load_accumulated_quotes(), scripture=load_accumulated_scripture(), mtimes=mtimes)
+        _snapshot["checked"] = now
+    return _snapshot
+
+# -------------------------
+# Faith gating (local content, filters and ranking come from the shared content engine)
+# -------------------------
+def faith_allowed(mode: str, light_consent: bool, hide_in_mind: bool) -> bool:
+    return gating.faith_allowed(mode, light_consent, hide_in_mind, ALLOW_FAITH_IN_LIGHT_BY_DEFAULT)
 
 # -------------------------
 # Routes
@@ -851,12 +970,29 @@ def rank_quotes(items: List[Dict[str, Any]], topic: str) -> List[Dict[str, Any]]
 def health():
     return jsonify({"ok": True, "env": ENV, "redis": bool(REDIS_URL)})
 
+@app.route("/live")
+def live():
+    return jsonify({"ok": True})
+
+@app.route("/ready")
+def ready():
+    """Corpus and cache warm-up finish at import, so this adds the dependency checks.
+    Redis is informational (the in-process cache serves while it is down) unless READY_REQUIRE_REDIS=1."""
+    stages = dict(STARTUP_STAGES)
+    if rds:
+        t0 = time.perf_counter()
+        ok = _redis_call(rds.ping) not in (_REDIS_DOWN, False)
+        stages["redis"] = {"ok": ok, "ms": round((time.perf_counter() - t0) * 1000, 1), "breaker": redis_breaker.state}
+    ok = all(s["ok"] for name, s in stages.items() if name != "redis" or READY_REQUIRE_REDIS)
+    return jsonify({"ready": ok, "stages": stages}), 200 if ok else 503
+
 @app.route("/content/manifest")
 @require_auth
 def manifest():
     # Get accumulated storage counts
-    accumulated_quotes = load_accumulated_quotes()
-    accumulated_scripture = load_accumulated_scripture()
+    snapshot = daily_snapshot()
+    accumulated_quotes = snapshot["quotes"]
+    accumulated_scripture = snapshot["scripture"]
     
     themes = {k: {"passageCount": len(v)} for k, v in KJV_DB.items()}
     local_total = sum(len(v) for v in KJV_DB.values())
@@ -883,9 +1019,10 @@ def manifest():
             "scriptureFile": SCRIPTURE_STORAGE_FILE,
             "storageDir": STORAGE_DIR
         },
-        "updatedAt": datetime.now(timezone.utc).isoformat()
+        # A release stamp, not the wall clock: the body (and its cached compressed variant) stays byte-stable
+        "updatedAt": CORPUS_UPDATED_AT or CORPUS_STAMP
     }
-    return jsonify(payload)
+    return json_response(json.dumps(payload))
 
 @app.route("/content/quotes", methods=["POST"])
 @require_auth
@@ -907,7 +1044,7 @@ def quotes():
                                      "hideFaithOverlaysInMind": hideInMind, "topic": topic, "limit": limit})
     cached = cache_get(key)
     if cached:
-        return app.response_class(response=cached, mimetype="application/json")
+        return json_response(cached)
 
     items = []
     
@@ -937,7 +1074,7 @@ def quotes():
     ranked = rank_quotes(out, topic)[:limit]
     payload = json.dumps(ranked)
     cache_set(key, ranked)
-    return app.response_class(response=payload, mimetype="application/json")
+    return json_response(payload)
 
 @app.route("/content/scripture", methods=["POST"])
 @require_auth
@@ -962,7 +1099,7 @@ def scripture():
                                         "hideFaithOverlaysInMind": hideInMind, "theme": theme, "limit": limit})
     cached = cache_get(key)
     if cached:
-        return app.response_class(response=cached, mimetype="application/json")
+        return json_response(cached)
 
     # Get scripture (local + external)
     all_scripture = get_daily_bible_scripture(theme)
@@ -977,10 +1114,14 @@ def scripture():
 
     payload = json.dumps(p)
     cache_set(key, p)
-    return app.response_class(response=payload, mimetype="application/json")
+    return json_response(payload)
 
 # -------------------------
 # Dev runner
 # -------------------------
 if __name__ == "__main__":
+    if sys.argv[1:] == ["worker"]:
+        # Standalone daily worker for deployments that run the web processes with DAILY_WORKER=0
+        _worker = threading.current_thread()
+        _daily_worker_loop()
     app.run(host="0.0.0.0", port=PORT, debug=(ENV=="dev"))
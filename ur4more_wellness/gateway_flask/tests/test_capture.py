@@ -0,0 +1,14 @@
+import app as gw
+
+def test_generated_salt_is_shared_and_only_made_when_sampling(tmp_path, monkeypatch):
+    monkeypatch.setattr(gw, "CAPTURE_SALT", "")
+    monkeypatch.setattr(gw, "CAPTURE_PATH", str(tmp_path / "capture.jsonl"))
+    monkeypatch.setattr(gw, "CAPTURE_SAMPLE_RATE", 0.0)
+    client = gw.app.test_client()
+    client.get("/content/today")
+    assert not list(tmp_path.iterdir())  # capture off: nothing hashed, no salt file
+
+    salt = gw.capture_salt()
+    monkeypatch.setattr(gw, "_capture_salts", {})  # a new worker or process
+    assert gw.capture_salt() == salt == (tmp_path / "capture.jsonl.salt").read_text()
+    assert [p.name for p in tmp_path.iterdir()] == ["capture.jsonl.salt"]
@@ -0,0 +1,67 @@
+import json, time
+import pytest
+import app as gw
+
+@pytest.fixture
+def jobs(tmp_path, monkeypatch):
+    monkeypatch.setattr(gw, "JOBS_DB_FILE", str(tmp_path / "jobs.sqlite"))
+    monkeypatch.setattr(gw, "DAILY_WORKER", False)
+    monkeypatch.setattr(gw, "_jobs_db", None)
+    monkeypatch.setattr(gw, "_enqueued", set())
+    monkeypatch.setattr(gw, "_enqueued_date", "")
+    yield gw
+    if gw._jobs_db is not None:
+        gw._jobs_db.close()
+
+def rows(db):
+    return db.execute("SELECT key, state, attempts, run_after FROM jobs ORDER BY key").fetchall()
+
+def test_enqueue_dedupes_and_normalises_theme(jobs, monkeypatch):
+    monkeypatch.setattr(gw, "cache_get", lambda key: None)
+    for theme in ("", "Hope ", "hope", "anything a user typed", "another free-text theme"):
+        gw.get_daily_bible_scripture(theme)
+    assert [json.loads(k.split(":", 1)[1])["theme"] for k, *_ in rows(gw.jobs_db())] == ["", "hope"]
+
+    gw.enqueue_daily_job("daily_wisdom", {"date": "2000-01-01"})
+    assert gw._enqueued == {'daily_wisdom:{"date": "2000-01-01"}'}  # only the current date is remembered
+    assert len(rows(gw.jobs_db())) == 3
+
+def test_failed_job_backs_off_then_gives_up(jobs, monkeypatch):
+    calls = []
+    def flaky(date):
+        calls.append(date)
+        raise RuntimeError("provider down")
+    monkeypatch.setitem(gw.DAILY_JOBS, "daily_wisdom", flaky)
+    gw.enqueue_daily_job("daily_wisdom", {"date": "2025-01-01"})
+    db = gw.jobs_db()
+
+    assert gw.run_pending_jobs() == 1
+    (_, state, attempts, run_after), = rows(db)
+    assert (state, attempts) == ("pending", 1) and run_after >= time.time() + gw.DAILY_JOB_RETRY_SEC - 5
+    assert gw.run_pending_jobs() == 0  # not due yet
+
+    for attempt in range(2, gw.DAILY_JOB_MAX_ATTEMPTS + 1):
+        db.execute("UPDATE jobs SET run_after = 0")
+        assert gw.run_pending_jobs() == 1
+    (_, state, attempts, _), = rows(db)
+    assert (state, attempts) == ("failed", gw.DAILY_JOB_MAX_ATTEMPTS) and len(calls) == gw.DAILY_JOB_MAX_ATTEMPTS
+
+def test_running_job_is_requeued_after_a_crash(jobs, monkeypatch):
+    gw.enqueue_daily_job("daily_wisdom", {"date": "2025-01-01"})
+    assert gw._claim_job() is not None  # claimed, then the process dies
+    gw._jobs_db.close()
+    monkeypatch.setattr(gw, "_jobs_db", None)
+
+    ran = []
+    monkeypatch.setitem(gw.DAILY_JOBS, "daily_wisdom", lambda date: ran.append(date))
+    assert gw.run_pending_jobs() == 1 and ran == ["2025-01-01"]
+    assert rows(gw.jobs_db())[0][1] == "done"
+
+def test_prune_keeps_recent_and_unfinished_jobs(jobs):
+    db = gw.jobs_db()
+    old = time.time() - (gw.DAILY_JOB_KEEP_DAYS + 1) * 86400
+    for key, state, created in (("a", "done", old), ("b", "failed", old), ("c", "pending", old), ("d", "done", time.time())):
+        db.execute("INSERT INTO jobs (key, kind, payload, state, run_after, created) VALUES (?, 'daily_wisdom', '{}', ?, 0, ?)",
+                   (key, state, created))
+    assert gw.prune_jobs() == 2
+    assert [k for k, *_ in rows(db)] == ["c", "d"]
@@ -0,0 +1,19 @@
+import gzip, json
+import app as gw
+
+client = gw.app.test_client()
+
+def test_manifest_body_is_byte_stable_and_compressed_once(monkeypatch):
+    compressed = []
+    real_compress = gw.compress
+    monkeypatch.setattr(gw, "compress", lambda raw, enc: compressed.append(enc) or real_compress(raw, enc))
+    monkeypatch.setattr(gw, "COMPRESS_MIN_BYTES", 0)
+    r1 = client.get("/content/manifest", headers={"Accept-Encoding": "gzip"})
+    r2 = client.get("/content/manifest", headers={"Accept-Encoding": "gzip"})
+    assert r1.status_code == 200 and r1.headers["Content-Encoding"] == "gzip"
+    assert r1.data == r2.data and compressed == ["gzip"]
+    assert json.loads(gzip.decompress(r1.data))["updatedAt"] == gw.CORPUS_STAMP  # not a file mtime
+
+def test_negotiation_is_shared_with_the_fastapi_gateway():
+    from content_engine import compression
+    assert gw.negotiate is compression.negotiate and gw.compress is compression.compress
@@ -0,0 +1,43 @@
+import threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import app as gw
+
+class Provider(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b'{"quote": "' + b"x" * 40 + b'"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        step = 4 if self.path.startswith("/slow") else len(body)
+        for i in range(0, len(body), step):
+            try:
+                self.wfile.write(body[i:i + step])
+                self.wfile.flush()
+            except OSError:
+                return  # the gateway hung up
+            if step < len(body):
+                time.sleep(0.1)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def provider(monkeypatch):
+    monkeypatch.setattr(gw, "EXTERNAL_DEADLINE_SEC", 0.5)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Provider)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+def test_provider_get_reads_json(provider):
+    assert gw.provider_get("test", provider + "/fast", {}) == {"quote": "x" * 40}
+
+def test_trickled_body_gives_up_at_the_deadline(provider):
+    # Every read returns within the per-read timeout; only the overall deadline stops it (the body takes ~1.2s)
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        gw.provider_get("test", provider + "/slow", {})
+    assert time.monotonic() - start < 0.9
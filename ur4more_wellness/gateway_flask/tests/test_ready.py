@@ -0,0 +1,39 @@
+import redis
+import app as gw
+from content_engine.breaker import CircuitBreaker
+
+client = gw.app.test_client()
+
+def _redis_down(monkeypatch):
+    opts = {"socket_timeout": 0.1, "socket_connect_timeout": 0.1}
+    monkeypatch.setattr(gw, "rds", redis.Redis.from_url("redis://127.0.0.1:1/0", decode_responses=True, **opts))
+    monkeypatch.setattr(gw, "rds_bin", redis.Redis.from_url("redis://127.0.0.1:1/0", **opts))
+    monkeypatch.setattr(gw, "redis_breaker", CircuitBreaker(2, 60))
+
+def test_unreachable_redis_is_informational_unless_required(monkeypatch):
+    _redis_down(monkeypatch)
+    r = client.get("/ready")
+    assert r.status_code == 200 and r.json["stages"]["redis"]["ok"] is False
+    monkeypatch.setattr(gw, "READY_REQUIRE_REDIS", True)
+    assert client.get("/ready").status_code == 503
+
+def test_cache_falls_back_to_memory_while_redis_is_down(monkeypatch):
+    _redis_down(monkeypatch)
+    gw.cache_set("cg:fallback", {"ok": 1})
+    gw.cache_set_bytes("cz:fallback", b"\x1f\x8b")
+    assert gw.cache_get("cg:fallback") == '{"ok": 1}'
+    assert gw.cache_get_bytes("cz:fallback") == b"\x1f\x8b"
+    assert gw.redis_breaker.state == "open"
+
+def test_non_redis_error_in_half_open_trial_frees_the_breaker(monkeypatch):
+    breaker = CircuitBreaker(1, 60)
+    breaker.failure()
+    breaker.opened_at -= 60
+    monkeypatch.setattr(gw, "redis_breaker", breaker)
+    def broken(*args):
+        raise ValueError("not a Redis failure")
+    try:
+        gw._redis_call(broken)
+    except ValueError:
+        pass
+    assert breaker.state == "half_open" and not breaker.trial_in_flight and breaker.allow()
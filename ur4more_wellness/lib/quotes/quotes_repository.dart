@@ -22,25 +22,37 @@ class Quote {
 class QuotesManifest {
   final int shardCount;
   final List<String> files;
+  /// Shards per faith mode ('off' / 'faith'), from the facet index written by tools/quotes_shard.py
+  final Map<String, List<String>> modeFiles;
   
-  QuotesManifest({required this.shardCount, required this.files});
+  QuotesManifest({required this.shardCount, required this.files, this.modeFiles = const {}});
   
   static Future<QuotesManifest> load() async {
     final raw = json.decode(await rootBundle.loadString('assets/quotes/manifest.json'));
+    final modes = (raw['modes'] as Map<String, dynamic>?) ?? const {};
     return QuotesManifest(
       shardCount: (raw['shard_count'] as num).toInt(),
       files: (raw['files'] as List).map((e) => e.toString()).toList(),
+      modeFiles: modes.map((mode, m) => MapEntry(
+        mode,
+        ((m as Map<String, dynamic>)['files'] as List).map((e) => e.toString()).toList(),
+      )),
     );
   }
+
+  /// Only the shards holding quotes for this mode; every shard for manifests without a facet index
+  List<String> filesFor({required bool offMode}) =>
+      modeFiles[offMode ? 'off' : 'faith'] ?? files;
 }
 
 class QuotesRepository {
   Future<Quote?> pickDaily({required bool offMode}) async {
     final manifest = await QuotesManifest.load();
-    if (manifest.files.isEmpty) return null;
+    final files = manifest.filesFor(offMode: offMode);
+    if (files.isEmpty) return null;
     
-    final idx = _shardIndexForToday(manifest.shardCount);
-    final shardPath = manifest.files[idx % manifest.files.length];
+    final idx = _shardIndexForToday(files.length);
+    final shardPath = files[idx % files.length];
     final data = json.decode(await rootBundle.loadString(shardPath)) as Map<String, dynamic>;
     final list = (data['quotes'] as List).cast<Map>();
     
@@ -61,12 +73,13 @@ class QuotesRepository {
     return ((now.year * 1000) + yday) % (shardCount == 0 ? 1 : shardCount);
   }
 
-  /// Load all quotes from all shards
-  Future<List<Map<String, dynamic>>> loadAll() async {
+  /// Load all quotes from all shards, or only the shards for one mode when [offMode] is given
+  Future<List<Map<String, dynamic>>> loadAll({bool? offMode}) async {
     final manifest = await QuotesManifest.load();
     final allQuotes = <Map<String, dynamic>>[];
+    final files = offMode == null ? manifest.files : manifest.filesFor(offMode: offMode);
     
-    for (final shardPath in manifest.files) {
+    for (final shardPath in files) {
       final data = json.decode(await rootBundle.loadString(shardPath)) as Map<String, dynamic>;
       final quotes = (data['quotes'] as List).cast<Map<String, dynamic>>();
       allQuotes.addAll(quotes);
@@ -2,15 +2,44 @@
 """
 Quote Batch Generator for UR4MORE Wellness App
 Generates public domain quotes in the required JSON format
+
+--unique enumerates the (template, author, work) space without replacement instead of
+drawing templates at random: no two quotes in a batch share all three, every template
+is used once before any is reused, and the batch stops early when the space runs out.
+--seed makes a batch reproducible (all random draws come from one seeded generator).
 """
 
 import json
+import random
 import sys
 from datetime import datetime
 from pathlib import Path
 
-def generate_batch(batch_name, theme, authors, quote_count=250):
-    """Generate a batch of quotes for a specific theme and authors"""
+# Default authors for each theme
+DEFAULT_AUTHORS = [
+    "Charles Spurgeon", "John Bunyan", "Thomas à Kempis", 
+    "Augustine of Hippo", "Blaise Pascal", "Marcus Aurelius", 
+    "Epictetus", "Matthew Henry", "John Owen", "Aquinas"
+]
+
+def unique_pairs(templates, authors, rng, per_template=None):
+    """(template, author) pairs without replacement, in rounds: each round gives every template
+    one author it has not had yet, so texts only repeat once all templates are used"""
+    templates = list(dict.fromkeys(templates))
+    authors = list(dict.fromkeys(authors))
+    rng.shuffle(templates)
+    rng.shuffle(authors)
+    rounds = len(authors) if per_template is None else min(per_template, len(authors))
+    for r in range(rounds):
+        for i, template in enumerate(templates):
+            yield template, authors[(i + r) % len(authors)]
+
+def generate_batch(batch_name, theme, authors, quote_count=250, unique=False, seed=None, per_template=None):
+    """Generate a batch of quotes for a specific theme and authors.
+
+    unique=True draws (template, author) pairs without replacement (the work follows the
+    author), stopping early when the space is exhausted; per_template caps the quotes per
+    template (1 = no repeated texts). seed makes the batch reproducible."""
     
     # Sample quote templates by theme
     quote_templates = {
@@ -394,12 +423,15 @@ def generate_batch(batch_name, theme, authors, quote_count=250):
     
     quotes = []
     templates = quote_templates.get(theme, quote_templates["wisdom"])
+    rng = random.Random(seed)
+    if unique:
+        draws = unique_pairs(templates, authors, rng, per_template)
+    else:
+        draws = ((rng.choice(templates), rng.choice(authors)) for _ in range(quote_count))
     
-    for i in range(quote_count):
-        # Select random author and template
-        import random
-        author = random.choice(authors)
-        template = random.choice(templates)
+    for i, (template, author) in enumerate(draws):
+        if i >= quote_count:
+            break
         
         # Generate quote ID
         quote_id = f"{author.lower().replace(' ', '_').replace('à', 'a')}_{theme}_{i+1:03d}"
@@ -429,11 +461,11 @@ def generate_batch(batch_name, theme, authors, quote_count=250):
             "text": template,
             "author": author,
             "work": author_data["work"],
-            "year_approx": random.randint(*author_data["year_range"]),
+            "year_approx": rng.randint(*author_data["year_range"]),
             "source": "Public domain",
             "public_domain": True,
             "license": "public_domain",
-            "tags": [theme, random.choice(["wisdom", "virtue", "life", "character"])],
+            "tags": [theme, rng.choice(["wisdom", "virtue", "life", "character"])],
             "axis": "light",
             "modes": {
                 "off_safe": off_safe,
@@ -463,24 +495,31 @@ def generate_batch(batch_name, theme, authors, quote_count=250):
     with open(filename, 'w', encoding='utf-8') as f:
         json.dump(batch_data, f, indent=2, ensure_ascii=False)
     
-    print(f"Generated {quote_count} quotes in {filename}")
+    if unique and len(quotes) < quote_count:
+        print(f"Unique pool for {theme} exhausted: {len(quotes)} of {quote_count} requested")
+    print(f"Generated {len(quotes)} quotes in {filename}")
     return filename
 
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python quotes_batch_generator.py <batch_name> <theme> [quote_count]")
+    args = sys.argv[1:]
+    unique = "--unique" in args
+    args = [a for a in args if a != "--unique"]
+    seed, per_template = None, None
+    if "--seed" in args:
+        i = args.index("--seed")
+        seed = args[i + 1]
+        del args[i:i + 2]
+    if "--per-template" in args:
+        i = args.index("--per-template")
+        per_template = int(args[i + 1])
+        del args[i:i + 2]
+    if len(args) < 2:
+        print("Usage: python quotes_batch_generator.py <batch_name> <theme> [quote_count] [--unique [--per-template N]] [--seed S]")
         print("Themes: truth, responsibility, courage, humility, service, hope, repentance, wisdom, meaning, perseverance")
         sys.exit(1)
     
-    batch_name = sys.argv[1]
-    theme = sys.argv[2]
-    quote_count = int(sys.argv[3]) if len(sys.argv) > 3 else 250
-    
-    # Default authors for each theme
-    authors = [
-        "Charles Spurgeon", "John Bunyan", "Thomas à Kempis", 
-        "Augustine of Hippo", "Blaise Pascal", "Marcus Aurelius", 
-        "Epictetus", "Matthew Henry", "John Owen", "Aquinas"
-    ]
+    batch_name = args[0]
+    theme = args[1]
+    quote_count = int(args[2]) if len(args) > 2 else 250
     
-    generate_batch(batch_name, theme, authors, quote_count)
+    generate_batch(batch_name, theme, DEFAULT_AUTHORS, quote_count, unique, seed, per_template)
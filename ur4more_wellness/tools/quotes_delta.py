@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Quote Delta Builder for UR4MORE Wellness App
+Snapshots the master quotes file as a corpus version and precomputes
+added/changed/removed diffs from every earlier version to the current one
+"""
+
+import json
+import sys
+import hashlib
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+def quote_hash(quote: Dict[str, Any]) -> str:
+    """Stable hash of one quote's content"""
+    body = json.dumps(quote, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()[:16]
+
+def corpus_version(hashes: Dict[str, str]) -> str:
+    """Version id of a whole corpus, derived from its (id, hash) pairs"""
+    h = hashlib.sha256()
+    for quote_id in sorted(hashes):
+        h.update(f"{quote_id}:{hashes[quote_id]}\n".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+def compute_delta(old: Dict[str, str], new: Dict[str, str], quotes_by_id: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Quotes added, changed and removed going from one snapshot to another"""
+    added = [quotes_by_id[i] for i in sorted(new) if i not in old]
+    changed = [quotes_by_id[i] for i in sorted(new) if i in old and old[i] != new[i]]
+    removed = sorted(i for i in old if i not in new)
+    return {"added": added, "changed": changed, "removed": removed}
+
+def build_deltas(master_path: str, sync_dir: str, keep: int = 20, manifest_path: Optional[str] = None):
+    """Snapshot the master file and write deltas from the last `keep` versions.
+
+    The shard manifest (default: manifest.json next to sync_dir) gets the corpus version.
+    An unchanged corpus rewrites nothing."""
+    with open(master_path, 'r', encoding='utf-8') as f:
+        quotes = json.load(f).get('quotes', [])
+
+    quotes_by_id = {q['id']: q for q in quotes if q.get('id')}
+    hashes = {i: quote_hash(q) for i, q in quotes_by_id.items()}
+    version = corpus_version(hashes)
+
+    root = Path(sync_dir)
+    snapshots_dir = root / "snapshots"
+    deltas_dir = root / "deltas"
+    snapshots_dir.mkdir(parents=True, exist_ok=True)
+    deltas_dir.mkdir(parents=True, exist_ok=True)
+
+    index_path = root / "index.json"
+    index = {"current": None, "versions": []}
+    if index_path.exists():
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+
+    manifest = Path(manifest_path) if manifest_path else root.parent / "manifest.json"
+    if index.get("current") == version and (snapshots_dir / f"{version}.json").exists():
+        _stamp_manifest(manifest, version)
+        print(f"Corpus version: {version} ({len(hashes)} quotes), unchanged")
+        return version
+
+    versions = [v for v in index.get("versions", []) if v["version"] != version]
+    versions.append({"version": version, "quote_count": len(hashes), "created": str(datetime.now())})
+    versions = versions[-keep:]
+    kept = {v["version"] for v in versions}
+
+    # Snapshot of the current corpus (ids and content hashes only)
+    with open(snapshots_dir / f"{version}.json", 'w', encoding='utf-8') as f:
+        json.dump({"version": version, "quotes": hashes}, f, separators=(",", ":"))
+
+    # Drop snapshots and deltas that fell out of the retention window
+    for path in snapshots_dir.glob("*.json"):
+        if path.stem not in kept:
+            path.unlink()
+    for path in deltas_dir.glob("*.json"):
+        path.unlink()
+
+    # One delta per earlier version, always targeting the current one
+    written = 0
+    for entry in versions[:-1]:
+        old_path = snapshots_dir / f"{entry['version']}.json"
+        if not old_path.exists():
+            continue
+        with open(old_path, 'r', encoding='utf-8') as f:
+            old = json.load(f).get("quotes", {})
+        delta = {"from": entry["version"], "to": version, **compute_delta(old, hashes, quotes_by_id)}
+        with open(deltas_dir / f"{entry['version']}__{version}.json", 'w', encoding='utf-8') as f:
+            json.dump(delta, f, separators=(",", ":"), ensure_ascii=False)
+        written += 1
+        print(f"  Delta {entry['version']} -> {version}: +{len(delta['added'])} ~{len(delta['changed'])} -{len(delta['removed'])}")
+
+    index = {"current": version, "versions": versions}
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+
+    _stamp_manifest(manifest, version)
+
+    print(f"Corpus version: {version} ({len(hashes)} quotes)")
+    print(f"Deltas written: {written}")
+    print(f"Sync index updated: {index_path}")
+    return version
+
+def _stamp_manifest(manifest_path: Path, version: str):
+    """Tell the app which corpus version its bundled shards hold (written only when it differs)"""
+    if not manifest_path.exists():
+        return
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest_data = json.load(f)
+    if manifest_data.get("corpus_version") == version:
+        return
+    manifest_data["corpus_version"] = version
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest_data, f, indent=2, ensure_ascii=False)
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python quotes_delta.py <master_file> <sync_dir> [keep_versions] [manifest_file]")
+        print("Example: python quotes_delta.py assets/quotes/quotes.json assets/quotes/sync 20")
+        sys.exit(1)
+
+    master_file = sys.argv[1]
+    sync_dir = sys.argv[2]
+    keep = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    manifest_file = sys.argv[4] if len(sys.argv) > 4 else None
+
+    build_deltas(master_file, sync_dir, keep, manifest_file)
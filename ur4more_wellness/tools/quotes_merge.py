@@ -2,12 +2,21 @@
 """
 Quote Merger for UR4MORE Wellness App
 Merges multiple quote batch files into a master quotes file
+
+--stream merges in bounded memory: batch files are parsed incrementally, sorted runs
+are spilled to a temp directory and k-way merged, duplicates are dropped by
+normalised-text hash, and the master file is written as quotes come out of the merge.
 """
 
+import heapq
+import hashlib
 import json
+import os
 import sys
+import tempfile
+from itertools import count
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Tuple
 from datetime import datetime
 
 def load_quotes_file(filepath: str) -> List[Dict[str, Any]]:
@@ -33,8 +42,9 @@ def deduplicate_quotes(quotes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     
     return unique_quotes
 
-def merge_quotes(batch_files: List[str], output_file: str):
-    """Merge multiple quote batch files into a master file"""
+def merge_quotes(batch_files: List[str], output_file: str, near_dup: float = 0.0):
+    """Merge multiple quote batch files into a master file; near_dup > 0 also collapses
+    near-duplicates at that similarity (see quotes_neardup.py)"""
     all_quotes = []
     
     print(f"Merging {len(batch_files)} batch files...")
@@ -49,6 +59,10 @@ def merge_quotes(batch_files: List[str], output_file: str):
     # Remove duplicates
     unique_quotes = deduplicate_quotes(all_quotes)
     print(f"Total quotes after deduplication: {len(unique_quotes)}")
+    if near_dup > 0:
+        from quotes_neardup import collapse_near_duplicates
+        unique_quotes = collapse_near_duplicates(unique_quotes, near_dup)
+        print(f"Total quotes after near-duplicate collapse ({near_dup}): {len(unique_quotes)}")
     
     # Create master file
     master_data = {
@@ -71,13 +85,242 @@ def merge_quotes(batch_files: List[str], output_file: str):
     print(f"Master quotes file created: {output_file}")
     print(f"Final quote count: {len(unique_quotes)}")
 
+READ_CHUNK = 1 << 16
+NUMBER_CHARS = "0123456789+-.eE"
+RUN_SIZE = 50000   # quotes held in memory per sorted run
+MERGE_FAN_IN = 64  # runs open at once during a merge pass
+
+class JsonStream:
+    """Incremental reader over a JSON file: decodes one value at a time from a sliding buffer"""
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(READ_CHUNK)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of file)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str):
+        if self.peek() != ch:
+            raise ValueError(f"expected {ch!r} at offset {self.pos}, found {self.peek()!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                v, end = self.decoder.raw_decode(self.buf, self.pos)
+                # A number running into the buffer edge ("12" of "125", "1" of "1e5") may continue in the next chunk
+                if self.eof or self.buf[end:].lstrip(NUMBER_CHARS):
+                    self.pos = end
+                    return v
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def array(self) -> Iterator[Any]:
+        """Yield the elements of the array at the cursor one at a time"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ']':
+                self.pos += 1
+                return
+            self.expect(',')
+
+    def members(self) -> Iterator[str]:
+        """Yield the keys of the object at the cursor; the caller reads (or skips, with value())
+        each member's value before asking for the next key"""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError(f"expected an object key at offset {self.pos}, found {key!r}")
+            self.expect(':')
+            yield key
+            if self.peek() == '}':
+                self.pos += 1
+                return
+            self.expect(',')
+
+def iter_quotes_file(filepath: str) -> Iterator[Dict[str, Any]]:
+    """Yield the entries of a batch file's top-level "quotes" array without loading the file"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        js = JsonStream(f)
+        for key in js.members():
+            if key == 'quotes':
+                yield from js.array()
+            else:
+                js.value()
+
+def text_hash(text: str) -> str:
+    """Hash of the normalised text (case and whitespace folded); equal hashes are duplicates"""
+    norm = " ".join(text.lower().split())
+    return hashlib.blake2b(norm.encode('utf-8'), digest_size=12).hexdigest()
+
+def _write_run(tmpdir: str, records: List[Tuple]) -> str:
+    records.sort(key=lambda r: r[:-1])
+    fd, path = tempfile.mkstemp(dir=tmpdir, suffix='.run')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for r in records:
+            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+    return path
+
+def _read_run(path: str) -> Iterator[List]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            yield json.loads(line)
+
+def _merge_runs(tmpdir: str, runs: List[str]) -> Iterator[List]:
+    """k-way merge of sorted runs, in passes of at most MERGE_FAN_IN open files"""
+    while len(runs) > MERGE_FAN_IN:
+        merged = []
+        for i in range(0, len(runs), MERGE_FAN_IN):
+            group = runs[i:i + MERGE_FAN_IN]
+            fd, path = tempfile.mkstemp(dir=tmpdir, suffix='.run')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for r in heapq.merge(*map(_read_run, group), key=lambda r: r[:-1]):
+                    f.write(json.dumps(r, ensure_ascii=False) + "\n")
+            for g in group:
+                os.remove(g)
+            merged.append(path)
+        runs = merged
+    return heapq.merge(*map(_read_run, runs), key=lambda r: r[:-1])
+
+def _spill(tmpdir: str, records: Iterator[Tuple], run_size: int) -> List[str]:
+    runs, buf = [], []
+    for r in records:
+        buf.append(r)
+        if len(buf) >= run_size:
+            runs.append(_write_run(tmpdir, buf))
+            buf = []
+    if buf:
+        runs.append(_write_run(tmpdir, buf))
+    return runs
+
+def merge_quotes_streaming(batch_files: List[str], output_file: str, run_size: int = RUN_SIZE):
+    """Merge batch files in bounded memory; output is sorted by id, then normalised-text hash.
+
+    Pass 1 spills (hash, input order, quote) runs and merges them, keeping the first
+    occurrence of each hash, as merge_quotes does. Pass 2 spills the survivors as
+    (id, hash, quote) runs and streams their merge into the master file."""
+    print(f"Stream-merging {len(batch_files)} batch files (runs of {run_size})...")
+    seq = count()
+    stats = {"read": 0}
+
+    def by_hash():
+        for filepath in batch_files:
+            n = 0
+            try:
+                for quote in iter_quotes_file(filepath):
+                    text = quote.get('text', '') if isinstance(quote, dict) else ''
+                    if text.strip():
+                        n += 1
+                        yield (text_hash(text), next(seq), quote)
+            except Exception as e:
+                print(f"Error loading {filepath}: {e}")
+            stats["read"] += n
+            print(f"  Loaded {n} quotes from {filepath}")
+
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    # Runs go next to the output: the same disk has room for another copy of the corpus
+    with tempfile.TemporaryDirectory(prefix='.quotes_merge_', dir=Path(output_file).parent) as tmpdir:
+        runs = _spill(tmpdir, by_hash(), run_size)
+        print(f"Total quotes before deduplication: {stats['read']} ({len(runs)} runs)")
+
+        unique = {"n": 0}
+        def deduped():
+            last = None
+            for h, _, quote in _merge_runs(tmpdir, runs):
+                if h != last:
+                    last = h
+                    unique["n"] += 1
+                    yield (str(quote.get('id', '')), h, quote)
+        id_runs = _spill(tmpdir, deduped(), run_size)
+        for r in runs:
+            if os.path.exists(r):
+                os.remove(r)
+        print(f"Total quotes after deduplication: {unique['n']}")
+
+        header = {
+            "version": 1,
+            "metadata": {
+                "total_quotes": unique["n"],
+                "created": str(datetime.now()),
+                "source_files": batch_files
+            },
+        }
+        tmp_out = f"{output_file}.tmp"
+        with open(tmp_out, 'w', encoding='utf-8') as f:
+            head = json.dumps(header, indent=2, ensure_ascii=False)
+            f.write(head[:-2] + ',\n  "quotes": [')
+            first = True
+            for _, _, quote in _merge_runs(tmpdir, id_runs):
+                body = json.dumps(quote, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+                f.write(("\n    " if first else ",\n    ") + body)
+                first = False
+            f.write("\n  ]\n}" if not first else "]\n}")
+        os.replace(tmp_out, output_file)
+
+    print(f"Master quotes file created: {output_file}")
+    print(f"Final quote count: {unique['n']}")
+
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python quotes_merge.py <output_file> <batch_file1> [batch_file2] ...")
+    args = sys.argv[1:]
+    stream = "--stream" in args
+    run_size = RUN_SIZE
+    near_dup = 0.0
+    if "--near-dup" in args:
+        i = args.index("--near-dup")
+        near_dup = float(args[i + 1])
+        del args[i:i + 2]
+    if "--run-size" in args:
+        i = args.index("--run-size")
+        run_size = int(args[i + 1])
+        del args[i:i + 2]
+    args = [a for a in args if a != "--stream"]
+    if len(args) < 2:
+        print("Usage: python quotes_merge.py [--near-dup 0.5 | --stream [--run-size N]] <output_file> <batch_file1> [batch_file2] ...")
         print("Example: python quotes_merge.py assets/quotes/quotes.json assets/quotes/batches/*.json")
+        print("--near-dup also collapses near-duplicates (MinHash/LSH, Jaccard threshold); not available with --stream")
+        print("--stream merges in bounded memory (incremental parsing, external sort, hash dedupe); output sorted by id")
         sys.exit(1)
     
-    output_file = sys.argv[1]
-    batch_files = sys.argv[2:]
+    output_file = args[0]
+    batch_files = args[1:]
     
-    merge_quotes(batch_files, output_file)
+    if stream and near_dup > 0:
+        print("--near-dup needs every text in memory; run quotes_neardup.py collapse on the streamed output instead")
+        sys.exit(1)
+    if stream:
+        merge_quotes_streaming(batch_files, output_file, run_size)
+    else:
+        merge_quotes(batch_files, output_file, near_dup)
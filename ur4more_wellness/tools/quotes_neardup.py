@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Quote Detector for UR4MORE Wellness App
+Finds quotes that differ only in punctuation or a few words, across batch and seed files
+
+Texts are normalised (case, punctuation, whitespace), cut into character shingles and
+summarised by MinHash signatures. LSH banding puts likely-similar texts in the same
+bucket, so only bucket mates are compared (no all-pairs pass); candidates are confirmed
+with the exact Jaccard similarity of their shingle sets. Every collapsed quote is at least
+the threshold similar to the quote kept in its place.
+
+report    print clusters of near-duplicates (and optionally write them as JSON)
+collapse  keep the first quote of every cluster (argument order, then file order) and
+          rewrite the files without the others
+"""
+
+import hashlib
+import json
+import random
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+THRESHOLD = 0.5   # Jaccard similarity of shingle sets at which two quotes are near-duplicates
+SHINGLE = 5       # characters per shingle
+PERMS = 128       # MinHash signature length
+_NON_WORD = re.compile(r"[^\w\s]+")
+
+def normalise(text: str) -> str:
+    """Lowercase, drop punctuation, collapse whitespace"""
+    return " ".join(_NON_WORD.sub(" ", text.lower()).split())
+
+def shingles(text: str, k: int = SHINGLE) -> frozenset:
+    """64-bit hashes of the k-character shingles of the normalised text"""
+    norm = normalise(text)
+    if len(norm) <= k:
+        grams: Iterable[str] = [norm]
+    else:
+        grams = (norm[i:i + k] for i in range(len(norm) - k + 1))
+    return frozenset(int.from_bytes(hashlib.blake2b(g.encode('utf-8'), digest_size=8).digest(), 'little') for g in grams)
+
+def lsh_params(threshold: float, perms: int = PERMS) -> Tuple[int, int]:
+    """(bands, rows) with bands * rows <= perms whose S-curve midpoint (1/b)^(1/r) is closest to threshold"""
+    best = (perms, 1)
+    for rows in range(1, perms + 1):
+        bands = perms // rows
+        if abs((1 / bands) ** (1 / rows) - threshold) < abs((1 / best[0]) ** (1 / best[1]) - threshold):
+            best = (bands, rows)
+    return best
+
+class MinHasher:
+    """MinHash by XOR with per-permutation random masks: shingles are already uniform 64-bit
+    hashes, and min(map(mask.__xor__, ...)) runs in C, several times faster than (a*h+b) % p"""
+
+    def __init__(self, perms: int = PERMS, seed: int = 1):
+        rnd = random.Random(seed)
+        self.masks = [rnd.getrandbits(64) for _ in range(perms)]
+
+    def signature(self, sh: frozenset) -> Tuple[int, ...]:
+        return tuple(min(map(m.__xor__, sh)) for m in self.masks)
+
+def jaccard(x: frozenset, y: frozenset) -> float:
+    return len(x & y) / len(x | y) if x or y else 1.0
+
+def find_clusters(texts: List[str], threshold: float = THRESHOLD, k: int = SHINGLE, perms: int = PERMS) -> Dict[int, List[Tuple[int, float]]]:
+    """Cluster near-duplicate texts.
+
+    Returns {index of the kept text: [(index of a near-duplicate, Jaccard similarity to the kept text), ...]}
+    for every cluster of two or more. Identical normalised texts are hashed once."""
+    distinct: Dict[str, int] = {}
+    first_of: List[int] = []
+    for i, t in enumerate(texts):
+        norm = normalise(t)
+        if norm not in distinct:
+            distinct[norm] = len(first_of)
+            first_of.append(i)
+    sets = [shingles(texts[i], k) for i in first_of]
+
+    bands, rows = lsh_params(threshold, perms)
+    hasher = MinHasher(bands * rows)
+    buckets: Dict[Tuple, List[int]] = defaultdict(list)
+    for d, sh in enumerate(sets):
+        sig = hasher.signature(sh)
+        for band in range(bands):
+            buckets[(band,) + sig[band * rows:(band + 1) * rows]].append(d)
+
+    # Confirmed pairs, earlier text first
+    similar: Dict[int, Dict[int, float]] = defaultdict(dict)
+    for members in buckets.values():
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                lo, hi = members[x], members[y]
+                if lo not in similar[hi]:
+                    similar[hi][lo] = jaccard(sets[lo], sets[hi])
+
+    # Leader clustering instead of connected components: a text joins the earliest kept text
+    # it is itself similar to, so chains of small edits never pull in unrelated quotes
+    leader: List[int] = []
+    for d in range(len(sets)):
+        near = [e for e, sim in similar.get(d, {}).items() if sim >= threshold and leader[e] == e]
+        leader.append(min(near) if near else d)
+
+    clusters: Dict[int, List[Tuple[int, float]]] = defaultdict(list)
+    for i, t in enumerate(texts):
+        d = distinct[normalise(t)]
+        keep = first_of[leader[d]]
+        if i != keep:
+            clusters[keep].append((i, round(jaccard(sets[leader[d]], sets[d]), 3)))
+    return dict(clusters)
+
+def collapse_near_duplicates(quotes: List[Dict[str, Any]], threshold: float = THRESHOLD) -> List[Dict[str, Any]]:
+    """Quotes with every near-duplicate of an earlier quote removed (order kept)"""
+    clusters = find_clusters([q.get('text', '') for q in quotes], threshold)
+    dropped = {i for members in clusters.values() for i, _ in members}
+    return [q for i, q in enumerate(quotes) if i not in dropped]
+
+def load_quote_files(files: List[str]) -> Tuple[List[Tuple[str, Dict[str, Any]]], Dict[str, Any]]:
+    """(file, quote) pairs in argument order, plus each file's parsed JSON (seed files are bare lists)"""
+    entries, docs = [], {}
+    for filepath in files:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            doc = json.load(f)
+        docs[filepath] = doc
+        quotes = doc if isinstance(doc, list) else doc.get('quotes', [])
+        entries.extend((filepath, q) for q in quotes if isinstance(q, dict) and q.get('text', '').strip())
+    return entries, docs
+
+def report(files: List[str], threshold: float = THRESHOLD, json_out: str = "") -> Dict[int, List[Tuple[int, float]]]:
+    entries, _ = load_quote_files(files)
+    clusters = find_clusters([q['text'] for _, q in entries], threshold)
+    dropped = sum(len(m) for m in clusters.values())
+    print(f"Scanned {len(entries)} quotes in {len(files)} files (threshold {threshold}, LSH {lsh_params(threshold)} bands x rows)")
+    print(f"Near-duplicate clusters: {len(clusters)}; quotes that would be collapsed: {dropped}")
+    for keep, members in sorted(clusters.items(), key=lambda c: -len(c[1]))[:20]:
+        kf, kq = entries[keep]
+        print(f"\n  keep {kq.get('id', '?')} ({Path(kf).name}): {kq['text']}")
+        for i, sim in members[:5]:
+            f, q = entries[i]
+            print(f"    {sim:.2f} {q.get('id', '?')} ({Path(f).name}): {q['text']}")
+        if len(members) > 5:
+            print(f"    ... and {len(members) - 5} more")
+    if json_out:
+        out = [{
+            "keep": {"file": entries[keep][0], "id": entries[keep][1].get('id'), "text": entries[keep][1]['text']},
+            "duplicates": [{"file": entries[i][0], "id": entries[i][1].get('id'), "text": entries[i][1]['text'], "similarity": sim}
+                           for i, sim in members],
+        } for keep, members in clusters.items()]
+        with open(json_out, 'w', encoding='utf-8') as f:
+            json.dump({"threshold": threshold, "clusters": out}, f, indent=2, ensure_ascii=False)
+        print(f"\nReport written to {json_out}")
+    return clusters
+
+def collapse(files: List[str], threshold: float = THRESHOLD) -> int:
+    """Rewrite the files without near-duplicates of quotes that come earlier; returns the number removed"""
+    entries, docs = load_quote_files(files)
+    clusters = find_clusters([q['text'] for _, q in entries], threshold)
+    dropped = {id(entries[i][1]) for members in clusters.values() for i, _ in members}
+    for filepath, doc in docs.items():
+        quotes = doc if isinstance(doc, list) else doc.get('quotes', [])
+        kept = [q for q in quotes if id(q) not in dropped]
+        if len(kept) == len(quotes):
+            continue
+        if isinstance(doc, list):
+            doc = kept
+        else:
+            doc['quotes'] = kept
+            if isinstance(doc.get('metadata'), dict) and 'total_quotes' in doc['metadata']:
+                doc['metadata']['total_quotes'] = len(kept)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(doc, f, indent=2, ensure_ascii=False)
+        print(f"  {filepath}: removed {len(quotes) - len(kept)} near-duplicates, {len(kept)} quotes left")
+    print(f"Collapsed {len(dropped)} near-duplicates into {len(clusters)} kept quotes")
+    return len(dropped)
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    threshold, json_out = THRESHOLD, ""
+    if "--threshold" in args:
+        i = args.index("--threshold")
+        threshold = float(args[i + 1])
+        del args[i:i + 2]
+    if "--json" in args:
+        i = args.index("--json")
+        json_out = args[i + 1]
+        del args[i:i + 2]
+    if len(args) < 2 or args[0] not in ("report", "collapse"):
+        print("Usage: python quotes_neardup.py report [--threshold 0.5] [--json report.json] <quotes_file> ...")
+        print("       python quotes_neardup.py collapse [--threshold 0.5] <quotes_file> ...")
+        print("Example: python quotes_neardup.py report assets/quotes/quotes_faith_seed.json assets/quotes/quotes_secular_seed.json assets/quotes/batches/*.json")
+        sys.exit(1)
+
+    if args[0] == "report":
+        report(args[1:], threshold, json_out)
+    else:
+        collapse(args[1:], threshold)
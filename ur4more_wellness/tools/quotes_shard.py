@@ -6,13 +6,62 @@ Splits master quotes file into smaller shards for efficient loading
 
 import json
 import sys
-import math
 import os
+import gzip
+import hashlib
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
+try:
+    import brotli
+except Exception:
+    brotli = None
 
-def shard_quotes(master_path: str, output_dir: str, shard_size: int = 1000):
-    """Split master quotes file into smaller shards"""
+def write_precompressed(path: Path):
+    """Write .gz (and .br when brotli is installed) siblings so servers never compress shards at request time"""
+    raw = path.read_bytes()
+    Path(f"{path}.gz").write_bytes(gzip.compress(raw, compresslevel=9, mtime=0))
+    if brotli:
+        Path(f"{path}.br").write_bytes(brotli.compress(raw, quality=11))
+
+# Mode facets: which partitions a client in each faith mode needs (see Quote.offSafe / faithOk in the app).
+# Quotes in neither (not off_safe, not faith_ok) could never be served and are left out of the shards.
+PARTITIONS = ("universal", "off", "faith")
+MODE_PARTITIONS = {"off": ["universal", "off"], "faith": ["universal", "faith"]}
+TARGET_BYTES = 64 * 1024
+ASSET_DIR = "assets/quotes/shards"  # Flutter asset key of the shard directory (pubspec.yaml)
+
+def partition_of(quote: dict) -> str:
+    modes = quote.get('modes') or {}
+    off_safe, faith_ok = modes.get('off_safe') is True, modes.get('faith_ok') is True
+    if off_safe and faith_ok:
+        return "universal"
+    return "off" if off_safe else "faith" if faith_ok else "none"
+
+def primary_tag(quote: dict) -> str:
+    tags = quote.get('tags') or []
+    return str(tags[0]) if tags else "untagged"
+
+def json_size(quote: dict) -> int:
+    """Bytes the quote takes in a shard file (indent=2, nested two levels deep, plus separator)"""
+    text = json.dumps(quote, indent=2, ensure_ascii=False)
+    return len(text.encode('utf-8')) + 4 * (text.count("\n") + 1) + 2
+
+def parse_size(value: str) -> int:
+    """Byte count from '65536', '64k' or '1m'"""
+    value = value.strip().lower()
+    scale = {"k": 1024, "m": 1024 * 1024}.get(value[-1:], 1)
+    return int(float(value.rstrip("km")) * scale)
+
+def shard_quotes(master_path: str, output_dir: str, target_bytes: int = TARGET_BYTES, manifest_path: Optional[str] = None):
+    """Split the master quotes file into facet shards.
+
+    Quotes are partitioned by modes (universal = off_safe and faith_ok, off, faith; quotes
+    that are neither are dropped with a warning) and ordered by primary tag inside each partition, then packed into shards of about
+    target_bytes of JSON; a tag only spans shards when it alone exceeds the target. The
+    manifest indexes every shard's partition, tag counts and size, and lists per faith mode
+    (MODE_PARTITIONS) the files a client needs, so it never loads the other mode's shards.
+    The manifest defaults to manifest.json next to output_dir."""
     
     # Load master file
     with open(master_path, 'r', encoding='utf-8') as f:
@@ -25,66 +74,134 @@ def shard_quotes(master_path: str, output_dir: str, shard_size: int = 1000):
         print("No quotes found in master file")
         return
     
-    # Calculate number of shards needed
-    num_shards = math.ceil(total_quotes / shard_size)
+    # Group by (partition, primary tag); master order is kept inside a group
+    groups = {}
+    unservable = []
+    for q in quotes:
+        partition = partition_of(q)
+        if partition not in PARTITIONS:
+            unservable.append(q)
+            continue
+        groups.setdefault((partition, primary_tag(q)), []).append(q)
+    if unservable:
+        ids = ", ".join(str(q.get('id', '?')) for q in unservable[:5]) + (", ..." if len(unservable) > 5 else "")
+        print(f"[WARNING] Skipping {len(unservable)} quotes that are neither off_safe nor faith_ok (no mode can load them): {ids}")
+    
+    # Pack each partition's tag groups into shards of about target_bytes
+    packed = []  # (partition, [quotes])
+    for partition in PARTITIONS:
+        current, size = [], 0
+        for (part, tag), members in sorted(groups.items()):
+            if part != partition:
+                continue
+            group_size = sum(json_size(q) for q in members)
+            # keep a tag in one shard when it fits; otherwise fill quote by quote
+            if current and size + group_size > target_bytes:
+                packed.append((partition, current))
+                current, size = [], 0
+            for q in members:
+                q_size = json_size(q)
+                if current and size + q_size > target_bytes:
+                    packed.append((partition, current))
+                    current, size = [], 0
+                current.append(q)
+                size += q_size
+        if current:
+            packed.append((partition, current))
+    num_shards = len(packed)
     
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
     
     # Create shard files
     shard_files = []
-    for i in range(num_shards):
-        start_idx = i * shard_size
-        end_idx = min((i + 1) * shard_size, total_quotes)
-        
-        shard_quotes = quotes[start_idx:end_idx]
+    checksums = {}
+    index = []
+    counters = {}
+    for i, (partition, shard_quotes) in enumerate(packed):
+        n = counters.get(partition, 0)
+        counters[partition] = n + 1
+        tags = {}
+        for q in shard_quotes:
+            tags[primary_tag(q)] = tags.get(primary_tag(q), 0) + 1
         
         shard_data = {
             "version": data.get("version", 1),
             "metadata": {
                 "shard_index": i,
                 "total_shards": num_shards,
+                "partition": partition,
                 "quote_count": len(shard_quotes),
+                "tags": tags,
                 "created": str(datetime.now())
             },
             "quotes": shard_quotes
         }
         
-        shard_filename = f"quotes_{i:03d}.json"
+        shard_filename = f"quotes_{partition}_{n:03d}.json"
         shard_path = Path(output_dir) / shard_filename
-        shard_files.append(f"assets/quotes/shards/{shard_filename}")
+        asset = f"{ASSET_DIR}/{shard_filename}"
+        shard_files.append(asset)
         
         with open(shard_path, 'w', encoding='utf-8') as f:
             json.dump(shard_data, f, indent=2, ensure_ascii=False)
         
-        print(f"Created shard {i+1}/{num_shards}: {shard_filename} ({len(shard_quotes)} quotes)")
+        checksums[asset] = hashlib.sha256(shard_path.read_bytes()).hexdigest()
+        write_precompressed(shard_path)
+        index.append({"file": asset, "partition": partition, "count": len(shard_quotes),
+                      "bytes": shard_path.stat().st_size, "tags": tags})
+        
+        print(f"Created shard {i+1}/{num_shards}: {shard_filename} ({len(shard_quotes)} quotes, {shard_path.stat().st_size // 1024} KiB)")
+    
+    # Shards from an earlier build whose names are no longer produced
+    written = {Path(asset).name for asset in shard_files}
+    for old in Path(output_dir).glob("quotes_*.json*"):
+        if f"{old.name.split('.json')[0]}.json" not in written:
+            old.unlink()
     
     # Update manifest file
-    manifest_path = "assets/quotes/manifest.json"
+    manifest_path = manifest_path or str(Path(output_dir).parent / "manifest.json")
+    modes = {}
+    for mode, partitions in MODE_PARTITIONS.items():
+        entries = [e for e in index if e["partition"] in partitions]
+        modes[mode] = {"files": [e["file"] for e in entries], "count": sum(e["count"] for e in entries),
+                       "bytes": sum(e["bytes"] for e in entries)}
+    tag_index = {}
+    for e in index:
+        for tag in e["tags"]:
+            tag_index.setdefault(tag, []).append(e["file"])
     manifest_data = {
         "version": 1,
         "shard_count": num_shards,
         "files": shard_files,
+        "checksums": checksums,
+        "target_bytes": target_bytes,
+        "shards": index,
+        "modes": modes,
+        "tags": dict(sorted(tag_index.items())),
         "last_updated": str(datetime.now())
     }
     
     with open(manifest_path, 'w', encoding='utf-8') as f:
         json.dump(manifest_data, f, indent=2, ensure_ascii=False)
     
-    print(f"\nSharding complete!")
+    total_bytes = sum(e["bytes"] for e in index)
+    print("\nSharding complete!")
     print(f"Total quotes: {total_quotes}")
-    print(f"Number of shards: {num_shards}")
-    print(f"Quotes per shard: ~{shard_size}")
+    print(f"Number of shards: {num_shards} (target {target_bytes // 1024} KiB each)")
+    for mode, m in modes.items():
+        print(f"Mode {mode}: {len(m['files'])} shards, {m['count']} quotes, {100 * m['bytes'] // max(total_bytes, 1)}% of the bytes")
     print(f"Manifest updated: {manifest_path}")
 
 if __name__ == "__main__":
     if len(sys.argv) < 3:
-        print("Usage: python quotes_shard.py <master_file> <output_dir> [shard_size]")
-        print("Example: python quotes_shard.py assets/quotes/quotes.json assets/quotes/shards 1000")
+        print("Usage: python quotes_shard.py <master_file> <output_dir> [target_size] [manifest_file]")
+        print("Example: python quotes_shard.py assets/quotes/quotes.json assets/quotes/shards 64k")
         sys.exit(1)
     
     master_file = sys.argv[1]
     output_dir = sys.argv[2]
-    shard_size = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    target_bytes = parse_size(sys.argv[3]) if len(sys.argv) > 3 else TARGET_BYTES
+    manifest_file = sys.argv[4] if len(sys.argv) > 4 else None
     
-    shard_quotes(master_file, output_dir, shard_size)
+    shard_quotes(master_file, output_dir, target_bytes, manifest_file)
@@ -2,114 +2,230 @@
 """
 Quote Validator for UR4MORE Wellness App
 Validates quote files against the required schema
+
+QUOTE_SCHEMA is compiled once into a chain of checks; each error carries the JSON pointer
+of the offending value (e.g. /quotes/12/modes/faith_ok). Files are validated in parallel
+on a process pool, files larger than STREAM_BYTES are parsed incrementally, and
+--max-errors stops a file's validation after that many errors.
 """
 
 import json
+import os
 import sys
-from pathlib import Path
-
-def validate_quote(quote: dict) -> list:
-    """Validate a single quote against the schema"""
-    errors = []
-    
-    # Required fields
-    required_fields = [
+from typing import Any, Callable, Dict, List, Tuple
+
+STREAM_BYTES = 32 * 1024 * 1024  # larger files are validated without loading them whole
+
+QUOTE_SCHEMA = {
+    "type": "object",
+    "required": [
         'id', 'text', 'author', 'work', 'year_approx', 'source',
         'public_domain', 'license', 'tags', 'axis', 'modes',
         'scripture_kjv', 'attribution', 'checksum'
-    ]
-    
-    for field in required_fields:
-        if field not in quote:
-            errors.append(f"Missing required field: {field}")
-    
-    # Validate text length
-    if 'text' in quote and len(quote['text']) > 240:
-        errors.append(f"Text too long: {len(quote['text'])} characters (max 240)")
-    
-    # Validate modes structure
-    if 'modes' in quote:
-        modes = quote['modes']
-        if not isinstance(modes, dict):
-            errors.append("modes must be a dictionary")
-        else:
-            if 'off_safe' not in modes or 'faith_ok' not in modes:
-                errors.append("modes must contain 'off_safe' and 'faith_ok' fields")
-    
-    # Validate scripture structure
-    if 'scripture_kjv' in quote:
-        scripture = quote['scripture_kjv']
-        if not isinstance(scripture, dict):
-            errors.append("scripture_kjv must be a dictionary")
-        else:
-            if 'enabled' not in scripture:
-                errors.append("scripture_kjv must contain 'enabled' field")
-            elif scripture.get('enabled') and len(scripture.get('text', '')) > 200:
-                errors.append("Scripture text too long (max 200 characters)")
-    
-    # Validate public domain flag
-    if 'public_domain' in quote and not quote['public_domain']:
-        errors.append("All quotes must be public domain")
-    
-    # Validate year
-    if 'year_approx' in quote:
-        year = quote['year_approx']
-        if not isinstance(year, int) or year < 100 or year > 2024:
-            errors.append(f"Invalid year: {year}")
-    
+    ],
+    "properties": {
+        "text": {"maxLength": 240},
+        "modes": {"type": "object", "required": ["off_safe", "faith_ok"]},
+        "scripture_kjv": {
+            "type": "object",
+            "required": ["enabled"],
+            # the passage text only matters when the overlay is enabled
+            "if_true": ("enabled", {"properties": {"text": {"maxLength": 200}}}),
+        },
+        "public_domain": {"const": True, "message": "All quotes must be public domain"},
+        "year_approx": {"type": "integer", "minimum": 100, "maximum": 2024},
+    },
+}
+
+Check = Callable[[Any, str, List[Dict[str, str]]], None]
+
+def _escape(key: str) -> str:
+    return key.replace('~', '~0').replace('/', '~1')
+
+def _emit(schema: Dict[str, Any], var: str, ptr: str, lines: List[str], consts: Dict[str, Any], indent: int, depth: int):
+    """Append the source lines checking `var` (whose JSON pointer expression is `ptr`) against schema;
+    constants the checks need are bound once in `consts`"""
+    pad = "    " * indent
+    add = lambda line: lines.append(pad + line)
+    typ = schema.get("type")
+    if typ == "object":
+        add(f"if not isinstance({var}, dict):")
+        add(f"    errors.append({{'pointer': {ptr}, 'message': 'must be an object'}})")
+        add("else:")
+    elif typ == "integer":
+        add(f"if not isinstance({var}, int) or isinstance({var}, bool):")
+        add(f"    errors.append({{'pointer': {ptr}, 'message': 'must be an integer, got %r' % ({var},)}})")
+        add("else:")
+    if typ in ("object", "integer"):
+        pad += "    "
+    body_at = len(lines)
+
+    required = schema.get("required", [])
+    if required:
+        # one set comparison on the happy path; the per-key loop only runs for broken quotes
+        name = f"_REQUIRED_{len(consts)}"
+        consts[name] = frozenset(required)
+        add(f"if not {name} <= {var}.keys():")
+        add(f"    for key in {tuple(required)!r}:")
+        add(f"        if key not in {var}:")
+        add(f"            errors.append({{'pointer': {ptr} + '/' + key.replace('~', '~0').replace('/', '~1'), 'message': 'missing required field'}})")
+
+    for key, sub in schema.get("properties", {}).items():
+        child = f"v{depth + 1}"
+        add(f"if {key!r} in {var}:")
+        add(f"    {child} = {var}[{key!r}]")
+        _emit(sub, child, f"{ptr} + {'/' + _escape(key)!r}", lines, consts, len(pad) // 4 + 1, depth + 1)
+
+    if "if_true" in schema:
+        flag, then_schema = schema["if_true"]
+        add(f"if {var}.get({flag!r}):")
+        _emit(then_schema, var, ptr, lines, consts, len(pad) // 4 + 1, depth)
+
+    if "maxLength" in schema:
+        limit = schema["maxLength"]
+        add(f"if not isinstance({var}, str):")
+        add(f"    errors.append({{'pointer': {ptr}, 'message': 'must be a string'}})")
+        add(f"elif len({var}) > {limit}:")
+        add(f"    errors.append({{'pointer': {ptr}, 'message': 'too long: %d characters (max {limit})' % len({var})}})")
+
+    if "const" in schema:
+        message = schema.get("message", f"must be {schema['const']!r}")
+        add(f"if {var} != {schema['const']!r}:")
+        add(f"    errors.append({{'pointer': {ptr}, 'message': {message!r}}})")
+
+    if "minimum" in schema or "maximum" in schema:
+        lo, hi = schema.get("minimum", float("-inf")), schema.get("maximum", float("inf"))
+        add(f"if not {lo!r} <= {var} <= {hi!r}:")
+        add(f"    errors.append({{'pointer': {ptr}, 'message': 'must be between {lo} and {hi}, got %r' % ({var},)}})")
+
+    if typ in ("object", "integer") and len(lines) == body_at:
+        lines.pop()  # nothing to check once the type matched: drop the empty else
+
+def compile_schema(schema: Dict[str, Any]) -> Check:
+    """Generate and compile one Python function check(value, pointer, errors) for the schema;
+    it appends {"pointer", "message"} dicts. Supports type (object/integer), required,
+    properties, maxLength, const, minimum/maximum and if_true (sub-schema applied when a
+    field is truthy)."""
+    lines = ["def check(v0, pointer, errors):"]
+    namespace: Dict[str, Any] = {}
+    _emit(schema, "v0", "pointer", lines, namespace, 1, 0)
+    if len(lines) == 1:
+        lines.append("    pass")  # schema without constraints
+    exec(compile("\n".join(lines), "<quote schema>", "exec"), namespace)
+    check = namespace["check"]
+    check.source = "\n".join(lines)
+    return check
+
+_check_quote = compile_schema(QUOTE_SCHEMA)
+
+def validate_quote(quote: dict, pointer: str = "") -> List[Dict[str, str]]:
+    """Validate a single quote against the schema; errors as {"pointer", "message"}"""
+    errors: List[Dict[str, str]] = []
+    _check_quote(quote, pointer, errors)
     return errors
 
-def validate_quotes_file(filepath: str) -> bool:
-    """Validate a quotes file"""
-    try:
+def _iter_quotes(filepath: str) -> Any:
+    """Yield the file's quotes; small files are json.load-ed (C parser), large ones streamed.
+    Raises ValueError for a file without a top-level 'quotes' list."""
+    if os.path.getsize(filepath) <= STREAM_BYTES:
         with open(filepath, 'r', encoding='utf-8') as f:
             data = json.load(f)
-        
-        if 'quotes' not in data:
-            print(f"[ERROR] {filepath}: Missing 'quotes' field")
-            return False
-        
-        quotes = data['quotes']
-        if not isinstance(quotes, list):
-            print(f"[ERROR] {filepath}: 'quotes' must be a list")
-            return False
-        
-        total_errors = 0
-        for i, quote in enumerate(quotes):
-            errors = validate_quote(quote)
-            if errors:
-                print(f"[ERROR] {filepath}: Quote {i+1} ({quote.get('id', 'unknown')}):")
-                for error in errors:
-                    print(f"   - {error}")
-                total_errors += len(errors)
-        
-        if total_errors == 0:
-            print(f"[SUCCESS] {filepath}: {len(quotes)} quotes validated successfully")
-            return True
-        else:
-            print(f"[ERROR] {filepath}: {total_errors} validation errors found")
-            return False
-            
+        if not isinstance(data, dict) or 'quotes' not in data:
+            raise ValueError("Missing 'quotes' field")
+        if not isinstance(data['quotes'], list):
+            raise ValueError("'quotes' must be a list")
+        yield from data['quotes']
+        return
+    from quotes_merge import JsonStream
+    with open(filepath, 'r', encoding='utf-8') as f:
+        js = JsonStream(f)
+        found = False
+        for key in js.members():
+            if key != 'quotes':
+                js.value()
+            elif js.peek() != '[':
+                raise ValueError("'quotes' must be a list")
+            else:
+                found = True
+                yield from js.array()
+        if not found:
+            raise ValueError("Missing 'quotes' field")
+
+def check_quotes_file(filepath: str, max_errors: int = 0) -> Dict[str, Any]:
+    """Machine-readable result for one file: {"file", "valid", "quotes", "errors": [{"pointer", "message"}],
+    "stopped_early"}. max_errors > 0 stops after that many errors."""
+    result: Dict[str, Any] = {"file": filepath, "valid": False, "quotes": 0, "errors": [], "stopped_early": False}
+    errors = result["errors"]
+    try:
+        for i, quote in enumerate(_iter_quotes(filepath)):
+            result["quotes"] = i + 1
+            _check_quote(quote, f"/quotes/{i}", errors)
+            if max_errors and len(errors) >= max_errors:
+                del errors[max_errors:]
+                result["stopped_early"] = True
+                break
     except json.JSONDecodeError as e:
-        print(f"[ERROR] {filepath}: JSON decode error - {e}")
-        return False
+        errors.append({"pointer": "", "message": f"JSON decode error - {e}"})
     except Exception as e:
-        print(f"[ERROR] {filepath}: Error - {e}")
-        return False
+        errors.append({"pointer": "", "message": str(e)})
+    result["valid"] = not errors
+    return result
+
+def print_result(result: Dict[str, Any]):
+    filepath, errors = result["file"], result["errors"]
+    if result["valid"]:
+        print(f"[SUCCESS] {filepath}: {result['quotes']} quotes validated successfully")
+        return
+    for error in errors:
+        print(f"[ERROR] {filepath}#{error['pointer']}: {error['message']}")
+    more = " (stopped early)" if result["stopped_early"] else ""
+    print(f"[ERROR] {filepath}: {len(errors)} validation errors found{more}")
+
+def validate_quotes_file(filepath: str, max_errors: int = 0) -> bool:
+    """Validate a quotes file"""
+    result = check_quotes_file(filepath, max_errors)
+    print_result(result)
+    return result["valid"]
+
+def validate_files(files: List[str], workers: int = 0, max_errors: int = 0) -> List[Dict[str, Any]]:
+    """Results for every file, in argument order; more than one file is spread over a process pool"""
+    workers = min(workers or os.cpu_count() or 1, len(files))
+    if workers <= 1:
+        return [check_quotes_file(f, max_errors) for f in files]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(check_quotes_file, files, [max_errors] * len(files), chunksize=max(1, len(files) // (workers * 4))))
+
+def _pop_option(args: List[str], name: str, default: str) -> Tuple[str, List[str]]:
+    if name in args:
+        i = args.index(name)
+        return args[i + 1], args[:i] + args[i + 2:]
+    return default, args
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python quotes_validate.py <file1> [file2] ...")
+    args = sys.argv[1:]
+    workers, args = _pop_option(args, "--workers", "0")
+    max_errors, args = _pop_option(args, "--max-errors", "0")
+    json_out, args = _pop_option(args, "--json", "")
+    if len(args) < 1:
+        print("Usage: python quotes_validate.py [--workers N] [--max-errors N] [--json report.json|-] <file1> [file2] ...")
         print("Example: python quotes_validate.py assets/quotes/batches/*.json")
         sys.exit(1)
-    
-    files = sys.argv[1:]
-    all_valid = True
-    
-    for filepath in files:
-        if not validate_quotes_file(filepath):
-            all_valid = False
-    
+
+    results = validate_files(args, int(workers), int(max_errors))
+    all_valid = all(r["valid"] for r in results)
+    report = {"valid": all_valid, "files": results}
+
+    if json_out == "-":
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        sys.exit(0 if all_valid else 1)
+    for result in results:
+        print_result(result)
+    if json_out:
+        with open(json_out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Report written to {json_out}")
+
     if all_valid:
         print("\n[SUCCESS] All files validated successfully!")
         sys.exit(0)
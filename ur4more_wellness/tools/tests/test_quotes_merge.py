@@ -0,0 +1,67 @@
+import glob, io, json, os
+import pytest
+import quotes_merge
+from quotes_merge import JsonStream, iter_quotes_file, merge_quotes, merge_quotes_streaming
+
+ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+BATCHES = sorted(glob.glob(os.path.join(ROOT, "assets", "quotes", "batches", "*.json")))
+
+DOC = {
+    "version": 1,
+    "metadata": {"total_quotes": 2, "ratio": -12.5e3, "tiny": 1e-7, "big": 125000, "flags": [True, False, None]},
+    "quotes": [
+        {"id": "a", "text": "He said \"be still\" — and was.", "year_approx": 1850, "modes": {"off_safe": True}},
+        {"id": "b", "text": "", "tags": [[], {}, [1, [2, [3]]]], "scripture_kjv": {"enabled": False, "text": None}},
+    ],
+    "trailer": 0,
+}
+
+@pytest.fixture(params=[1, 2, 3, 7])
+def tiny_chunks(request, monkeypatch):
+    """Every number, literal and string straddles a chunk boundary at one of these sizes"""
+    monkeypatch.setattr(quotes_merge, "READ_CHUNK", request.param)
+
+def test_values_across_chunk_boundaries(tiny_chunks):
+    for text in (json.dumps(DOC), json.dumps(DOC, indent=2)):
+        assert JsonStream(io.StringIO(text)).value() == json.loads(text)
+
+def test_top_level_numbers_and_literals_are_read_whole(tiny_chunks):
+    # Elements decoded one by one: "1" of "1e5" or "12" of "125" must not be taken for the whole number
+    numbers = "[1e5, 1E+5, -0.5, 12345678901234567890, 125, true, false, null, 3]"
+    assert list(JsonStream(io.StringIO(numbers)).array()) == json.loads(numbers)
+    js = JsonStream(io.StringIO('{"version": 125, "ratio": -2.5e-3, "ok": true}'))
+    assert {key: js.value() for key in js.members()} == {"version": 125, "ratio": -2.5e-3, "ok": True}
+
+def test_iter_quotes_file_matches_json_load(tmp_path, tiny_chunks):
+    path = tmp_path / "batch.json"
+    path.write_text(json.dumps(DOC, indent=2, ensure_ascii=False), encoding="utf-8")
+    assert list(iter_quotes_file(str(path))) == DOC["quotes"]
+    (tmp_path / "empty.json").write_text('{"quotes": [], "version": 1}')
+    assert list(iter_quotes_file(str(tmp_path / "empty.json"))) == []
+
+@pytest.mark.parametrize("text", ['{"quotes": [1, 2,]}', '{"quotes": [1, 2], }', '{"quotes": [1 2]}', '{"quotes": [1], "v": 1 "w": 2}'])
+def test_malformed_separators_are_rejected_like_json_load(tmp_path, tiny_chunks, text):
+    path = tmp_path / "batch.json"
+    path.write_text(text)
+    with pytest.raises(ValueError):
+        json.loads(text)
+    with pytest.raises(ValueError):
+        list(iter_quotes_file(str(path)))
+
+def texts(path):
+    with open(path, encoding="utf-8") as f:
+        return {q["text"]: q["id"] for q in json.load(f)["quotes"]}
+
+def test_streaming_merge_keeps_the_same_quotes(tmp_path, monkeypatch):
+    merge_quotes(BATCHES, str(tmp_path / "merged.json"))
+    # Small runs and fan-in so the external sort spills and merges in several passes
+    monkeypatch.setattr(quotes_merge, "MERGE_FAN_IN", 3)
+    merge_quotes_streaming(BATCHES, str(tmp_path / "streamed.json"), run_size=100)
+
+    merged, streamed = texts(tmp_path / "merged.json"), texts(tmp_path / "streamed.json")
+    assert len(merged) == 228 and streamed == merged
+    with open(tmp_path / "streamed.json", encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["metadata"]["total_quotes"] == 228
+    assert [q["id"] for q in data["quotes"]] == sorted(q["id"] for q in data["quotes"])
+    assert not [p for p in os.listdir(tmp_path) if p not in ("merged.json", "streamed.json")]
@@ -0,0 +1,29 @@
+import json
+from quotes_neardup import THRESHOLD, collapse, collapse_near_duplicates, find_clusters, jaccard, shingles
+
+KJV = "Trust in the Lord with all thine heart; and lean not unto thine own understanding."
+MODERN = "Trust in the LORD with all your heart, and lean not on your own understanding."
+# Same opening, different verse: similar, but below the default threshold
+PROVERBS_1_7 = "The fear of the Lord is the beginning of knowledge: but fools despise wisdom and instruction."
+PROVERBS_9_10 = "The fear of the Lord is the beginning of wisdom."
+
+def test_known_pairs_at_the_default_threshold():
+    near = jaccard(shingles(KJV), shingles(MODERN))
+    assert near >= THRESHOLD and find_clusters([KJV, MODERN]) == {0: [(1, round(near, 3))]}
+    assert jaccard(shingles(PROVERBS_9_10), shingles(PROVERBS_1_7)) < THRESHOLD
+    assert find_clusters([PROVERBS_9_10, PROVERBS_1_7]) == {}
+    # Case, punctuation and spacing alone never make quotes distinct
+    assert find_clusters([PROVERBS_9_10, "the fear of the LORD is the beginning of wisdom"]) == {0: [(1, 1.0)]}
+
+def test_collapse_keeps_the_earlier_quote(tmp_path):
+    quotes = [{"id": "modern", "text": MODERN}, {"id": "other", "text": PROVERBS_9_10}, {"id": "kjv", "text": KJV}]
+    assert [q["id"] for q in collapse_near_duplicates(quotes)] == ["modern", "other"]
+    assert [q["id"] for q in collapse_near_duplicates(quotes[::-1])] == ["kjv", "other"]
+
+    # Across files: argument order decides, and metadata counts follow
+    seed, batch = tmp_path / "seed.json", tmp_path / "batch.json"
+    seed.write_text(json.dumps([quotes[2]]))
+    batch.write_text(json.dumps({"metadata": {"total_quotes": 2}, "quotes": quotes[:2]}))
+    assert collapse([str(seed), str(batch)]) == 1
+    assert json.loads(seed.read_text()) == [quotes[2]]
+    assert json.loads(batch.read_text()) == {"metadata": {"total_quotes": 1}, "quotes": [quotes[1]]}
@@ -0,0 +1,40 @@
+import json
+from quotes_shard import ASSET_DIR, shard_quotes
+
+def quote(i, off_safe, faith_ok, tag):
+    return {"id": f"q{i}", "text": f"Quote number {i}.", "tags": [tag], "modes": {"off_safe": off_safe, "faith_ok": faith_ok}}
+
+def test_shards_manifest_and_unservable_quotes(tmp_path, capsys):
+    quotes = ([quote(i, True, True, "hope") for i in range(4)] + [quote(i, True, False, "focus") for i in range(4, 6)]
+              + [quote(i, False, True, "grace") for i in range(6, 9)] + [quote(9, False, False, "hope")])
+    master = tmp_path / "quotes.json"
+    master.write_text(json.dumps({"version": 1, "quotes": quotes}))
+    out = tmp_path / "assets" / "shards"
+    out.mkdir(parents=True)
+    (out / "quotes_none_000.json").write_text("{}")  # left over from an earlier build
+
+    shard_quotes(str(master), str(out), target_bytes=300)
+    assert "Skipping 1 quotes that are neither off_safe nor faith_ok" in capsys.readouterr().out
+
+    manifest = json.loads((tmp_path / "assets" / "manifest.json").read_text())  # next to output_dir
+    on_disk = sorted(p.name for p in out.glob("*.json"))
+    assert sorted(f.rsplit("/", 1)[1] for f in manifest["files"]) == on_disk
+    assert all(f.startswith(ASSET_DIR + "/") for f in manifest["files"])
+    assert "quotes_none_000.json" not in on_disk
+
+    # Every shard is listed under a mode, and each mode gets exactly the quotes it may show
+    listed = {f for m in manifest["modes"].values() for f in m["files"]}
+    assert listed == set(manifest["files"])
+    ids = {}
+    for mode, m in manifest["modes"].items():
+        ids[mode] = sorted(q["id"] for f in m["files"] for q in json.loads((out / f.rsplit("/", 1)[1]).read_text())["quotes"])
+    assert ids["off"] == [f"q{i}" for i in range(6)]
+    assert ids["faith"] == [f"q{i}" for i in (0, 1, 2, 3, 6, 7, 8)]
+    assert manifest["shard_count"] > 3  # the small target split partitions
+
+def test_explicit_manifest_path(tmp_path):
+    master = tmp_path / "quotes.json"
+    master.write_text(json.dumps({"quotes": [quote(0, True, True, "hope")]}))
+    shard_quotes(str(master), str(tmp_path / "shards"), manifest_path=str(tmp_path / "custom.json"))
+    assert json.loads((tmp_path / "custom.json").read_text())["shard_count"] == 1
+    assert not (tmp_path / "manifest.json").exists()
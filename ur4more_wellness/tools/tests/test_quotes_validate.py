@@ -0,0 +1,95 @@
+import copy, json
+import pytest
+import quotes_validate
+from quotes_validate import check_quotes_file, compile_schema, validate_quote
+
+QUOTE = {
+    "id": "marcus_aurelius_courage_001", "text": "Waste no more time arguing about what a good man should be. Be one.",
+    "author": "Marcus Aurelius", "work": "Meditations", "year_approx": 170, "source": "Public domain", "public_domain": True, "license": "public_domain",
+    "tags": ["courage"], "axis": "light", "modes": {"off_safe": True, "faith_ok": True},
+    "scripture_kjv": {"enabled": False}, "attribution": "Marcus Aurelius, Meditations", "checksum": "abc",
+}
+
+def legacy_errors(quote):
+    """The hand-written checks the compiled schema replaced"""
+    errors = []
+    for field in QUOTE:
+        if field not in quote:
+            errors.append(field)
+    if "text" in quote and len(quote["text"]) > 240:
+        errors.append("text")
+    if "modes" in quote:
+        modes = quote["modes"]
+        if not isinstance(modes, dict) or "off_safe" not in modes or "faith_ok" not in modes:
+            errors.append("modes")
+    if "scripture_kjv" in quote:
+        scripture = quote["scripture_kjv"]
+        if not isinstance(scripture, dict) or "enabled" not in scripture:
+            errors.append("scripture_kjv")
+        elif scripture.get("enabled") and len(scripture.get("text", "")) > 200:
+            errors.append("scripture_kjv")
+    if "public_domain" in quote and not quote["public_domain"]:
+        errors.append("public_domain")
+    if "year_approx" in quote:
+        year = quote["year_approx"]
+        if not isinstance(year, int) or year < 100 or year > 2024:
+            errors.append("year_approx")
+    return errors
+
+def changed(**fields):
+    quote = copy.deepcopy(QUOTE)
+    for key, value in fields.items():
+        if value is None:
+            del quote[key]
+        else:
+            quote[key] = value
+    return quote
+
+CASES = [
+    (QUOTE, []),
+    (changed(author=None, checksum=None), ["/author", "/checksum"]),
+    (changed(text="x" * 240), []),
+    (changed(text="x" * 241), ["/text"]),
+    (changed(modes={"off_safe": True}), ["/modes/faith_ok"]),
+    (changed(modes=[]), ["/modes"]),
+    (changed(scripture_kjv={}), ["/scripture_kjv/enabled"]),
+    (changed(scripture_kjv={"enabled": False, "text": "x" * 201}), []),
+    (changed(scripture_kjv={"enabled": True, "text": "x" * 200}), []),
+    (changed(scripture_kjv={"enabled": True, "text": "x" * 201}), ["/scripture_kjv/text"]),
+    (changed(public_domain=False), ["/public_domain"]),
+    (changed(year_approx="1850"), ["/year_approx"]),
+    (changed(year_approx=1850.0), ["/year_approx"]),
+    (changed(year_approx=99), ["/year_approx"]),
+    (changed(year_approx=2025), ["/year_approx"]),
+    (changed(year_approx=2024), []),
+]
+
+@pytest.mark.parametrize("quote,pointers", CASES)
+def test_compiled_schema_matches_the_legacy_checks(quote, pointers):
+    errors = validate_quote(quote, "/quotes/0")
+    assert [e["pointer"] for e in errors] == ["/quotes/0" + p for p in pointers]
+    assert bool(errors) == bool(legacy_errors(quote))
+
+def test_generated_source_has_no_dead_lines():
+    assert "pass" not in quotes_validate._check_quote.source.split()
+    assert compile_schema({})(1, "", []) is None
+
+def write(tmp_path, quotes):
+    path = tmp_path / "batch.json"
+    path.write_text(json.dumps({"version": 1, "quotes": quotes}), encoding="utf-8")
+    return str(path)
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_max_errors_stops_early(tmp_path, monkeypatch, stream):
+    if stream:
+        monkeypatch.setattr(quotes_validate, "STREAM_BYTES", 0)
+    path = write(tmp_path, [QUOTE] + [changed(public_domain=False)] * 10)
+    full = check_quotes_file(path)
+    assert len(full["errors"]) == 10 and full["quotes"] == 11 and not full["stopped_early"]
+
+    result = check_quotes_file(path, max_errors=3)
+    assert [e["pointer"] for e in result["errors"]] == ["/quotes/1/public_domain", "/quotes/2/public_domain", "/quotes/3/public_domain"]
+    assert result["stopped_early"] and result["quotes"] == 4 and not result["valid"]
+
+    assert check_quotes_file(write(tmp_path, [QUOTE] * 3), max_errors=1) == {
+        "file": path, "valid": True, "quotes": 3, "errors": [], "stopped_early": False}